@@ -79,7 +79,8 @@ def convert_message_to_response(message_data: dict) -> MessageResponse:
         timestamp=message_data["timestamp"].isoformat() if isinstance(message_data["timestamp"], datetime) else message_data["timestamp"],
         type=type_map.get(message_type_from_domain, MessageTypeEnum.CHAT),
         channel_id=message_data["channel_id"],
-        metadata=message_data.get("metadata", {})
+        metadata=message_data.get("metadata", {}),
+        seq=message_data.get("seq")
     )
 
 
@@ -236,14 +237,23 @@ async def get_channel_messages(
     channel_id: str,
     limit: int = 50,
     offset: int = 0,
+    before_seq: Optional[int] = None,
+    after_seq: Optional[int] = None,
     channel_service: ChannelService = Depends(get_channel_service)
 ) -> MessagesListResponse:
-    """Get messages from a channel"""
+    """
+    Get messages from a channel, newest first
+    
+    Page backwards with before_seq (the lowest seq already seen) or
+    catch up after a gap with after_seq (the highest seq already seen).
+    """
     try:
         result = await channel_service.get_channel_messages(
             channel_id=channel_id,
             limit=limit,
-            offset=offset
+            offset=offset,
+            before_seq=before_seq,
+            after_seq=after_seq
         )
         
         if not result:
@@ -254,7 +264,8 @@ async def get_channel_messages(
         return MessagesListResponse(
             messages=messages,
             total=result["total"],
-            has_more=result["has_more"]
+            has_more=result["has_more"],
+            latest_seq=result["latest_seq"]
         )
     except HTTPException:
         raise
@@ -83,5 +83,26 @@ async def detailed_health_check(
             "minion_count": len(minions),
             "active_channels": len(channels),
             "minion_stats": minion_stats
+        },
+        "scheduler": channel_service.scheduler.get_stats(),
+        "relevance": minion_service.get_relevance_stats(),
+        "llm": minion_service.llm_scheduler.get_stats(),
+        "emotional_policy": (
+            minion_service.policy_engine.get_stats()
+            if hasattr(minion_service.policy_engine, "get_stats") else None
+        ),
+        "messaging": {
+            "delivery": channel_service.comm_system.get_delivery_stats(),
+            "data_bus": channel_service.comm_system.data_exchange.get_stats(),
+            "rpc": channel_service.comm_system.rpc.get_stats(),
+            "events": channel_service.comm_system.events.get_stats(),
+            "transport": (
+                channel_service.comm_system.transport.get_stats()
+                if channel_service.comm_system.transport else None
+            ),
+            "safeguards": (
+                channel_service.safeguards.get_stats()
+                if channel_service.safeguards else None
+            )
         }
     }
\ No newline at end of file
@@ -381,6 +381,7 @@ class MessageResponse(BaseModel):
     timestamp: str
     type: MessageTypeEnum
     channel_id: Optional[str] = None
+    seq: Optional[int] = None  # Per-channel sequence number
 
 
 class HealthCheckResponse(BaseModel):
@@ -437,6 +438,7 @@ class MessagesListResponse(BaseModel):
     messages: List[MessageResponse]
     total: Optional[int] = None
     has_more: bool = False
+    latest_seq: Optional[int] = None  # Newest sequence number in the channel
 
 
 class TasksListResponse(BaseModel):
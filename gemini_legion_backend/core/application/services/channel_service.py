@@ -5,7 +5,7 @@ This service manages communication channels, message persistence, and real-time
 message delivery coordination between Minions.
 """
 
-from typing import List, Optional, Dict, Any, Set, Callable
+from typing import List, Optional, Dict, Any, Set, Callable, Tuple
 from datetime import datetime, timedelta
 import logging
 import asyncio
@@ -23,8 +23,15 @@ from ...domain import (
     ChannelRole
 )
 # Import ConversationalMessage if it's not already implicitly available or re-defined
-from ...infrastructure.messaging.communication_system import InterMinionCommunicationSystem, ConversationalMessage
+from ...infrastructure.messaging.communication_system import (
+    InterMinionCommunicationSystem,
+    ConversationalMessage,
+    new_message_id
+)
+from ...infrastructure.messaging.dedupe import RecentIdSet
+from ...infrastructure.messaging.safeguards import CommunicationSafeguards
 from ...infrastructure.persistence.repositories import ChannelRepository, MessageRepository
+from ...infrastructure.scheduling.scheduler import Scheduler
 # minion_service import might cause circular dependency if MinionService also imports ChannelService.
 # For now, assuming it's okay or handled by DI framework if types are only for hinting.
 # If MinionService is only used for type hinting here, forward reference might be better:
@@ -48,7 +55,9 @@ class ChannelService:
         channel_repository: ChannelRepository,
         message_repository: MessageRepository,
         comm_system: InterMinionCommunicationSystem,
-        minion_service: MinionService
+        minion_service: MinionService,
+        safeguards: Optional[CommunicationSafeguards] = None,
+        scheduler: Optional[Scheduler] = None
     ):
         """
         Initialize the Channel service
@@ -58,11 +67,14 @@ class ChannelService:
             message_repository: Repository for persisting messages
             comm_system: Communication system for real-time messaging
             minion_service: Service for interacting with Minions
+            safeguards: Safeguards enforcing each channel's max_message_rate
+            scheduler: Shared scheduler for background jobs (owns one if omitted)
         """
         self.channel_repo = channel_repository
         self.message_repo = message_repository
         self.comm_system = comm_system
         self.minion_service = minion_service
+        self.safeguards = safeguards
         
         # Active channels cache
         self.active_channels: Dict[str, Channel] = {}
@@ -70,21 +82,32 @@ class ChannelService:
         # Message subscribers for real-time updates
         self.channel_subscribers: Dict[str, Set[Callable]] = defaultdict(set)
         
-        # Background tasks
-        self._message_persist_task: Optional[asyncio.Task] = None
-        self._channel_cleanup_task: Optional[asyncio.Task] = None
+        # Background jobs
+        self.scheduler = scheduler or Scheduler()
+        self._owns_scheduler = scheduler is None
         
         # Message buffer for batched persistence
         self.message_buffer: List[Message] = []
+        self._flushing: List[Message] = []  # Taken from the buffer, not yet saved
         self._buffer_lock = asyncio.Lock()
+        
+        # Sequence counters for channels not in active_channels
+        self._orphan_sequences: Dict[str, int] = defaultdict(int)
+        
+        # A message reaches this service both from send_message and back
+        # through the comm system; recent IDs drop the second arrival
+        self._persisted_ids = RecentIdSet()
+        self._broadcast_ids = RecentIdSet()
     
     async def start(self):
         """Start the service and background tasks"""
         logger.info("Starting Channel Service...")
         
-        # Start background tasks
-        self._message_persist_task = asyncio.create_task(self._message_persist_loop())
-        self._channel_cleanup_task = asyncio.create_task(self._channel_cleanup_loop())
+        # Register background jobs
+        if self._owns_scheduler:
+            self.scheduler.start()
+        self.scheduler.every("channel.persist_messages", 5, self._flush_message_buffer)
+        self.scheduler.every("channel.cleanup", 3600, self._cleanup_inactive_channels)
         
         # Load active channels from repository
         await self._load_active_channels()
@@ -98,11 +121,10 @@ class ChannelService:
         """Stop the service and cleanup"""
         logger.info("Stopping Channel Service...")
         
-        # Cancel background tasks
-        if self._message_persist_task:
-            self._message_persist_task.cancel()
-        if self._channel_cleanup_task:
-            self._channel_cleanup_task.cancel()
+        # Cancel background jobs
+        self.scheduler.cancel_prefix("channel.")
+        if self._owns_scheduler:
+            await self.scheduler.stop()
         
         # Persist any buffered messages
         await self._flush_message_buffer()
@@ -167,9 +189,10 @@ class ChannelService:
             
             # Add to active channels
             self.active_channels[channel_id] = channel
+            self._apply_channel_rate_limit(channel)
             
             # Register with communication system (conceptually)
-            self.comm_system.create_channel(channel_id) # Informs comm_system channel exists
+            self.comm_system.create_channel(channel_id, channel_type) # Informs comm_system channel exists
             
             # CRITICAL: Subscribe the WebSocket broadcaster callback to this new channel
             self.comm_system.subscribe_to_channel(channel_id, self._websocket_broadcaster_callback)
@@ -347,9 +370,9 @@ class ChannelService:
             if channel.channel_type != ChannelType.PUBLIC:
                 raise ValueError(f"{sender_id} is not a member of {channel_id}")
         
-        # Create message
+        # Create message with its canonical ID
         message = Message(
-            message_id=f"{channel_id}_{datetime.now().timestamp()}",
+            message_id=new_message_id(),
             channel_id=channel_id,
             sender_id=sender_id,
             content=content,
@@ -360,19 +383,25 @@ class ChannelService:
         )
         
         # Add to buffer for persistence
-        async with self._buffer_lock:
-            self.message_buffer.append(message)
+        await self._buffer_message(message)
         
         # Update channel activity
         channel.last_activity = datetime.now()
         channel.message_count += 1
         
-        # Broadcast through communication system
+        # Claim the WebSocket broadcast before routing, so the broadcaster
+        # callback cannot push the routed copy (without seq) first
+        claimed = self._broadcast_ids.add(message.message_id)
+        
+        # Broadcast through communication system (same ID, so the
+        # broadcaster callback recognizes it as already handled)
         await self.comm_system.broadcast_message(
             channel_id,
             sender_id,
             content,
-            metadata
+            metadata,
+            message_id=message.message_id,
+            timestamp=message.timestamp
         )
         
         # Notify subscribers
@@ -381,10 +410,11 @@ class ChannelService:
         logger.debug(f"Message sent to {channel_id} by {sender_id}")
         
         message_dict = self._message_to_dict(message)
-        asyncio.create_task(connection_manager.broadcast_service_event(
-            "message_sent",
-            {"channel_id": channel_id, "message": message_dict}
-        ))
+        if claimed:
+            asyncio.create_task(connection_manager.broadcast_service_event(
+                "message_sent",
+                {"channel_id": channel_id, "message": message_dict}
+            ))
         return message_dict
     
     async def get_messages(
@@ -393,10 +423,16 @@ class ChannelService:
         limit: int = 50,
         before: Optional[datetime] = None,
         after: Optional[datetime] = None,
-        sender_filter: Optional[str] = None
+        sender_filter: Optional[str] = None,
+        offset: int = 0,
+        before_seq: Optional[int] = None,
+        after_seq: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
-        Get messages from a channel
+        Get messages from a channel, newest first
+        
+        Without timestamp or sender filters, pages are cut by sequence
+        number (see get_sequence_page).
         
         Args:
             channel_id: ID of the channel
@@ -404,14 +440,23 @@ class ChannelService:
             before: Get messages before this timestamp
             after: Get messages after this timestamp
             sender_filter: Filter by sender ID
+            offset: Number of messages to skip
+            before_seq: Get messages with a lower sequence number
+            after_seq: Get messages with a higher sequence number
             
         Returns:
             List of messages
         """
+        if not (before or after or sender_filter):
+            page, _ = await self.get_sequence_page(
+                channel_id, limit, offset, before_seq=before_seq, after_seq=after_seq
+            )
+            return [self._message_to_dict(m) for m in reversed(page)]
+        
         # Get from repository
         messages = await self.message_repo.get_channel_messages(
             channel_id,
-            limit=limit,
+            limit=limit + offset,
             before=before,
             after=after,
             sender_id=sender_filter
@@ -419,9 +464,10 @@ class ChannelService:
         
         # Include buffered messages
         async with self._buffer_lock:
+            persisted_ids = {m.message_id for m in messages}
             buffered = [
-                m for m in self.message_buffer
-                if m.channel_id == channel_id
+                m for m in self._unsaved_messages()
+                if m.channel_id == channel_id and m.message_id not in persisted_ids
             ]
             
             # Apply filters to buffered messages
@@ -436,11 +482,98 @@ class ChannelService:
         all_messages = messages + buffered
         all_messages.sort(key=lambda m: m.timestamp, reverse=True)
         
-        # Apply limit
-        all_messages = all_messages[:limit]
+        # Apply pagination
+        all_messages = all_messages[offset:offset + limit]
         
         return [self._message_to_dict(m) for m in all_messages]
     
+    async def get_sequence_page(
+        self,
+        channel_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        before_seq: Optional[int] = None,
+        after_seq: Optional[int] = None
+    ) -> Tuple[List[Message], bool]:
+        """
+        Get a page of messages by sequence number
+        
+        With after_seq the page holds the oldest messages after the
+        cursor (catching up); otherwise the newest messages before
+        before_seq, or the latest messages. Persisted messages are found
+        by binary search in the repository and merged with those still
+        waiting in the persistence buffer.
+        
+        Args:
+            channel_id: ID of the channel
+            limit: Maximum number of messages to return
+            offset: Messages to skip, starting at the cursor
+            before_seq: Only messages with a lower sequence number
+            after_seq: Only messages with a higher sequence number
+            
+        Returns:
+            (messages in ascending sequence order, whether more exist
+            beyond the page in the paging direction)
+        """
+        window = offset + limit + 1  # One extra to detect has_more
+        persisted = await self.message_repo.get_messages_by_sequence(
+            channel_id, limit=window, before_seq=before_seq, after_seq=after_seq
+        )
+        
+        async with self._buffer_lock:
+            persisted_ids = {m.message_id for m in persisted}
+            buffered = [
+                m for m in self._unsaved_messages()
+                if m.channel_id == channel_id and m.seq is not None
+                and m.message_id not in persisted_ids
+                and (before_seq is None or m.seq < before_seq)
+                and (after_seq is None or m.seq > after_seq)
+            ]
+        
+        merged = sorted(persisted + buffered, key=lambda m: m.seq if m.seq is not None else -1)
+        if after_seq is not None:
+            candidates = merged[offset:offset + limit + 1]
+            page = candidates[:limit]
+        else:
+            end = max(len(merged) - offset, 0)
+            candidates = merged[max(end - limit - 1, 0):end]
+            page = candidates[-limit:] if limit > 0 else []
+        
+        return page, len(candidates) > len(page)
+    
+    async def get_channel_messages(
+        self,
+        channel_id: str,
+        limit: int = 50,
+        offset: int = 0,
+        before_seq: Optional[int] = None,
+        after_seq: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a page of channel messages for the REST API
+        
+        Every message carries its sequence number, and latest_seq is the
+        channel's newest one, so a client can spot gaps and fetch only
+        what it missed with after_seq.
+        
+        Returns:
+            Dict with messages (newest first), total, has_more and
+            latest_seq, or None if the channel does not exist
+        """
+        channel = self.active_channels.get(channel_id)
+        if not channel:
+            return None
+        
+        page, has_more = await self.get_sequence_page(
+            channel_id, limit, offset, before_seq=before_seq, after_seq=after_seq
+        )
+        return {
+            "messages": [self._message_to_dict(m) for m in reversed(page)],
+            "total": channel.last_sequence,  # Every message gets one sequence number
+            "has_more": has_more,
+            "latest_seq": channel.last_sequence
+        }
+    
     async def get_channel(self, channel_id: str) -> Optional[Dict[str, Any]]:
         """Get channel details by ID"""
         channel = self.active_channels.get(channel_id)
@@ -522,6 +655,9 @@ class ChannelService:
             channel.description = updates["description"]
         if "metadata" in updates:
             channel.metadata.update(updates["metadata"])
+        if "max_message_rate" in updates:
+            channel.max_message_rate = int(updates["max_message_rate"])
+            self._apply_channel_rate_limit(channel)
         
         channel.last_activity = datetime.now()
         
@@ -582,6 +718,8 @@ class ChannelService:
         
         # Clean up communication system
         self.comm_system.delete_channel(channel_id)
+        if self.safeguards:
+            self.safeguards.forget_channel(channel_id)
         
         logger.info(f"Deleted channel {channel_id}")
         
@@ -628,18 +766,6 @@ class ChannelService:
         if callback in self.channel_subscribers[channel_id]:
             self.channel_subscribers[channel_id].remove(callback)
     
-    async def _message_persist_loop(self):
-        """Background task to persist buffered messages"""
-        while True:
-            try:
-                await asyncio.sleep(5)  # Persist every 5 seconds
-                await self._flush_message_buffer()
-                
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error in message persist loop: {e}")
-    
     async def _flush_message_buffer(self):
         """Flush message buffer to repository"""
         async with self._buffer_lock:
@@ -648,37 +774,57 @@ class ChannelService:
             
             messages_to_save = self.message_buffer.copy()
             self.message_buffer.clear()
+            self._flushing.extend(messages_to_save)
         
         # Batch save messages
-        for message in messages_to_save:
-            try:
-                await self.message_repo.save(message)
-            except Exception as e:
-                logger.error(f"Failed to persist message {message.message_id}: {e}")
+        try:
+            for message in messages_to_save:
+                try:
+                    await self.message_repo.save(message)
+                except Exception as e:
+                    self._persisted_ids.discard(message.message_id)
+                    logger.error(f"Failed to persist message {message.message_id}: {e}")
+        finally:
+            async with self._buffer_lock:
+                saved_ids = {m.message_id for m in messages_to_save}
+                self._flushing = [m for m in self._flushing if m.message_id not in saved_ids]
         
         logger.debug(f"Persisted {len(messages_to_save)} messages")
     
-    async def _channel_cleanup_loop(self):
-        """Background task to clean up inactive channels"""
-        while True:
-            try:
-                await asyncio.sleep(3600)  # Check every hour
-                
-                # Clean up empty direct message channels older than 7 days
-                cutoff = datetime.now() - timedelta(days=7)
-                
-                for channel_id, channel in list(self.active_channels.items()):
-                    if (channel.channel_type == ChannelType.DIRECT and
-                        channel.message_count == 0 and
-                        channel.created_at < cutoff):
-                        
-                        logger.info(f"Cleaning up empty DM channel {channel_id}")
-                        await self.delete_channel(channel_id, deleted_by="system")
+    async def _buffer_message(self, message: Message) -> bool:
+        """Assign the next sequence number and queue a message for persistence, once"""
+        async with self._buffer_lock:
+            if not self._persisted_ids.add(message.message_id):
+                return False
+            message.seq = self._next_sequence(message.channel_id)
+            self.message_buffer.append(message)
+            return True
+    
+    def _next_sequence(self, channel_id: str) -> int:
+        """Next per-channel sequence number (caller holds the buffer lock)"""
+        channel = self.active_channels.get(channel_id)
+        if channel is None:
+            self._orphan_sequences[channel_id] += 1
+            return self._orphan_sequences[channel_id]
+        channel.last_sequence += 1
+        return channel.last_sequence
+    
+    def _unsaved_messages(self) -> List[Message]:
+        """Messages not yet in the repository (caller holds the buffer lock)"""
+        return self._flushing + self.message_buffer
+    
+    async def _cleanup_inactive_channels(self):
+        """Scheduled job (hourly): clean up inactive channels"""
+        # Clean up empty direct message channels older than 7 days
+        cutoff = datetime.now() - timedelta(days=7)
+        
+        for channel_id, channel in list(self.active_channels.items()):
+            if (channel.channel_type == ChannelType.DIRECT and
+                channel.message_count == 0 and
+                channel.created_at < cutoff):
                 
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error in channel cleanup loop: {e}")
+                logger.info(f"Cleaning up empty DM channel {channel_id}")
+                await self.delete_channel(channel_id, deleted_by="system")
     
     async def _load_active_channels(self):
         """Load active channels from repository"""
@@ -687,10 +833,16 @@ class ChannelService:
             channels = await self.channel_repo.list_active()
             
             for channel in channels:
+                # The channel may have been saved before its last messages
+                channel.last_sequence = max(
+                    channel.last_sequence,
+                    await self.message_repo.get_latest_sequence(channel.channel_id)
+                )
                 self.active_channels[channel.channel_id] = channel
+                self._apply_channel_rate_limit(channel)
                 
                 # Register with communication system
-                self.comm_system.create_channel(channel.channel_id)
+                self.comm_system.create_channel(channel.channel_id, channel.channel_type.value)
                 
                 # Re-add members to communication system
                 for member in channel.members:
@@ -733,38 +885,57 @@ class ChannelService:
             if channel_config["channel_id"] not in self.active_channels:
                 await self.create_channel(**channel_config, creator="system")
     
+    def _routed_to_domain_message(self, routed_message: ConversationalMessage) -> Message:
+        """Domain Message for a routed ConversationalMessage, keeping its canonical ID"""
+        return Message(
+            message_id=routed_message.message_id,
+            channel_id=routed_message.channel,
+            sender_id=routed_message.sender,
+            content=routed_message.content,
+            message_type=MessageType.CHAT, # Defaulting to CHAT for inter-minion messages via this path.
+                                           # Could be enhanced if ConversationalMessage carries more type info.
+            timestamp=routed_message.timestamp,
+            metadata=routed_message.personality_hints or {}
+        )
+    
+    async def _persist_routed_message(self, routed_message: ConversationalMessage):
+        """
+        Ingress hook for MessageRouter. Persists every message routed from
+        this node to a known channel before it is queued for subscribers,
+        so a slow WebSocket subscription cannot lose chat history.
+        """
+        if routed_message.channel not in self.active_channels:
+            return
+        
+        # Messages sent through send_message were already persisted
+        domain_message = self._routed_to_domain_message(routed_message)
+        if not await self._buffer_message(domain_message):
+            return
+        logger.debug(f"ChannelService: Message from '{routed_message.sender}' in channel '{routed_message.channel}' queued for persistence at ingress.")
+        
+        # Push the persisted copy (with its sequence number) to WebSocket
+        # clients; the broadcaster subscription then skips it
+        if self._broadcast_ids.add(domain_message.message_id):
+            asyncio.create_task(connection_manager.broadcast_service_event(
+                "message_sent",
+                {"channel_id": routed_message.channel, "message": self._message_to_dict(domain_message)}
+            ))
+    
     async def _websocket_broadcaster_callback(self, routed_message: ConversationalMessage):
         """
         Callback for MessageRouter. Takes a routed ConversationalMessage,
         converts it to a dict, and broadcasts via WebSocket connection_manager.
+        
+        Only pushes to WebSocket clients; persistence happens at ingress
+        (_persist_routed_message), so this subscription may drop messages.
         """
         try:
-            logger.info(f"ChannelService: _websocket_broadcaster_callback received message for channel '{routed_message.channel}' from '{routed_message.sender}'.")
-
-            # 1. Convert ConversationalMessage to a domain Message object for persistence.
-            # Ensure a unique message_id. Using a combination of elements for now.
-            # The persistence layer (message_repo.save) should handle potential duplicates if message_id is a primary key.
-            domain_message = Message(
-                message_id=f"msg_{routed_message.channel}_{routed_message.timestamp.timestamp()}_{routed_message.sender}_{abs(hash(routed_message.content))%10000}",
-                channel_id=routed_message.channel,
-                sender_id=routed_message.sender,
-                content=routed_message.content,
-                message_type=MessageType.CHAT, # Defaulting to CHAT for inter-minion messages via this path.
-                                               # Could be enhanced if ConversationalMessage carries more type info.
-                timestamp=routed_message.timestamp,
-                metadata=routed_message.personality_hints or {}
-            )
-
-            # 2. Add the domain Message to the buffer for persistence.
-            async with self._buffer_lock:
-                self.message_buffer.append(domain_message)
-            logger.info(f"ChannelService: Message from '{routed_message.sender}' in channel '{routed_message.channel}' queued for persistence via _websocket_broadcaster_callback.")
-
-            # 3. Convert the domain Message to a dictionary suitable for WebSocket broadcast
-            #    using the existing _message_to_dict helper.
-            message_dict_for_ws = self._message_to_dict(domain_message)
+            # Messages routed from this node were already broadcast at
+            # ingress; the same canonical ID comes back here
+            if not self._broadcast_ids.add(routed_message.message_id):
+                return
             
-            # 4. Broadcast the message via WebSocket.
+            message_dict_for_ws = self._message_to_dict(self._routed_to_domain_message(routed_message))
             await connection_manager.broadcast_service_event(
                 "message_sent",
                 {"channel_id": routed_message.channel, "message": message_dict_for_ws}
@@ -780,6 +951,10 @@ class ChannelService:
         """
         logger.info("ChannelService: Setting up _websocket_broadcaster_callback for active and future channels.")
         
+        # Persist every locally routed message at ingress, independently
+        # of the (droppable) WebSocket subscriptions below
+        self.comm_system.add_ingress_hook(self._persist_routed_message)
+        
         # Define a wrapper that MessageRouter can call (it expects a non-async callable that takes one arg)
         # No, MessageRouter can handle async callbacks because it uses asyncio.gather.
         
@@ -841,6 +1016,11 @@ class ChannelService:
             except Exception as e:
                 logger.error(f"Error in channel subscriber callback: {e}")
     
+    def _apply_channel_rate_limit(self, channel: Channel):
+        """Have the safeguards enforce a channel's max_message_rate"""
+        if self.safeguards:
+            self.safeguards.set_channel_rate_limit(channel.channel_id, channel.max_message_rate)
+    
     def _has_permission(
         self,
         channel: Channel,
@@ -879,6 +1059,7 @@ class ChannelService:
             "created_by": channel.created_by,
             "member_count": len(channel.members),
             "message_count": channel.message_count,
+            "last_sequence": channel.last_sequence,
             "last_activity": channel.last_activity.isoformat() if channel.last_activity else None,
             "members": [
                 {
@@ -902,6 +1083,7 @@ class ChannelService:
             "timestamp": message.timestamp.isoformat(),
             "metadata": message.metadata,
             "parent_message_id": message.parent_message_id,
+            "seq": message.seq,
             "reactions": message.reactions,
             "edited": message.edited,
             "edited_at": message.edited_at.isoformat() if message.edited_at else None
@@ -5,7 +5,7 @@ This service mediates between the API endpoints and the domain logic,
 handling use cases related to minion lifecycle, state management, and operations.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 import logging
 import asyncio
@@ -23,11 +23,15 @@ from ...domain import (
 )
 from ....api.rest.schemas import UpdateMinionPersonaRequest # For type hinting
 from ...infrastructure.adk.agents import MinionAgent, MinionFactory
-from ...infrastructure.adk.emotional_engine import EmotionalEngine
+from ...infrastructure.adk.emotional_engine import EmotionalEngine, EmotionalPolicyEngine
+from ...infrastructure.adk.emotional_kernel import LegionEmotionalKernel
+from ...infrastructure.adk.relationship_matrix import LegionRelationshipMatrix
+from ...infrastructure.adk.llm_scheduler import LLMLane, LLMScheduler, llm_lane
 from ...infrastructure.adk.memory_system import MinionMemorySystem
 from ...infrastructure.messaging.communication_system import InterMinionCommunicationSystem
 from ...infrastructure.messaging.safeguards import CommunicationSafeguards
 from ...infrastructure.persistence.repositories import MinionRepository
+from ...infrastructure.scheduling.scheduler import Scheduler
 
 from ....api.websocket.connection_manager import connection_manager
 
@@ -35,6 +39,17 @@ from ....api.websocket.connection_manager import connection_manager
 logger = logging.getLogger(__name__)
 
 
+def _flatten_snapshot(snapshot: Dict[str, Any], prefix: Tuple[str, ...] = ()) -> Dict[Tuple[str, ...], Any]:
+    """Flatten nested snapshot dicts into {key path: leaf value}"""
+    values: Dict[Tuple[str, ...], Any] = {}
+    for key, value in snapshot.items():
+        if isinstance(value, dict) and value:
+            values.update(_flatten_snapshot(value, prefix + (key,)))
+        else:
+            values[prefix + (key,)] = value
+    return values
+
+
 class MinionService:
     # Define status enum strings directly for mapping, avoiding API layer import
     # These should align with api.rest.schemas.MinionStatusEnum
@@ -56,7 +71,10 @@ class MinionService:
         self,
         minion_repository: MinionRepository,
         comm_system: InterMinionCommunicationSystem,
-        safeguards: CommunicationSafeguards
+        safeguards: CommunicationSafeguards,
+        scheduler: Optional[Scheduler] = None,
+        llm_scheduler: Optional[LLMScheduler] = None,
+        policy_engine: Optional[EmotionalPolicyEngine] = None
     ):
         """
         Initialize the Minion service
@@ -65,28 +83,57 @@ class MinionService:
             minion_repository: Repository for persisting minion state
             comm_system: Communication system for inter-minion messaging
             safeguards: Communication safeguards for preventing loops
+            scheduler: Shared scheduler for background jobs (owns one if omitted)
+            llm_scheduler: Legion-wide LLM call scheduler (creates one if omitted)
+            policy_engine: Emotional policy engine shared by all Minions (e.g. a
+                BatchedEmotionalPolicyEngine); Minions use heuristics without one
         """
         self.repository = minion_repository
         self.comm_system = comm_system
         self.safeguards = safeguards
+        self.scheduler = scheduler or Scheduler()
+        self._owns_scheduler = scheduler is None
+        self.llm_scheduler = llm_scheduler or LLMScheduler()
+        self.policy_engine = policy_engine
         
-        # Factory for creating agents
-        self.minion_factory = MinionFactory(comm_system, safeguards)
+        # Factory for creating agents (agents schedule their memory consolidation
+        # and submit their LLM calls to the shared LLM scheduler)
+        self.minion_factory = MinionFactory(
+            comm_system,
+            safeguards,
+            policy_engine=policy_engine,
+            scheduler=self.scheduler,
+            llm_scheduler=self.llm_scheduler
+        )
         
         # Registry of active agents
         self.active_agents: Dict[str, MinionAgent] = {}
         
-        # Background tasks
-        self._state_sync_task: Optional[asyncio.Task] = None
-        self._health_check_task: Optional[asyncio.Task] = None
+        # Legion-wide vectorized emotional state
+        self.emotional_kernel = LegionEmotionalKernel()
+        self.emotional_tick_interval = 60
+        
+        # Legion-wide sparse opinion matrix
+        self.relationship_matrix = LegionRelationshipMatrix()
+        
+        # Delta-encoded emotional sync: last state version persisted and
+        # (version, flattened snapshot) broadcast per minion, and how many
+        # deltas go between keyframes
+        self._persisted_versions: Dict[str, int] = {}
+        self._broadcast_snapshots: Dict[str, Tuple[int, Dict[Tuple[str, ...], Any]]] = {}
+        self._deltas_since_keyframe: Dict[str, int] = {}
+        self.emotional_keyframe_interval = 20
     
     async def start(self):
         """Start the service and background tasks"""
         logger.info("Starting Minion Service...")
         
-        # Start background tasks
-        self._state_sync_task = asyncio.create_task(self._state_sync_loop())
-        self._health_check_task = asyncio.create_task(self._health_check_loop())
+        # Register background jobs
+        if self._owns_scheduler:
+            self.scheduler.start()
+        self.scheduler.every("minion.state_sync", 30, self._sync_states)
+        self.scheduler.every("minion.health_check", 60, self._check_health)
+        self.scheduler.every("minion.emotional_tick", self.emotional_tick_interval, self._emotional_tick)
         
         # Load existing minions from repository
         await self._load_existing_minions()
@@ -97,15 +144,15 @@ class MinionService:
         """Stop the service and cleanup"""
         logger.info("Stopping Minion Service...")
         
-        # Cancel background tasks
-        if self._state_sync_task:
-            self._state_sync_task.cancel()
-        if self._health_check_task:
-            self._health_check_task.cancel()
+        # Cancel background jobs
+        self.scheduler.cancel_prefix("minion.")
         
         # Shutdown all active agents
         await self.minion_factory.shutdown_all()
         
+        if self._owns_scheduler:
+            await self.scheduler.stop()
+        
         logger.info("Minion Service stopped")
     
     async def spawn_minion(
@@ -157,6 +204,7 @@ class MinionService:
             
             # Register as active
             self.active_agents[minion_id] = agent
+            self._attach_legion_state(agent)
             
             # Get the domain minion object
             minion = agent.minion if hasattr(agent, 'minion') else None
@@ -309,7 +357,8 @@ class MinionService:
         if not agent:
             raise ValueError(f"Minion {minion_id} is not active")
         
-        state = await agent.emotional_engine.get_current_state()
+        # Decay since the last update is folded in on read
+        state = agent.emotional_engine.get_current_state()
         
         return {
             "mood": asdict(state.mood),
@@ -347,7 +396,7 @@ class MinionService:
             raise ValueError(f"Minion {minion_id} is not active")
         
         # Apply updates through emotional engine
-        current_state = await agent.emotional_engine.get_current_state()
+        current_state = agent.emotional_engine.get_current_state()
         
         # Update mood if provided
         if "mood" in updates:
@@ -365,10 +414,8 @@ class MinionService:
         
         updated_state_dict = await self.get_emotional_state(minion_id)
 
-        asyncio.create_task(connection_manager.broadcast_service_event(
-            "minion_emotional_state_updated",
-            {"minion_id": minion_id, "emotional_state": updated_state_dict}
-        ))
+        event_name, event_data = self._emotional_sync_event(minion_id, agent)
+        asyncio.create_task(connection_manager.broadcast_service_event(event_name, event_data))
 
         return updated_state_dict
 
@@ -448,6 +495,7 @@ class MinionService:
             
             if minion_id in self.active_agents: # Ensure it's removed if shutdown failed to do so
                 del self.active_agents[minion_id]
+            self._detach_legion_state(minion_id)
 
             try:
                 # Re-create the agent using the factory with all parameters from the updated minion_domain_object's persona.
@@ -476,6 +524,7 @@ class MinionService:
                 # For now, we assume the factory correctly reinitializes based on the persona and the agent
                 # will then sync its state if needed. The new_agent_instance.minion will be the one created by the factory.
                 self.active_agents[minion_id] = new_agent_instance
+                self._attach_legion_state(new_agent_instance)
                 logger.info(f"New agent for {minion_id} created and activated with updated persona.")
 
             except Exception as e:
@@ -520,7 +569,8 @@ class MinionService:
         self,
         minion_id: str,
         command: str,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        lane: LLMLane = LLMLane.COMMANDER
     ) -> Dict[str, Any]:
         """
         Send a command to a minion and get response
@@ -529,6 +579,7 @@ class MinionService:
             minion_id: ID of minion to command
             command: Command text
             context: Optional context for the command
+            lane: LLM scheduling lane (Commander unless sent on behalf of a task)
             
         Returns:
             Response from the minion
@@ -538,7 +589,8 @@ class MinionService:
             raise ValueError(f"Minion {minion_id} is not active")
         
         # Process through agent's think method
-        response = await agent.think(command, context)
+        with llm_lane(lane):
+            response = await agent.think(command, context)
         
         return {
             "minion_id": minion_id,
@@ -620,6 +672,9 @@ class MinionService:
         
         # Remove from active registry
         del self.active_agents[minion_id]
+        self._detach_legion_state(minion_id)
+        if self.safeguards:
+            self.safeguards.forget_minion(minion_id)
         
         # Update status in repository
         minion = await self.repository.get_by_id(minion_id)
@@ -649,52 +704,166 @@ class MinionService:
             "timestamp": datetime.now().isoformat()
         }
     
-    async def _state_sync_loop(self):
-        """Background task to sync minion states to repository"""
-        while True:
+    def get_relevance_stats(self) -> Dict[str, Any]:
+        """
+        Relevance gate metrics across the active Minions
+        
+        Returns:
+            Legion-wide checked/skipped counts and skip rate, plus per-Minion stats
+        """
+        per_minion = {}
+        for minion_id, agent in self.active_agents.items():
+            capability = getattr(agent, 'communication_capability', None)
+            if capability and capability.relevance_gate:
+                per_minion[minion_id] = capability.relevance_gate.get_stats()
+        
+        checked = sum(stats["checked"] for stats in per_minion.values())
+        skipped = sum(stats["skipped"] for stats in per_minion.values())
+        return {
+            "checked": checked,
+            "skipped": skipped,
+            "skip_rate": skipped / checked if checked else 0.0,
+            "minions": per_minion
+        }
+    
+    def _emotional_sync_event(self, minion_id: str, agent: MinionAgent) -> Tuple[str, Dict[str, Any]]:
+        """
+        Build a compact emotional state event for websocket subscribers
+        
+        A keyframe ("minion_emotional_state_updated") carries the full
+        nested snapshot the UI renders. In between, a delta
+        ("minion_emotional_state_delta") carries only the snapshot values
+        that changed since the last broadcast, as [path, value] pairs to
+        apply on top of base_version. A keyframe goes out every
+        emotional_keyframe_interval events, on the first broadcast, and
+        whenever something was removed from the snapshot.
+        
+        Returns:
+            Tuple of (event name, event data)
+        """
+        snapshot = agent.emotional_engine.get_current_state().to_snapshot()
+        values = _flatten_snapshot(snapshot)
+        previous = self._broadcast_snapshots.get(minion_id)
+        self._broadcast_snapshots[minion_id] = (snapshot["state_version"], values)
+        
+        deltas = self._deltas_since_keyframe.get(minion_id, 0)
+        if (previous is None
+                or deltas >= self.emotional_keyframe_interval
+                or previous[1].keys() - values.keys()):
+            self._deltas_since_keyframe[minion_id] = 0
+            return "minion_emotional_state_updated", {
+                "minion_id": minion_id,
+                "encoding": "keyframe",
+                "state_version": snapshot["state_version"],
+                "emotional_state": snapshot
+            }
+        
+        base_version, base_values = previous
+        self._deltas_since_keyframe[minion_id] = deltas + 1
+        return "minion_emotional_state_delta", {
+            "minion_id": minion_id,
+            "encoding": "delta",
+            "base_version": base_version,
+            "state_version": snapshot["state_version"],
+            "changes": [
+                [list(path), value] for path, value in values.items()
+                if path not in base_values or base_values[path] != value
+            ]
+        }
+    
+    def _attach_legion_state(self, agent: MinionAgent):
+        """Register an agent with the Legion-wide emotional structures"""
+        engine = agent.emotional_engine
+        self.emotional_kernel.register(engine)
+        
+        self.relationship_matrix.load_state(agent.minion.minion_id, engine.get_current_state())
+        engine.relationship_matrix = self.relationship_matrix
+        if getattr(agent, 'communication_capability', None):
+            agent.communication_capability.autonomous_engine.relationship_matrix = self.relationship_matrix
+        
+        if self.comm_system:
+            self.comm_system.register_rpc_handler(
+                agent.minion.minion_id, "get_status", self._rpc_status_handler(agent)
+            )
+    
+    def _rpc_status_handler(self, agent: MinionAgent):
+        """RPC handler answering status queries for one minion"""
+        async def get_status(payload: Dict[str, Any]) -> Dict[str, Any]:
+            mood, energy, stress = agent.emotional_engine.get_current_state().decayed_values()
+            return {
+                "minion_id": agent.minion.minion_id,
+                "status": self._map_domain_status_to_api_enum_string(agent.minion.status),
+                "energy_level": energy,
+                "stress_level": stress,
+                "mood": asdict(mood)
+            }
+        return get_status
+    
+    def _detach_legion_state(self, minion_id: str):
+        """Remove a minion from the Legion-wide emotional structures"""
+        if self.comm_system:
+            self.comm_system.unregister_rpc_handlers(minion_id)
+            self.comm_system.forget_minion(minion_id)
+        self.emotional_kernel.unregister(minion_id)
+        self.relationship_matrix.remove_holder(minion_id)
+        self._forget_emotional_sync(minion_id)
+    
+    def _forget_emotional_sync(self, minion_id: str):
+        """Drop sync bookkeeping so the next sync starts from a keyframe"""
+        self._persisted_versions.pop(minion_id, None)
+        self._broadcast_snapshots.pop(minion_id, None)
+        self._deltas_since_keyframe.pop(minion_id, None)
+    
+    async def _sync_emotional_state(self, minion_id: str, agent: MinionAgent):
+        """Persist a minion's emotional changes since the last sync"""
+        engine = agent.emotional_engine
+        version = engine.state_version
+        persisted_version = self._persisted_versions.get(minion_id)
+        
+        if persisted_version == version:
+            return  # Clean, nothing to write
+        
+        changes = engine.changes_since(persisted_version) if persisted_version is not None else None
+        
+        if changes is None or EmotionalState.is_structural_change(changes):
+            # Keyframe: full save of the minion
+            agent.minion.emotional_state = engine.get_current_state()
+            await self.repository.save(agent.minion)
+        elif not await self.repository.update_emotional_state(minion_id, changes, version):
+            await self.repository.save(agent.minion)
+        
+        self._persisted_versions[minion_id] = version
+    
+    async def _sync_states(self):
+        """Scheduled job (every 30 seconds): sync dirty minion states to repository"""
+        for minion_id, agent in list(self.active_agents.items()):
             try:
-                # Sync every 30 seconds
-                await asyncio.sleep(30)
-                
-                for minion_id, agent in self.active_agents.items():
-                    try:
-                        if hasattr(agent, 'minion'):
-                            # Update emotional state
-                            agent.minion.emotional_state = agent.emotional_engine.get_current_state() # Removed await
-                            
-                            # Save to repository
-                            await self.repository.save(agent.minion)
-                            
-                    except Exception as e:
-                        logger.error(f"Failed to sync state for {minion_id}: {e}")
-                
-            except asyncio.CancelledError:
-                break
+                if hasattr(agent, 'minion'):
+                    await self._sync_emotional_state(minion_id, agent)
+                    
             except Exception as e:
-                logger.error(f"Error in state sync loop: {e}")
+                logger.error(f"Failed to sync state for {minion_id}: {e}")
     
-    async def _health_check_loop(self):
-        """Background task to check minion health"""
-        while True:
+    async def _check_health(self):
+        """Scheduled job (every 60 seconds): check minion health"""
+        for minion_id, agent in list(self.active_agents.items()):
             try:
-                # Check every 60 seconds
-                await asyncio.sleep(60)
+                # Simple health check - ensure agent is responsive
+                # In a real system, this would be more sophisticated
+                if hasattr(agent, 'emotional_engine'):
+                    agent.emotional_engine.get_current_state() # Removed await
                 
-                for minion_id, agent in list(self.active_agents.items()):
-                    try:
-                        # Simple health check - ensure agent is responsive
-                        # In a real system, this would be more sophisticated
-                        if hasattr(agent, 'emotional_engine'):
-                            agent.emotional_engine.get_current_state() # Removed await
-                        
-                    except Exception as e:
-                        logger.error(f"Health check failed for {minion_id}: {e}")
-                        # Could implement auto-restart logic here
-                
-            except asyncio.CancelledError:
-                break
             except Exception as e:
-                logger.error(f"Error in health check loop: {e}")
+                logger.error(f"Health check failed for {minion_id}: {e}")
+                # Could implement auto-restart logic here
+    
+    async def _emotional_tick(self):
+        """Scheduled job: run the legion-wide emotional kernel"""
+        result = self.emotional_kernel.tick()
+        logger.debug(
+            f"Emotional tick: {result.ticked} minions, {result.regulated} regulated, "
+            f"{result.written_back} updated in {result.duration_ms:.2f}ms"
+        )
     
     async def _load_existing_minions(self):
         """Load and reactivate existing minions from repository"""
@@ -725,6 +894,7 @@ class MinionService:
                     
                     # Register as active
                     self.active_agents[minion.minion_id] = agent
+                    self._attach_legion_state(agent)
                     
                     logger.info(f"Reactivated minion {minion.minion_id}")
                     
@@ -775,15 +945,20 @@ class MinionService:
             # Not including minion_id here as it's at the top level of the Minion object
         }
 
+        # Report mood, energy and stress with decay applied up to now
+        decayed = None
+        if minion.emotional_state and hasattr(minion.emotional_state, 'decayed_values'):
+            decayed = minion.emotional_state.decayed_values()
+
         return {
             "minion_id": minion.minion_id,
             "persona": persona_dict, # Nested persona object
             "status": mapped_status, # Use the mapped string enum
             "creation_date": minion.creation_date.isoformat(),
             "emotional_state": {
-                "mood": asdict(m.mood) if (m := minion.emotional_state) and hasattr(m, 'mood') and is_dataclass(m.mood) else (getattr(m, 'mood', None) if (m := minion.emotional_state) else None),
-                "energy_level": m.energy_level if (m := minion.emotional_state) and hasattr(m, 'energy_level') else 0.8,
-                "stress_level": m.stress_level if (m := minion.emotional_state) and hasattr(m, 'stress_level') else 0.2,
+                "mood": asdict(decayed[0]) if decayed else (asdict(m.mood) if (m := minion.emotional_state) and hasattr(m, 'mood') and is_dataclass(m.mood) else (getattr(m, 'mood', None) if (m := minion.emotional_state) else None)),
+                "energy_level": decayed[1] if decayed else (m.energy_level if (m := minion.emotional_state) and hasattr(m, 'energy_level') else 0.8),
+                "stress_level": decayed[2] if decayed else (m.stress_level if (m := minion.emotional_state) and hasattr(m, 'stress_level') else 0.2),
                 "opinion_scores": {
                     entity_id: asdict(score) if is_dataclass(score) else score
                     for entity_id, score in m.opinion_scores.items()
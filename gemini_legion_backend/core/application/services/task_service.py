@@ -23,6 +23,8 @@ from ...domain import (
     TaskAssignment
 )
 from ...infrastructure.persistence.repositories import TaskRepository
+from ...infrastructure.scheduling.scheduler import Scheduler
+from ...infrastructure.adk.llm_scheduler import LLMLane
 from .minion_service import MinionService
 
 
@@ -48,7 +50,8 @@ class TaskService:
     def __init__(
         self,
         task_repository: TaskRepository,
-        minion_service: MinionService
+        minion_service: MinionService,
+        scheduler: Optional[Scheduler] = None
     ):
         """
         Initialize the Task service
@@ -56,13 +59,15 @@ class TaskService:
         Args:
             task_repository: Repository for persisting task state
             minion_service: Service for interacting with Minions
+            scheduler: Shared scheduler for background jobs (owns one if omitted)
         """
         self.repository = task_repository
         self.minion_service = minion_service
         
         # Active task monitoring
         self.active_tasks: Dict[str, Task] = {}
-        self._monitor_task: Optional[asyncio.Task] = None
+        self.scheduler = scheduler or Scheduler()
+        self._owns_scheduler = scheduler is None
         
         # Task execution queues
         self.task_queue: asyncio.Queue = asyncio.Queue()
@@ -73,7 +78,9 @@ class TaskService:
         logger.info("Starting Task Service...")
         
         # Start task monitoring
-        self._monitor_task = asyncio.create_task(self._task_monitor_loop())
+        if self._owns_scheduler:
+            self.scheduler.start()
+        self.scheduler.every("task.monitor", 10, self._monitor_tasks)
         
         # Load active tasks from repository
         await self._load_active_tasks()
@@ -84,9 +91,10 @@ class TaskService:
         """Stop the service and cleanup"""
         logger.info("Stopping Task Service...")
         
-        # Cancel monitoring task
-        if self._monitor_task:
-            self._monitor_task.cancel()
+        # Cancel monitoring job
+        self.scheduler.cancel_prefix("task.")
+        if self._owns_scheduler:
+            await self.scheduler.stop()
         
         # Save all active tasks
         for task in self.active_tasks.values():
@@ -216,7 +224,8 @@ class TaskService:
         
         response = await self.minion_service.send_command(
             taskmaster["minion_id"],
-            decomposition_prompt
+            decomposition_prompt,
+            lane=LLMLane.TASK
         )
         
         # Parse decomposition response
@@ -406,7 +415,8 @@ class TaskService:
         response = await self.minion_service.send_command(
             task.assigned_to,
             execution_command,
-            context={"task_id": task_id}
+            context={"task_id": task_id},
+            lane=LLMLane.TASK
         )
         
         # Add to execution log
@@ -561,47 +571,38 @@ class TaskService:
         
         return task
     
-    async def _task_monitor_loop(self):
-        """Background task to monitor task execution"""
-        while True:
+    async def _monitor_tasks(self):
+        """Scheduled job (every 10 seconds): monitor task execution"""
+        for task_id, task in list(self.active_tasks.items()):
             try:
-                await asyncio.sleep(10)  # Check every 10 seconds
-                
-                for task_id, task in list(self.active_tasks.items()):
-                    try:
-                        # Check task health
-                        if task.status == TaskStatus.IN_PROGRESS:
-                            # Check if minion is still working
-                            if task.assigned_to:
-                                minion = await self.minion_service.get_minion(task.assigned_to)
-                                if not minion or minion["status"] != "active":
-                                    # Minion went offline, reassign
-                                    logger.warning(f"Minion {task.assigned_to} offline, reassigning task {task_id}")
-                                    await self.auto_assign_task(task_id)
-                            
-                            # Check for timeout
-                            if task.started_at:
-                                elapsed = (datetime.now() - task.started_at).total_seconds()
-                                if elapsed > 3600:  # 1 hour timeout
-                                    logger.warning(f"Task {task_id} timed out")
-                                    task.status = TaskStatus.FAILED
-                                    task.error = "Task execution timed out"
-                                    await self.repository.save(task)
-                        
-                        # Remove completed tasks from active after 5 minutes
-                        if task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED]:
-                            if task.completed_at:
-                                elapsed = (datetime.now() - task.completed_at).total_seconds()
-                                if elapsed > 300:  # 5 minutes
-                                    del self.active_tasks[task_id]
+                # Check task health
+                if task.status == TaskStatus.IN_PROGRESS:
+                    # Check if minion is still working
+                    if task.assigned_to:
+                        minion = await self.minion_service.get_minion(task.assigned_to)
+                        if not minion or minion["status"] != "active":
+                            # Minion went offline, reassign
+                            logger.warning(f"Minion {task.assigned_to} offline, reassigning task {task_id}")
+                            await self.auto_assign_task(task_id)
                     
-                    except Exception as e:
-                        logger.error(f"Error monitoring task {task_id}: {e}")
+                    # Check for timeout
+                    if task.started_at:
+                        elapsed = (datetime.now() - task.started_at).total_seconds()
+                        if elapsed > 3600:  # 1 hour timeout
+                            logger.warning(f"Task {task_id} timed out")
+                            task.status = TaskStatus.FAILED
+                            task.error = "Task execution timed out"
+                            await self.repository.save(task)
                 
-            except asyncio.CancelledError:
-                break
+                # Remove completed tasks from active after 5 minutes
+                if task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED]:
+                    if task.completed_at:
+                        elapsed = (datetime.now() - task.completed_at).total_seconds()
+                        if elapsed > 300:  # 5 minutes
+                            del self.active_tasks[task_id]
+            
             except Exception as e:
-                logger.error(f"Error in task monitor loop: {e}")
+                logger.error(f"Error monitoring task {task_id}: {e}")
     
     async def _load_active_tasks(self):
         """Load active tasks from repository"""
@@ -690,7 +691,8 @@ class TaskService:
         await self.minion_service.send_command(
             minion_id,
             notification,
-            context={"task_assignment": task.task_id}
+            context={"task_assignment": task.task_id},
+            lane=LLMLane.TASK
         )
     
     async def _check_dependencies_met(self, task: Task) -> bool:
@@ -7,8 +7,11 @@ with all their dependencies properly configured.
 
 from typing import Optional
 import logging
+import os
 from pathlib import Path
 
+from google.adk.agents import LlmAgent
+
 from .infrastructure.persistence.repositories.memory import (
     ChannelRepositoryMemory,
     MessageRepositoryMemory,
@@ -16,7 +19,13 @@ from .infrastructure.persistence.repositories.memory import (
     TaskRepositoryMemory
 )
 from .infrastructure.messaging.communication_system import InterMinionCommunicationSystem
+from .infrastructure.messaging.transport import create_transport
 from .infrastructure.messaging.safeguards import CommunicationSafeguards
+from .infrastructure.scheduling.scheduler import Scheduler
+from .infrastructure.adk.llm_scheduler import LLMScheduler
+from .infrastructure.adk.emotional_policy_batcher import BatchedEmotionalPolicyEngine
+from .infrastructure.adk.agent_runner import AgentRunner
+from .domain import MinionPersona
 from .application.services import (
     MinionService,
     TaskService,
@@ -43,8 +52,25 @@ class ServiceContainer:
         self.message_repository = MessageRepositoryMemory()
         
         # Infrastructure
-        self.comm_system = InterMinionCommunicationSystem()
+        self.comm_system = InterMinionCommunicationSystem(
+            transport=create_transport(os.getenv("LEGION_TRANSPORT_URL"))
+        )
         self.safeguards = CommunicationSafeguards()
+        self.scheduler = Scheduler()  # Owns every periodic background job
+        self.llm_scheduler = LLMScheduler(  # Admits every LLM call in the Legion
+            max_concurrency=int(os.getenv("LEGION_LLM_CONCURRENCY", "4")),
+            tokens_per_minute=int(os.getenv("LEGION_LLM_TOKENS_PER_MINUTE", "0")) or None
+        )
+        
+        # One batching, caching emotional policy engine for every Minion
+        self.policy_engine = BatchedEmotionalPolicyEngine(
+            AgentRunner(LlmAgent(
+                name="emotional_policy",
+                model=MinionPersona.model_name,
+                instruction="You analyze interactions and propose structured emotional state updates as JSON."
+            )),
+            llm_scheduler=self.llm_scheduler
+        )
         
         # Services
         self.minion_service: Optional[MinionService] = None
@@ -67,17 +93,24 @@ class ServiceContainer:
         self.config["diary_storage_path"].mkdir(parents=True, exist_ok=True)
         self.config["memory_storage_path"].mkdir(parents=True, exist_ok=True)
         
+        await self.comm_system.start()
+        self.scheduler.start()
+        
         # Initialize MinionService
         self.minion_service = MinionService(
             minion_repository=self.minion_repository,
             comm_system=self.comm_system,
-            safeguards=self.safeguards
+            safeguards=self.safeguards,
+            scheduler=self.scheduler,
+            llm_scheduler=self.llm_scheduler,
+            policy_engine=self.policy_engine
         )
         
         # Initialize TaskService
         self.task_service = TaskService(
             task_repository=self.task_repository,
-            minion_service=self.minion_service
+            minion_service=self.minion_service,
+            scheduler=self.scheduler
         )
         
         # Initialize ChannelService
@@ -85,7 +118,9 @@ class ServiceContainer:
             channel_repository=self.channel_repository,
             message_repository=self.message_repository,
             comm_system=self.comm_system,
-            minion_service=self.minion_service
+            minion_service=self.minion_service,
+            safeguards=self.safeguards,
+            scheduler=self.scheduler
         )
         
         # Start services
@@ -109,6 +144,9 @@ class ServiceContainer:
         if self.minion_service:
             await self.minion_service.stop()
         
+        await self.scheduler.stop()
+        await self.comm_system.close()
+        
         logger.info("Service container shutdown complete")
     
     def get_minion_service(self) -> MinionService:
@@ -18,7 +18,10 @@ from .emotional_state import (
 )
 from .memory import MemoryType, Experience, WorkingMemory
 from .minion import MinionPersona, MinionStatus, Minion
-from .communication import MessageType, Message, Channel, ChannelType, ChannelRole, ChannelMember
+from .communication import (
+    MessageType, Message, Channel, ChannelType, ChannelRole, ChannelMember,
+    COMMANDER_IDS, is_commander
+)
 from .task import (
     TaskStatus, TaskPriority, Task, TaskResult,
     TaskOrchestrationStrategy, SubTask, TaskDecomposition, TaskAssignment
@@ -61,6 +64,8 @@ __all__ = [
     'ChannelType',
     'ChannelRole',
     'ChannelMember',
+    'COMMANDER_IDS',
+    'is_commander',
     
     # Task
     'TaskStatus',
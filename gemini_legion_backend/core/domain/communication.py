@@ -10,6 +10,16 @@ from typing import List, Optional, Dict, Any
 from enum import Enum
 
 
+# Sender IDs the Commander uses: the frontend sends COMMANDER_PRIME
+# (chatStore.ts COMMANDER_ID), tasks and the REST API default to "commander"
+COMMANDER_IDS = frozenset({"COMMANDER_PRIME", "commander"})
+
+
+def is_commander(sender_id: str) -> bool:
+    """Whether a sender ID belongs to the Commander"""
+    return sender_id in COMMANDER_IDS
+
+
 class MessageType(Enum):
     """Types of messages in the system"""
     CHAT = "chat"
@@ -52,6 +62,7 @@ class Message:
     timestamp: datetime = field(default_factory=datetime.now)
     metadata: Dict[str, Any] = field(default_factory=dict)
     parent_message_id: Optional[str] = None  # For threaded conversations
+    seq: Optional[int] = None  # Per-channel sequence number, assigned at ingress
     
     # Additional fields for rich messaging
     reactions: Dict[str, List[str]] = field(default_factory=dict)  # emoji -> list of reactor IDs
@@ -73,6 +84,7 @@ class Channel:
     # Channel statistics
     member_count: int = 0
     message_count: int = 0
+    last_sequence: int = 0  # Highest message sequence number assigned
     last_activity: Optional[datetime] = None
     
     # Channel settings
@@ -4,11 +4,17 @@ Core Emotional State for Minions
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any # Added Any
-from dataclasses import asdict # Added asdict
+from typing import Dict, List, Optional, Any, Tuple # Added Any
+from dataclasses import asdict, fields, replace # Added asdict
+from copy import deepcopy
 from .base_types import EntityType
 from .mood import MoodVector
 from .opinion import OpinionScore, OpinionEvent # Added OpinionEvent
+
+
+# Emotional decay defaults (mirror settings.emotional_decay_rate)
+DEFAULT_EMOTIONAL_DECAY_RATE = 0.95  # Fraction of distance to baseline kept per interval
+EMOTIONAL_DECAY_INTERVAL_SECONDS = 60.0
     
 
 @dataclass
@@ -111,6 +117,66 @@ class EmotionalState:
     last_updated: datetime = field(default_factory=datetime.now)
     state_version: int = 1
     
+    # Decay toward baseline, computed in closed form when read.
+    # mood, energy_level and stress_level hold the values as of
+    # decay_reference_time; a decay_rate of 1.0 disables decay.
+    baseline_mood: Optional[MoodVector] = None
+    baseline_energy: Optional[float] = None
+    baseline_stress: Optional[float] = None
+    decay_rate: float = DEFAULT_EMOTIONAL_DECAY_RATE
+    decay_reference_time: datetime = field(default_factory=datetime.now)
+    
+    def __post_init__(self):
+        """Default the decay baseline to the initial state"""
+        if self.baseline_mood is None:
+            self.baseline_mood = replace(self.mood)
+        if self.baseline_energy is None:
+            self.baseline_energy = self.energy_level
+        if self.baseline_stress is None:
+            self.baseline_stress = self.stress_level
+    
+    def decay_factor(self, at: Optional[datetime] = None) -> float:
+        """Fraction of the distance to baseline remaining at a given time"""
+        if self.decay_rate >= 1.0:
+            return 1.0
+        
+        elapsed = ((at or datetime.now()) - self.decay_reference_time).total_seconds()
+        if elapsed <= 0:
+            return 1.0
+        
+        return self.decay_rate ** (elapsed / EMOTIONAL_DECAY_INTERVAL_SECONDS)
+    
+    def decayed_values(self, at: Optional[datetime] = None) -> Tuple[MoodVector, float, float]:
+        """
+        Compute mood, energy and stress at a given time
+        
+        Returns:
+            Tuple of (mood, energy_level, stress_level) after decay
+        """
+        factor = self.decay_factor(at)
+        if factor == 1.0:
+            return self.mood, self.energy_level, self.stress_level
+        
+        def toward_baseline(value: float, baseline: float) -> float:
+            return baseline + (value - baseline) * factor
+        
+        mood = MoodVector(**{
+            dim.name: toward_baseline(getattr(self.mood, dim.name), getattr(self.baseline_mood, dim.name))
+            for dim in fields(MoodVector)
+        })
+        
+        return (
+            mood,
+            toward_baseline(self.energy_level, self.baseline_energy),
+            toward_baseline(self.stress_level, self.baseline_stress)
+        )
+    
+    def materialize_decay(self, at: Optional[datetime] = None):
+        """Fold the decay elapsed so far into the stored values"""
+        at = at or datetime.now()
+        self.mood, self.energy_level, self.stress_level = self.decayed_values(at)
+        self.decay_reference_time = at
+    
     def get_opinion_of(self, entity_id: str) -> OpinionScore:
         """Get opinion score for an entity, creating if necessary"""
         if entity_id not in self.opinion_scores:
@@ -122,20 +188,99 @@ class EmotionalState:
             )
         return self.opinion_scores[entity_id]
     
+    # Field-map keys that summarize structure (reflections, goals, opinion
+    # event histories) rather than carry values; a delta touching one of
+    # these cannot be applied field by field and needs a full save.
+    STRUCTURAL_FIELD_SUFFIXES = ("reflection_count", "goal_count", "event_count")
+    
+    def to_field_map(self) -> Dict[str, Any]:
+        """
+        Flatten the tracked emotional fields into JSON-ready dotted keys
+        
+        Mood, energy and stress are the stored (undecayed) values. The
+        map also carries the decay parameters (baselines, rate and
+        reference time), so a receiver holding the whole map can compute
+        the decayed values with decayed_values.
+        """
+        field_map: Dict[str, Any] = {
+            f"mood.{dim.name}": getattr(self.mood, dim.name) for dim in fields(MoodVector)
+        }
+        field_map["energy_level"] = self.energy_level
+        field_map["stress_level"] = self.stress_level
+        field_map.update({
+            f"baseline_mood.{dim.name}": getattr(self.baseline_mood, dim.name) for dim in fields(MoodVector)
+        })
+        field_map["baseline_energy"] = self.baseline_energy
+        field_map["baseline_stress"] = self.baseline_stress
+        field_map["decay_rate"] = self.decay_rate
+        field_map["decay_reference_time"] = self.decay_reference_time.isoformat()
+        field_map["last_updated"] = self.last_updated.isoformat()
+        for section in ("response_tendency", "conversation_style"):
+            modifiers = getattr(self, section)
+            for modifier in fields(modifiers):
+                value = getattr(modifiers, modifier.name)
+                field_map[f"{section}.{modifier.name}"] = list(value) if isinstance(value, list) else value
+        field_map["reflection_count"] = len(self.self_reflection_notes)
+        field_map["goal_count"] = len(self.goal_priorities)
+        
+        for entity_id, score in self.opinion_scores.items():
+            if not isinstance(score, OpinionScore):
+                continue
+            prefix = f"opinion.{entity_id}."
+            field_map[prefix + "trust"] = score.trust
+            field_map[prefix + "respect"] = score.respect
+            field_map[prefix + "affection"] = score.affection
+            field_map[prefix + "interaction_count"] = score.interaction_count
+            field_map[prefix + "event_count"] = len(score.notable_events)
+        
+        return field_map
+    
+    @classmethod
+    def is_structural_change(cls, changes: Dict[str, Any]) -> bool:
+        """Whether a field-map delta needs a full save to be persisted"""
+        return any(key.endswith(cls.STRUCTURAL_FIELD_SUFFIXES) for key in changes)
+    
+    def apply_field_map(self, changes: Dict[str, Any]):
+        """
+        Apply a (partial) field map produced by to_field_map
+        
+        Structural summary keys are ignored; a None value removes an opinion.
+        """
+        for key, value in changes.items():
+            section, _, name = key.partition(".")
+            
+            if section in ("mood", "baseline_mood", "response_tendency", "conversation_style"):
+                setattr(getattr(self, section), name, list(value) if isinstance(value, list) else value)
+            elif section == "opinion":
+                entity_id, _, metric = name.rpartition(".")
+                if value is None:
+                    self.opinion_scores.pop(entity_id, None)
+                elif metric in ("trust", "respect", "affection", "interaction_count"):
+                    setattr(self.get_opinion_of(entity_id), metric, value)
+            elif key in ("energy_level", "stress_level", "baseline_energy", "baseline_stress", "decay_rate"):
+                setattr(self, key, value)
+            elif key in ("decay_reference_time", "last_updated"):
+                setattr(self, key, datetime.fromisoformat(value))
+    
+    def copy(self) -> 'EmotionalState':
+        """Create an independent copy of this state"""
+        return deepcopy(self)
+    
     def to_snapshot(self) -> dict:
         """Create a serializable snapshot of the emotional state"""
+        mood, energy_level, stress_level = self.decayed_values()
         return {
             "minion_id": self.minion_id,
             "mood": {
-                "valence": self.mood.valence,
-                "arousal": self.mood.arousal,
-                "dominance": self.mood.dominance,
-                "curiosity": self.mood.curiosity,
-                "creativity": self.mood.creativity,
-                "sociability": self.mood.sociability
+                "valence": mood.valence,
+                "arousal": mood.arousal,
+                "dominance": mood.dominance,
+                "curiosity": mood.curiosity,
+                "creativity": mood.creativity,
+                "sociability": mood.sociability
             },
-            "energy_level": self.energy_level,
-            "stress_level": self.stress_level,
+            "energy_level": energy_level,
+            "stress_level": stress_level,
             "opinion_scores": {
                 entity_id: {
                     "entity_type": score.entity_type.value if score.entity_type else None, # Assuming EntityType is an Enum
@@ -155,6 +300,7 @@ class EmotionalState:
     
     def apply_stress(self, stress_delta: float):
         """Apply stress change and propagate effects"""
+        self.materialize_decay()
         self.stress_level = max(0.0, min(1.0, self.stress_level + stress_delta))
         
         # Stress affects mood
@@ -0,0 +1,83 @@
+"""
+Agent Runner
+
+Runs an ADK agent on a single prompt and returns its final text, for
+callers (such as the emotional policy engine) that only need a
+prompt-in, text-out LLM call rather than a conversation.
+"""
+
+from typing import Any, Optional
+import inspect
+import logging
+
+from google.adk.agents import BaseAgent
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+
+logger = logging.getLogger(__name__)
+
+
+async def _resolve(value: Any) -> Any:
+    """Await session-service results that are coroutines in newer ADK releases"""
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+class AgentRunner:
+    """
+    Prompt-to-text adapter around an ADK agent
+
+    Every call runs in a fresh in-memory session that is deleted
+    afterwards, so prompts stay independent and sessions do not
+    accumulate.
+    """
+
+    def __init__(
+        self,
+        agent: BaseAgent,
+        app_name: str = "gemini_legion",
+        user_id: str = "legion",
+        runner: Optional[Any] = None
+    ):
+        """
+        Initialize the adapter
+
+        Args:
+            agent: Agent answering the prompts
+            app_name: ADK application name of the sessions
+            user_id: ADK user the sessions belong to
+            runner: Runner to use (defaults to an InMemoryRunner for the agent)
+        """
+        self.agent = agent
+        self.app_name = app_name
+        self.user_id = user_id
+        self.runner = runner or InMemoryRunner(agent=agent, app_name=app_name)
+
+    async def think(self, prompt: str) -> str:
+        """Run the agent on a prompt and return its final response text"""
+        sessions = self.runner.session_service
+        session = await _resolve(sessions.create_session(app_name=self.app_name, user_id=self.user_id))
+        message = types.Content(role="user", parts=[types.Part(text=prompt)])
+
+        text = ""
+        try:
+            async for event in self.runner.run_async(
+                user_id=self.user_id,
+                session_id=session.id,
+                new_message=message
+            ):
+                if event.is_final_response() and event.content and event.content.parts:
+                    text = "".join(part.text or "" for part in event.content.parts)
+        finally:
+            try:
+                await _resolve(sessions.delete_session(
+                    app_name=self.app_name,
+                    user_id=self.user_id,
+                    session_id=session.id
+                ))
+            except Exception as e:
+                logger.debug(f"Could not delete session {session.id}: {e}")
+
+        return text
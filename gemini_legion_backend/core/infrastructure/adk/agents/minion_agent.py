@@ -5,9 +5,10 @@ This module implements the ADK-based MinionAgent that leverages
 the architectural design for personality-driven AI agents.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, ClassVar
 from datetime import datetime
 import asyncio
+import functools
 import logging
 
 from google.adk.agents import LlmAgent
@@ -23,6 +24,8 @@ from ....domain import (
 from ..emotional_engine import EmotionalEngine
 from ..tools.communication_capability import CommunicationCapability
 from ..memory_system import MinionMemorySystem
+from ..llm_scheduler import LLMLane, LLMScheduler, llm_lane
+from ...messaging.lexicon import DEFAULT_LEXICON
 
 
 logger = logging.getLogger(__name__)
@@ -43,6 +46,9 @@ class MinionAgent(LlmAgent):
     memory systems, and personality-driven interactions.
     """
     
+    # Seconds between memory consolidations
+    MEMORY_CONSOLIDATION_INTERVAL: ClassVar[int] = 1800
+    
     def __init__(
         self,
         minion_id: str,
@@ -52,6 +58,8 @@ class MinionAgent(LlmAgent):
         communication_capability: Optional[CommunicationCapability] = None,
         tools: Optional[List[Any]] = None,
         minion: Optional[Any] = None,  # Domain Minion object
+        scheduler: Optional[Any] = None,  # Shared Scheduler for background jobs
+        llm_scheduler: Optional[LLMScheduler] = None,
         **kwargs
     ):
         """
@@ -64,6 +72,10 @@ class MinionAgent(LlmAgent):
             memory_system: Memory system for the Minion
             communication_capability: Optional communication capability suite
             tools: List of tools available to this Minion
+            scheduler: Optional Scheduler running memory consolidation
+                (without one the Minion runs its own consolidation loop)
+            llm_scheduler: Optional Legion-wide LLM scheduler admitting this
+                Minion's LLM calls (without one calls are issued directly)
             **kwargs: Additional arguments for LlmAgent
         """
         # Build rich instruction set from persona and emotional state
@@ -112,10 +124,21 @@ class MinionAgent(LlmAgent):
         else:
             self._message_processor_task = None
         
-        # Start memory consolidation task
-        self._memory_consolidation_task = asyncio.create_task(
-            self._memory_consolidation_loop()
-        )
+        self._llm_scheduler = llm_scheduler
+        
+        # Schedule memory consolidation
+        self._scheduler = scheduler
+        if scheduler is not None:
+            scheduler.every(
+                self._consolidation_job_name,
+                self.MEMORY_CONSOLIDATION_INTERVAL,
+                self.consolidate_memory
+            )
+            self._memory_consolidation_task = None
+        else:
+            self._memory_consolidation_task = asyncio.create_task(
+                self._memory_consolidation_loop()
+            )
 
         # Initialize a lock for synchronizing access to agent's state
         self._state_lock = asyncio.Lock()
@@ -228,15 +251,19 @@ class MinionAgent(LlmAgent):
         working_memories = relevant_memories.get('working', [])
         
         # Get current emotional state
-        emotional_state = await self.emotional_engine.get_current_state()
+        emotional_state = self.emotional_engine.get_current_state()
         
         # Enhance context with memories and emotional state
         enhanced_context = self._enhance_context(
             context, relevant_memories, emotional_state
         )
         
-        # Let ADK handle the actual LLM interaction
-        response = await super().think(message, enhanced_context)
+        # Let ADK handle the actual LLM interaction, admitted by the LLM scheduler
+        llm_call = functools.partial(super().think, message, enhanced_context)
+        if self._llm_scheduler is not None:
+            response = await self._llm_scheduler.submit(llm_call, self.minion_id, message)
+        else:
+            response = await llm_call()
         
         # Post-process: analyze emotional impact
         emotional_impact = await self._analyze_emotional_impact(message, response)
@@ -352,20 +379,17 @@ class MinionAgent(LlmAgent):
         
         This is a simplified version - could be enhanced with sentiment analysis
         """
-        # Simple heuristic for now
-        positive_indicators = ['praise', 'good job', 'excellent', 'perfect', 'love it', 'fuck yea']
-        negative_indicators = ['disappointed', 'wrong', 'failed', 'bad', 'incorrect']
-        
-        message_lower = user_message.lower()
+        # Simple heuristic for now: one lexicon pass over the message
+        analysis = DEFAULT_LEXICON.analyze(user_message)
         
-        positive_count = sum(1 for ind in positive_indicators if ind in message_lower)
-        negative_count = sum(1 for ind in negative_indicators if ind in message_lower)
+        positive_count = analysis.hit_count("positive")
+        negative_count = analysis.hit_count("negative")
         
         # Calculate impact (-1.0 to 1.0)
         if positive_count > negative_count:
-            return min(1.0, positive_count * 0.3)
+            return min(1.0, analysis.score("positive"))
         elif negative_count > positive_count:
-            return max(-1.0, -negative_count * 0.3)
+            return max(-1.0, -analysis.score("negative"))
         else:
             return 0.0
     
@@ -448,22 +472,20 @@ class MinionAgent(LlmAgent):
         """
         Background task to process incoming messages
         
-        This runs continuously while the Minion is active,
-        checking for and responding to messages.
+        This runs continuously while the Minion is active, sleeping
+        until a message arrives and then responding to it.
         """
         logger.info(f"Starting message processor for {self.minion_id}")
         
         while True:
             try:
-                # Process any queued messages
-                if self.communication_capability:
-                    responses = await self.communication_capability.process_message_queue(self)
-                    
-                    if responses:
-                        logger.debug(f"{self.minion_id} generated {len(responses)} responses")
+                # Block until messages are queued (no wakeups while idle)
+                await self.communication_capability.wait_for_messages()
                 
-                # Sleep to avoid busy-waiting
-                await asyncio.sleep(2)
+                responses = await self.communication_capability.process_message_queue(self)
+                
+                if responses:
+                    logger.debug(f"{self.minion_id} generated {len(responses)} responses")
                 
             except asyncio.CancelledError:
                 logger.info(f"Message processor for {self.minion_id} cancelled")
@@ -472,27 +494,33 @@ class MinionAgent(LlmAgent):
                 logger.error(f"Error in message processor for {self.minion_id}: {e}")
                 await asyncio.sleep(5)  # Back off on error
     
-    async def _memory_consolidation_loop(self):
+    @property
+    def _consolidation_job_name(self) -> str:
+        return f"minion.memory_consolidation.{self.minion_id}"
+    
+    async def consolidate_memory(self):
         """
-        Background task for periodic memory consolidation
+        Consolidate and transfer memories between layers
         
-        Runs less frequently than message processing to consolidate
-        and transfer memories between layers.
+        Runs every MEMORY_CONSOLIDATION_INTERVAL seconds, from the shared
+        scheduler when there is one.
         """
+        logger.debug(f"Running memory consolidation for {self.minion_id}")
+        await self.memory_system.consolidate()
+        
+        # Log memory stats
+        stats = self.memory_system.get_memory_stats()
+        logger.info(f"Memory stats for {self.minion_id}: {stats}")
+    
+    async def _memory_consolidation_loop(self):
+        """Background task for periodic memory consolidation (no scheduler)"""
         logger.info(f"Starting memory consolidation for {self.minion_id}")
         
         while True:
             try:
                 # Wait for consolidation interval (every 30 minutes)
-                await asyncio.sleep(1800)
-                
-                # Run consolidation
-                logger.debug(f"Running memory consolidation for {self.minion_id}")
-                await self.memory_system.consolidate()
-                
-                # Log memory stats
-                stats = self.memory_system.get_memory_stats()
-                logger.info(f"Memory stats for {self.minion_id}: {stats}")
+                await asyncio.sleep(self.MEMORY_CONSOLIDATION_INTERVAL)
+                await self.consolidate_memory()
                 
             except asyncio.CancelledError:
                 logger.info(f"Memory consolidation for {self.minion_id} cancelled")
@@ -511,7 +539,8 @@ class MinionAgent(LlmAgent):
         if not self.communication_capability:
             return
         
-        result = await self.communication_capability.autonomous_tool.execute(context)
+        with llm_lane(LLMLane.AUTONOMOUS):
+            result = await self.communication_capability.autonomous_tool.execute(context)
         
         if result.get("should_communicate"):
             logger.info(
@@ -529,8 +558,10 @@ class MinionAgent(LlmAgent):
             except asyncio.CancelledError:
                 pass
         
-        # Cancel memory consolidation task
-        if hasattr(self, '_memory_consolidation_task'):
+        # Cancel memory consolidation
+        if getattr(self, '_scheduler', None) is not None:
+            self._scheduler.cancel(self._consolidation_job_name)
+        if getattr(self, '_memory_consolidation_task', None):
             self._memory_consolidation_task.cancel()
             try:
                 await self._memory_consolidation_task
@@ -11,10 +11,11 @@ from datetime import datetime
 from pathlib import Path
 
 from .minion_agent import MinionAgent
-from ..emotional_engine import EmotionalEngine
+from ..emotional_engine import EmotionalEngine, EmotionalPolicyEngine
 from ..tools.communication_capability import CommunicationCapability
 from ..tools.tool_integration import get_tool_manager
 from ..memory_system import MinionMemorySystem
+from ..llm_scheduler import LLMScheduler
 from ....domain import (
     Minion,
     MinionPersona,
@@ -25,6 +26,7 @@ from ....domain import (
 )
 from ...messaging.communication_system import InterMinionCommunicationSystem
 from ...messaging.safeguards import CommunicationSafeguards
+from ...scheduling.scheduler import Scheduler
 
 
 logger = logging.getLogger(__name__)
@@ -43,7 +45,10 @@ class MinionFactory:
         comm_system: Optional[InterMinionCommunicationSystem] = None,
         safeguards: Optional[CommunicationSafeguards] = None,
         tool_config: Optional[Dict[str, Any]] = None,
-        memory_storage_path: Optional[str] = None
+        memory_storage_path: Optional[str] = None,
+        policy_engine: Optional[EmotionalPolicyEngine] = None,
+        scheduler: Optional[Scheduler] = None,
+        llm_scheduler: Optional[LLMScheduler] = None
     ):
         """
         Initialize the factory with shared infrastructure
@@ -53,9 +58,17 @@ class MinionFactory:
             safeguards: Shared communication safeguards
             tool_config: Configuration for tool integration
             memory_storage_path: Base path for storing Minion memories
+            policy_engine: Optional emotional policy engine shared by all
+                Minions (e.g. a BatchedEmotionalPolicyEngine)
+            scheduler: Shared scheduler running each Minion's memory
+                consolidation (Minions run their own loop without one)
+            llm_scheduler: Shared scheduler admitting every Minion's LLM calls
         """
         self.comm_system = comm_system
         self.safeguards = safeguards
+        self.policy_engine = policy_engine
+        self.scheduler = scheduler
+        self.llm_scheduler = llm_scheduler
         self._minion_registry: Dict[str, MinionAgent] = {}
         self.memory_storage_path = memory_storage_path or "/tmp/gemini_legion/memories"
         
@@ -119,7 +132,7 @@ class MinionFactory:
         )
         
         # Create emotional engine
-        emotional_engine = EmotionalEngine(minion)
+        emotional_engine = EmotionalEngine(minion, policy_engine=self.policy_engine)
         
         # Create memory system
         memory_system = MinionMemorySystem(
@@ -151,6 +164,8 @@ class MinionFactory:
             communication_capability=communication_capability,
             tools=tools,
             minion=minion,
+            scheduler=self.scheduler,
+            llm_scheduler=self.llm_scheduler,
             **kwargs
         )
         
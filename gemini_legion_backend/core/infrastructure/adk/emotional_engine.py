@@ -5,9 +5,10 @@ Translates LLM outputs to emotional state changes, moving beyond
 diary parsing to structured state management.
 """
 
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, List, Tuple, Deque
 from dataclasses import dataclass
 from datetime import datetime
+from collections import deque
 import asyncio
 import logging
 import json
@@ -27,6 +28,7 @@ from ...domain import (
     OpinionScore,
     EntityType
 )
+from .llm_scheduler import LLMLane, LLMScheduler
 
 
 logger = logging.getLogger(__name__)
@@ -159,6 +161,46 @@ class EmotionalStateValidator:
         return max(-max_abs, min(max_abs, value))
 
 
+def heuristic_emotional_update(interaction_event: Dict[str, Any]) -> EmotionalStateUpdate:
+    """
+    Simple heuristic-based emotional update
+    
+    Used when no policy engine is configured, and as the fallback
+    when LLM-based policy evaluation is unavailable.
+    """
+    update = EmotionalStateUpdate()
+    
+    emotional_impact = interaction_event.get('emotional_impact', 0.0)
+    
+    if abs(emotional_impact) > 0.1:
+        # Mood changes
+        update.mood_delta = MoodVector(
+            valence=emotional_impact * 0.2,
+            arousal=abs(emotional_impact) * 0.1,
+            dominance=0.0,
+            curiosity=0.05 if emotional_impact > 0 else -0.05,
+            creativity=0.0,
+            sociability=0.1 if emotional_impact > 0 else -0.05
+        )
+        
+        # Energy and stress
+        if emotional_impact > 0.5:
+            update.energy_delta = 0.1
+            update.stress_delta = -0.05
+        elif emotional_impact < -0.5:
+            update.energy_delta = -0.05
+            update.stress_delta = 0.1
+        
+        # Opinion changes
+        update.opinion_updates["commander"] = {
+            "trust": emotional_impact * 5,
+            "respect": emotional_impact * 3,
+            "affection": emotional_impact * 4
+        }
+    
+    return update
+
+
 class EmotionalPolicyEngine:
     """
     Translates LLM outputs to emotional state changes
@@ -167,16 +209,27 @@ class EmotionalPolicyEngine:
     and propose structured emotional updates.
     """
     
-    def __init__(self, llm_agent: LlmAgent):
+    def __init__(self, llm_agent: LlmAgent, llm_scheduler: Optional[LLMScheduler] = None):
         """
         Initialize with an LLM agent
         
         Args:
-            llm_agent: The LLM agent to use for emotional analysis
+            llm_agent: The LLM agent to use for emotional analysis (any object
+                with an async think(prompt) -> str, e.g. an AgentRunner)
+            llm_scheduler: Optional Legion-wide scheduler admitting the analysis calls
         """
         self.llm_agent = llm_agent
+        self.llm_scheduler = llm_scheduler
         self.state_validator = EmotionalStateValidator()
     
+    async def _ask(self, prompt: str, minion_id: str, lane: Optional[LLMLane] = None) -> str:
+        """Issue an analysis call, through the LLM scheduler when there is one"""
+        if self.llm_scheduler is None:
+            return await self.llm_agent.think(prompt)
+        return await self.llm_scheduler.submit(
+            lambda: self.llm_agent.think(prompt), minion_id, prompt, lane
+        )
+    
     async def process_interaction(
         self,
         current_state: EmotionalState,
@@ -200,7 +253,7 @@ class EmotionalPolicyEngine:
         )
         
         # Get LLM analysis
-        response = await self.llm_agent.think(prompt)
+        response = await self._ask(prompt, current_state.minion_id)
         
         # Parse response to structured update
         proposed_update = self._parse_emotional_update(response)
@@ -266,44 +319,48 @@ Provide a structured emotional update in JSON format:
             
             data = json.loads(json_str)
             
-            update = EmotionalStateUpdate()
-            
-            # Parse mood changes
-            if "mood_changes" in data:
-                mood_changes = data["mood_changes"]
-                update.mood_delta = MoodVector(
-                    valence=mood_changes.get("valence", 0.0),
-                    arousal=mood_changes.get("arousal", 0.0),
-                    dominance=0.0,  # Keep dominance stable
-                    curiosity=mood_changes.get("curiosity", 0.0),
-                    creativity=0.0,  # Keep creativity stable
-                    sociability=0.0  # Keep sociability stable
-                )
-            
-            # Parse scalar changes
-            update.energy_delta = data.get("energy_change", 0.0)
-            update.stress_delta = data.get("stress_change", 0.0)
-            
-            # Parse opinion changes
-            if "opinion_changes" in data:
-                for entity_id, changes in data["opinion_changes"].items():
-                    update.opinion_updates[entity_id] = changes
-            
-            # Parse reflection
-            if "reflection" in data and data["reflection"]:
-                update.new_reflection = ReflectionEntry(
-                    timestamp=datetime.now(),
-                    topic="Interaction Analysis",
-                    insight=data["reflection"],
-                    confidence=0.8
-                )
-            
-            return update
+            return self._update_from_data(data)
             
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             logger.warning(f"Failed to parse LLM emotional update: {e}")
             # Return minimal update on parse failure
             return EmotionalStateUpdate()
+    
+    def _update_from_data(self, data: Dict[str, Any]) -> EmotionalStateUpdate:
+        """Build a structured update from parsed LLM JSON"""
+        update = EmotionalStateUpdate()
+            
+        # Parse mood changes
+        if "mood_changes" in data:
+            mood_changes = data["mood_changes"]
+            update.mood_delta = MoodVector(
+                valence=mood_changes.get("valence", 0.0),
+                arousal=mood_changes.get("arousal", 0.0),
+                dominance=0.0,  # Keep dominance stable
+                curiosity=mood_changes.get("curiosity", 0.0),
+                creativity=0.0,  # Keep creativity stable
+                sociability=0.0  # Keep sociability stable
+            )
+        
+        # Parse scalar changes
+        update.energy_delta = data.get("energy_change", 0.0)
+        update.stress_delta = data.get("stress_change", 0.0)
+        
+        # Parse opinion changes
+        if "opinion_changes" in data:
+            for entity_id, changes in data["opinion_changes"].items():
+                update.opinion_updates[entity_id] = changes
+        
+        # Parse reflection
+        if "reflection" in data and data["reflection"]:
+            update.new_reflection = ReflectionEntry(
+                timestamp=datetime.now(),
+                topic="Interaction Analysis",
+                insight=data["reflection"],
+                confidence=0.8
+            )
+        
+        return update
 
 
 class EmotionalEngine:
@@ -340,11 +397,74 @@ class EmotionalEngine:
             "arousal": 0.0,
             "stress": 0.0
         }
+        
+        # Legion-wide kernel this engine writes through to (set on register)
+        self.kernel = None
+        
+        # Legion-wide relationship matrix opinions write through to
+        self.relationship_matrix = None
+        
+        # Field-level change log keyed by state_version, used for
+        # delta persistence
+        self._change_log: Deque[Tuple[int, Dict[str, Any]]] = deque(maxlen=256)
+        self._last_field_map = self._current_state.to_field_map()
+    
+    @property
+    def state_version(self) -> int:
+        """Version of the current emotional state"""
+        return self._current_state.state_version
+    
+    def _record_changes(self):
+        """Log the fields that changed since the last recorded version"""
+        field_map = self._current_state.to_field_map()
+        last = self._last_field_map
+        changed = {key: value for key, value in field_map.items() if last.get(key) != value}
+        changed.update({key: None for key in last.keys() - field_map.keys()})
+        
+        self._change_log.append((self._current_state.state_version, changed))
+        self._last_field_map = field_map
+    
+    def changes_since(self, version: int) -> Optional[Dict[str, Any]]:
+        """
+        Merge every field change made after a given state version
+        
+        Args:
+            version: State version the caller already has
+            
+        Returns:
+            Changed fields (empty when up to date), or None when the log
+            no longer reaches back to version and a keyframe is needed
+        """
+        # Capture mutations made outside the engine (e.g. apply_stress)
+        if not self._change_log or self._change_log[-1][0] != self.state_version:
+            self._record_changes()
+        
+        if version >= self.state_version:
+            return {}
+        if self._change_log[0][0] > version + 1:
+            return None
+        
+        merged: Dict[str, Any] = {}
+        for entry_version, changed in self._change_log:
+            if entry_version > version:
+                merged.update(changed)
+        return merged
     
     def get_current_state(self) -> EmotionalState:
-        """Get current emotional state"""
+        """
+        Get current emotional state
+        
+        Decay since the last update is folded in on read, so idle
+        Minions need no periodic decay work.
+        """
+        self._current_state.materialize_decay()
         return self._current_state
     
+    @property
+    def momentum(self) -> Dict[str, float]:
+        """Current emotional momentum"""
+        return self._momentum
+    
     async def process_interaction(
         self,
         interaction_event: Dict[str, Any],
@@ -363,7 +483,7 @@ class EmotionalEngine:
         # Use policy engine if available
         if self.policy_engine:
             return await self.policy_engine.process_interaction(
-                self._current_state, interaction_event, context
+                self.get_current_state(), interaction_event, context
             )
         
         # Otherwise, use simple heuristics
@@ -374,40 +494,13 @@ class EmotionalEngine:
         interaction_event: Dict[str, Any]
     ) -> EmotionalStateUpdate:
         """Simple heuristic-based emotional update"""
-        update = EmotionalStateUpdate()
-        
-        emotional_impact = interaction_event.get('emotional_impact', 0.0)
-        
-        if abs(emotional_impact) > 0.1:
-            # Mood changes
-            update.mood_delta = MoodVector(
-                valence=emotional_impact * 0.2,
-                arousal=abs(emotional_impact) * 0.1,
-                dominance=0.0,
-                curiosity=0.05 if emotional_impact > 0 else -0.05,
-                creativity=0.0,
-                sociability=0.1 if emotional_impact > 0 else -0.05
-            )
-            
-            # Energy and stress
-            if emotional_impact > 0.5:
-                update.energy_delta = 0.1
-                update.stress_delta = -0.05
-            elif emotional_impact < -0.5:
-                update.energy_delta = -0.05
-                update.stress_delta = 0.1
-            
-            # Opinion changes
-            update.opinion_updates["commander"] = {
-                "trust": emotional_impact * 5,
-                "respect": emotional_impact * 3,
-                "affection": emotional_impact * 4
-            }
-        
-        return update
+        return heuristic_emotional_update(interaction_event)
     
     async def apply_update(self, update: EmotionalStateUpdate):
         """Apply validated emotional state update"""
+        # Deltas apply to the decayed values, not the stale stored ones
+        self._current_state.materialize_decay()
+        
         # Store previous state
         self._add_to_history(self._current_state.copy())
         
@@ -447,6 +540,73 @@ class EmotionalEngine:
         # Update metadata
         self._current_state.last_updated = datetime.now()
         self._current_state.state_version += 1
+        self._record_changes()
+        
+        # Write through to the legion kernel
+        if self.kernel:
+            self.kernel.sync(self.minion.minion_id)
+    
+    async def apply_direct_update(self, new_state: EmotionalState):
+        """
+        Replace mood, energy and stress with externally provided values
+        
+        Args:
+            new_state: State whose values become current as of now
+        """
+        if new_state is not self._current_state:
+            self._add_to_history(self._current_state.copy())
+        
+        now = datetime.now()
+        self._current_state.mood = new_state.mood
+        self._current_state.energy_level = new_state.energy_level
+        self._current_state.stress_level = new_state.stress_level
+        self._current_state.decay_reference_time = now
+        self._current_state.last_updated = now
+        self._current_state.state_version += 1
+        self._record_changes()
+        
+        if self.kernel:
+            self.kernel.sync(self.minion.minion_id)
+    
+    def apply_kernel_row(
+        self,
+        mood: MoodVector,
+        energy_level: float,
+        stress_level: float,
+        momentum: List[float],
+        regulated: bool = False,
+        reflection: Optional[ReflectionEntry] = None,
+        at: Optional[datetime] = None
+    ):
+        """
+        Absorb the result of a legion kernel tick
+        
+        Args:
+            mood: New mood vector
+            energy_level: New energy level
+            stress_level: New stress level
+            momentum: New valence, arousal and stress momentum
+            regulated: Whether the tick applied self-regulation
+            reflection: Optional reflection produced by regulation
+            at: Time the row values are valid at (defaults to now)
+        """
+        if regulated:
+            self._add_to_history(self._current_state.copy())
+        
+        now = at or datetime.now()
+        self._current_state.mood = mood
+        self._current_state.energy_level = energy_level
+        self._current_state.stress_level = stress_level
+        self._current_state.decay_reference_time = now
+        self._momentum["valence"], self._momentum["arousal"], self._momentum["stress"] = momentum
+        
+        if reflection:
+            self._current_state.self_reflection_notes.append(reflection)
+            self._prune_reflections()
+        
+        self._current_state.last_updated = now
+        self._current_state.state_version += 1
+        self._record_changes()
     
     def _apply_mood_with_momentum(self, mood_delta: MoodVector):
         """Apply mood changes considering momentum"""
@@ -490,6 +650,9 @@ class EmotionalEngine:
             new_value = max(-100, min(100, current + delta))
             setattr(opinion, metric, new_value)
         
+        if self.relationship_matrix:
+            self.relationship_matrix.set_opinion_score(self.minion.minion_id, opinion)
+        
         # Update interaction tracking
         opinion.interaction_count += 1
         opinion.last_interaction = datetime.now()
@@ -555,7 +718,9 @@ class EmotionalEngine:
         Perform autonomous emotional regulation
         
         This method can be called periodically to allow the Minion
-        to self-regulate extreme emotional states.
+        to self-regulate extreme emotional states. When the engine is
+        registered with a LegionEmotionalKernel, the kernel tick applies
+        the same rules to the whole Legion at once.
         """
         # Check for extreme states needing regulation
         needs_regulation = False
@@ -0,0 +1,396 @@
+"""
+Legion Emotional Kernel
+
+Keeps the mood, energy and stress of every active Minion in shared
+arrays so that regulation and momentum can be applied to the whole
+Legion in a single vectorized pass per tick. Decay toward baseline is
+evaluated in closed form, the same way EmotionalState does on read.
+"""
+
+from typing import Dict, List, Optional, Any
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+import time
+
+import numpy as np
+
+from ...domain import MoodVector, ReflectionEntry
+from ...domain.emotional_state import EMOTIONAL_DECAY_INTERVAL_SECONDS
+from .emotional_engine import EmotionalStateValidator
+
+
+logger = logging.getLogger(__name__)
+
+
+MOOD_DIMENSIONS = (
+    "valence",
+    "arousal",
+    "dominance",
+    "curiosity",
+    "creativity",
+    "sociability"
+)
+
+# Column indices into the mood and momentum arrays
+_VALENCE = 0
+_AROUSAL = 1
+_MOMENTUM_STRESS = 2
+
+
+@dataclass
+class CompiledValidationRules:
+    """EmotionalStateValidator rules lowered to array clamps"""
+    max_mood_delta: float
+    max_energy_delta: float
+    max_stress_delta: float
+    scalar_floor: float = 0.0
+    scalar_ceiling: float = 1.0
+
+    @classmethod
+    def from_validator(cls, validator: EmotionalStateValidator) -> 'CompiledValidationRules':
+        """Compile the per-update limits of a validator"""
+        return cls(
+            max_mood_delta=validator.MAX_MOOD_DELTA,
+            max_energy_delta=validator.MAX_ENERGY_DELTA,
+            max_stress_delta=validator.MAX_STRESS_DELTA
+        )
+
+    def clamp_mood_delta(self, mood_delta: np.ndarray) -> np.ndarray:
+        """Vectorized EmotionalStateValidator._constrain_mood_delta"""
+        return np.clip(mood_delta, -self.max_mood_delta, self.max_mood_delta)
+
+    def clamp_scalar_delta(
+        self,
+        delta: np.ndarray,
+        max_delta: float,
+        current: np.ndarray
+    ) -> np.ndarray:
+        """Vectorized EmotionalStateValidator._constrain_scalar"""
+        constrained = np.clip(delta, -max_delta, max_delta)
+        bounded = np.clip(current + constrained, self.scalar_floor, self.scalar_ceiling)
+        return bounded - current
+
+
+@dataclass
+class KernelTickResult:
+    """Summary of a single kernel tick"""
+    ticked: int
+    regulated: int
+    written_back: int
+    duration_ms: float
+
+
+class LegionEmotionalKernel:
+    """
+    Vectorized emotional state for the whole Legion
+
+    Every registered EmotionalEngine owns one row of the shared arrays.
+    Rows hold the stored (undecayed) values and their decay reference
+    time. Engines write through to their row whenever they apply an
+    update, and tick() writes back only the rows it regulated; the rest
+    keep decaying lazily without any per-tick work.
+    """
+
+    # Regulation rules (mirror EmotionalEngine.autonomous_emotional_regulation)
+    HIGH_STRESS_THRESHOLD = 0.8
+    LOW_ENERGY_THRESHOLD = 0.2
+    EXTREME_VALENCE_THRESHOLD = 0.8
+    STRESS_RELIEF = -0.1
+    ENERGY_BOOST = 0.1
+    LOW_ENERGY_MOOD_LIFT = 0.1
+    VALENCE_DAMPING = -0.2
+
+    # Momentum rules (mirror EmotionalEngine.apply_update)
+    MOMENTUM_RETENTION = 0.7
+    MOMENTUM_INTAKE = 0.3
+    MOMENTUM_GAIN = 0.2
+    MOOD_BLEND_WEIGHT = 0.3
+
+    def __init__(
+        self,
+        validator: Optional[EmotionalStateValidator] = None,
+        initial_capacity: int = 64
+    ):
+        """
+        Initialize the kernel
+
+        Args:
+            validator: Validator whose rules are compiled to array clamps
+            initial_capacity: Number of rows to preallocate
+        """
+        self.rules = CompiledValidationRules.from_validator(
+            validator or EmotionalStateValidator()
+        )
+
+        self._slots: Dict[str, int] = {}
+        self._engines: List[Optional[Any]] = []
+        self._free_slots: List[int] = []
+        self._size = 0
+
+        self._allocate(max(1, initial_capacity))
+
+    def _allocate(self, capacity: int):
+        """Allocate (or grow) the shared arrays"""
+        dims = len(MOOD_DIMENSIONS)
+
+        def grow(array: Optional[np.ndarray], shape: tuple, dtype=np.float64) -> np.ndarray:
+            new_array = np.zeros(shape, dtype=dtype)
+            if array is not None:
+                new_array[:len(array)] = array
+            return new_array
+
+        self._mood = grow(getattr(self, "_mood", None), (capacity, dims))
+        self._baseline_mood = grow(getattr(self, "_baseline_mood", None), (capacity, dims))
+        self._energy = grow(getattr(self, "_energy", None), (capacity,))
+        self._baseline_energy = grow(getattr(self, "_baseline_energy", None), (capacity,))
+        self._stress = grow(getattr(self, "_stress", None), (capacity,))
+        self._baseline_stress = grow(getattr(self, "_baseline_stress", None), (capacity,))
+        self._momentum = grow(getattr(self, "_momentum", None), (capacity, 3))
+        self._decay_rate = grow(getattr(self, "_decay_rate", None), (capacity,))
+        self._reference_time = grow(getattr(self, "_reference_time", None), (capacity,))
+        self._active = grow(getattr(self, "_active", None), (capacity,), dtype=bool)
+
+        self._engines.extend([None] * (capacity - len(self._engines)))
+        self._capacity = capacity
+
+    @property
+    def active_count(self) -> int:
+        """Number of Minions currently held by the kernel"""
+        return len(self._slots)
+
+    def register(self, engine: Any) -> int:
+        """
+        Register an EmotionalEngine and load its state into the arrays
+
+        Returns:
+            The row assigned to the Minion
+        """
+        minion_id = engine.minion.minion_id
+        if minion_id in self._slots:
+            slot = self._slots[minion_id]
+        else:
+            if self._free_slots:
+                slot = self._free_slots.pop()
+            else:
+                if self._size == self._capacity:
+                    self._allocate(self._capacity * 2)
+                slot = self._size
+                self._size += 1
+            self._slots[minion_id] = slot
+
+        self._engines[slot] = engine
+        self._active[slot] = True
+        self._load_row(slot, engine)
+
+        engine.kernel = self
+        return slot
+
+    def unregister(self, minion_id: str):
+        """Release a Minion's row"""
+        slot = self._slots.pop(minion_id, None)
+        if slot is None:
+            return
+
+        engine = self._engines[slot]
+        if engine is not None and getattr(engine, "kernel", None) is self:
+            engine.kernel = None
+
+        self._engines[slot] = None
+        self._active[slot] = False
+        self._free_slots.append(slot)
+
+    def sync(self, minion_id: str):
+        """Pull a Minion's current state into its row (write-through)"""
+        slot = self._slots.get(minion_id)
+        if slot is not None:
+            self._load_row(slot, self._engines[slot])
+
+    def _load_row(self, slot: int, engine: Any):
+        """Copy an engine's state, baseline and momentum into a row"""
+        state = engine.get_current_state()
+        momentum = engine.momentum
+        self._mood[slot] = [getattr(state.mood, dim) for dim in MOOD_DIMENSIONS]
+        self._energy[slot] = state.energy_level
+        self._stress[slot] = state.stress_level
+        self._baseline_mood[slot] = [getattr(state.baseline_mood, dim) for dim in MOOD_DIMENSIONS]
+        self._baseline_energy[slot] = state.baseline_energy
+        self._baseline_stress[slot] = state.baseline_stress
+        self._decay_rate[slot] = state.decay_rate
+        self._reference_time[slot] = state.decay_reference_time.timestamp()
+        self._momentum[slot] = [
+            momentum["valence"],
+            momentum["arousal"],
+            momentum["stress"]
+        ]
+
+    def _decayed_rows(self, rows: np.ndarray, now: float):
+        """
+        Closed-form decay of the given rows (mirrors EmotionalState.decayed_values)
+
+        Returns:
+            Tuple of (mood, energy, stress) arrays at time now
+        """
+        elapsed = np.maximum(now - self._reference_time[rows], 0.0)
+        factor = np.where(
+            self._decay_rate[rows] >= 1.0,
+            1.0,
+            self._decay_rate[rows] ** (elapsed / EMOTIONAL_DECAY_INTERVAL_SECONDS)
+        )
+
+        base_mood = self._baseline_mood[rows]
+        base_energy = self._baseline_energy[rows]
+        base_stress = self._baseline_stress[rows]
+
+        return (
+            base_mood + (self._mood[rows] - base_mood) * factor[:, None],
+            base_energy + (self._energy[rows] - base_energy) * factor,
+            base_stress + (self._stress[rows] - base_stress) * factor
+        )
+
+    def tick(self) -> KernelTickResult:
+        """
+        Apply regulation and momentum to every active Minion
+
+        Returns:
+            Summary of the tick
+        """
+        started = time.perf_counter()
+        rows = np.flatnonzero(self._active[:self._size])
+        if rows.size == 0:
+            return KernelTickResult(0, 0, 0, 0.0)
+
+        now = datetime.now()
+        mood, energy, stress = self._decayed_rows(rows, now.timestamp())
+        momentum = self._momentum[rows]
+        valence = mood[:, _VALENCE]
+
+        # Regulation masks
+        high_stress = stress > self.HIGH_STRESS_THRESHOLD
+        low_energy = energy < self.LOW_ENERGY_THRESHOLD
+        extreme_mood = np.abs(valence) > self.EXTREME_VALENCE_THRESHOLD
+        has_mood_delta = low_energy | extreme_mood
+        regulated = high_stress | low_energy | extreme_mood
+
+        # Proposed regulation deltas
+        stress_delta = np.where(high_stress, self.STRESS_RELIEF, 0.0)
+        energy_delta = np.where(low_energy, self.ENERGY_BOOST, 0.0)
+        mood_delta = np.zeros_like(mood)
+        mood_delta[low_energy, _VALENCE] = self.LOW_ENERGY_MOOD_LIFT
+        mood_delta[low_energy, _AROUSAL] = self.LOW_ENERGY_MOOD_LIFT
+        # Extreme mood regulation replaces the low-energy mood lift
+        mood_delta[extreme_mood] = 0.0
+        mood_delta[extreme_mood, _VALENCE] = self.VALENCE_DAMPING * valence[extreme_mood]
+
+        # Validation
+        mood_delta = self.rules.clamp_mood_delta(mood_delta)
+        energy_delta = self.rules.clamp_scalar_delta(
+            energy_delta, self.rules.max_energy_delta, energy
+        )
+        stress_delta = self.rules.clamp_scalar_delta(
+            stress_delta, self.rules.max_stress_delta, stress
+        )
+
+        # Mood momentum
+        new_momentum = momentum.copy()
+        for column in (_VALENCE, _AROUSAL):
+            new_momentum[:, column] = np.where(
+                has_mood_delta,
+                self.MOMENTUM_RETENTION * momentum[:, column]
+                + self.MOMENTUM_INTAKE * mood_delta[:, column],
+                momentum[:, column]
+            )
+        effective_delta = mood_delta.copy()
+        effective_delta[:, _VALENCE] += self.MOMENTUM_GAIN * new_momentum[:, _VALENCE]
+        effective_delta[:, _AROUSAL] += self.MOMENTUM_GAIN * new_momentum[:, _AROUSAL]
+        new_mood = np.where(
+            has_mood_delta[:, None],
+            mood * (1 - self.MOOD_BLEND_WEIGHT) + effective_delta * self.MOOD_BLEND_WEIGHT,
+            mood
+        )
+
+        # Scalars and stress momentum
+        new_energy = np.clip(energy + energy_delta, 0.0, 1.0)
+        new_stress = np.clip(stress + stress_delta, 0.0, 1.0)
+        new_momentum[:, _MOMENTUM_STRESS] = np.where(
+            high_stress,
+            self.MOMENTUM_RETENTION * momentum[:, _MOMENTUM_STRESS]
+            + self.MOMENTUM_INTAKE * stress_delta,
+            momentum[:, _MOMENTUM_STRESS]
+        )
+
+        # Only regulated rows change; the rest keep decaying lazily
+        changed = rows[regulated]
+        self._mood[changed] = new_mood[regulated]
+        self._energy[changed] = new_energy[regulated]
+        self._stress[changed] = new_stress[regulated]
+        self._momentum[changed] = new_momentum[regulated]
+        self._reference_time[changed] = now.timestamp()
+
+        written_back = self._write_back(rows, regulated, high_stress, now)
+
+        duration_ms = (time.perf_counter() - started) * 1000
+        regulated_count = int(regulated.sum())
+        if regulated_count:
+            logger.info(f"Emotional kernel regulated {regulated_count} of {rows.size} Minions")
+
+        return KernelTickResult(
+            ticked=int(rows.size),
+            regulated=regulated_count,
+            written_back=written_back,
+            duration_ms=duration_ms
+        )
+
+    def _write_back(
+        self,
+        rows: np.ndarray,
+        regulated: np.ndarray,
+        high_stress: np.ndarray,
+        now: datetime
+    ) -> int:
+        """Copy regulated rows back to their EmotionalState objects"""
+        written = 0
+
+        for position in np.flatnonzero(regulated):
+            slot = int(rows[position])
+            engine = self._engines[slot]
+            if engine is None:
+                continue
+
+            reflection = None
+            if high_stress[position]:
+                reflection = ReflectionEntry(
+                    timestamp=now,
+                    topic="Stress Management",
+                    insight="Taking a moment to center myself and reduce stress levels",
+                    confidence=0.9
+                )
+
+            engine.apply_kernel_row(
+                mood=MoodVector(*self._mood[slot].tolist()),
+                energy_level=float(self._energy[slot]),
+                stress_level=float(self._stress[slot]),
+                momentum=self._momentum[slot].tolist(),
+                regulated=True,
+                reflection=reflection,
+                at=now
+            )
+            written += 1
+
+        return written
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Summary statistics over all active Minions"""
+        rows = np.flatnonzero(self._active[:self._size])
+        if rows.size == 0:
+            return {"active_minions": 0, "capacity": self._capacity}
+
+        mood, energy, stress = self._decayed_rows(rows, datetime.now().timestamp())
+        return {
+            "active_minions": int(rows.size),
+            "capacity": self._capacity,
+            "mean_valence": float(mood[:, _VALENCE].mean()),
+            "mean_energy": float(energy.mean()),
+            "mean_stress": float(stress.mean()),
+            "high_stress_minions": int((stress > self.HIGH_STRESS_THRESHOLD).sum())
+        }
@@ -0,0 +1,327 @@
+"""
+Batched Emotional Policy Engine
+
+Coalesces pending interactions from one or many Minions into a single
+structured LLM prompt, caches proposed updates by interaction features,
+and falls back to heuristics when the queue is saturated.
+"""
+
+from typing import Optional, Dict, Any, List, Tuple
+from dataclasses import dataclass
+from collections import OrderedDict
+from copy import deepcopy
+import asyncio
+import hashlib
+import logging
+import json
+import time
+
+from google.adk.agents import LlmAgent
+
+from ...domain import EmotionalState, EmotionalStateUpdate
+from .emotional_engine import EmotionalPolicyEngine, heuristic_emotional_update
+from .llm_scheduler import LLMLane, LLMScheduler, current_lane
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PendingInteraction:
+    """An interaction waiting to be evaluated in the next batch"""
+    current_state: EmotionalState
+    interaction: Dict[str, Any]
+    context: Optional[Dict[str, Any]]
+    cache_key: str
+    future: asyncio.Future
+    lane: LLMLane = LLMLane.CHATTER  # Lane of the turn awaiting this update
+
+
+class BatchedEmotionalPolicyEngine(EmotionalPolicyEngine):
+    """
+    Micro-batching front end for the emotional policy engine
+
+    Interactions are queued and flushed either when a batch fills up or
+    when the oldest one has waited max_wait_ms. Each flush issues one LLM
+    call for the whole batch, and identical interactions in a batch share
+    a single prompt entry. Proposed updates are cached before validation,
+    so a cache hit is still validated against the caller's current state.
+    """
+
+    def __init__(
+        self,
+        llm_agent: LlmAgent,
+        max_batch_size: int = 8,
+        max_wait_ms: float = 50.0,
+        max_pending: int = 64,
+        cache_size: int = 512,
+        cache_ttl_seconds: float = 600.0,
+        llm_scheduler: Optional[LLMScheduler] = None
+    ):
+        """
+        Initialize the batched policy engine
+
+        Args:
+            llm_agent: The LLM agent to use for emotional analysis
+            max_batch_size: Maximum interactions per LLM call
+            max_wait_ms: Maximum time an interaction waits for a batch to fill
+            max_pending: Queue depth beyond which heuristics are used instead
+            cache_size: Maximum number of cached updates
+            cache_ttl_seconds: How long a cached update stays valid
+            llm_scheduler: Optional Legion-wide scheduler admitting the batch calls
+        """
+        super().__init__(llm_agent, llm_scheduler)
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.max_pending = max_pending
+        self.cache_size = cache_size
+        self.cache_ttl_seconds = cache_ttl_seconds
+
+        self._pending: List[PendingInteraction] = []
+        self._batch_ready = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._cache: "OrderedDict[str, Tuple[float, EmotionalStateUpdate]]" = OrderedDict()
+
+        self.stats = {
+            "interactions": 0,
+            "llm_calls": 0,
+            "batched_interactions": 0,
+            "coalesced": 0,
+            "cache_hits": 0,
+            "fallbacks": 0
+        }
+
+    async def process_interaction(
+        self,
+        current_state: EmotionalState,
+        interaction: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None
+    ) -> EmotionalStateUpdate:
+        """
+        Generate proposed emotional state changes from interaction
+
+        Args:
+            current_state: Current emotional state
+            interaction: Interaction details
+            context: Additional context
+
+        Returns:
+            Validated emotional state update
+        """
+        self.stats["interactions"] += 1
+        cache_key = self._cache_key(current_state, interaction)
+
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            self.stats["cache_hits"] += 1
+            return self.state_validator.validate(current_state, cached)
+
+        if len(self._pending) >= self.max_pending:
+            self.stats["fallbacks"] += 1
+            return self.state_validator.validate(
+                current_state, heuristic_emotional_update(interaction)
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append(PendingInteraction(
+            current_state=current_state,
+            interaction=interaction,
+            context=context,
+            cache_key=cache_key,
+            future=future,
+            lane=current_lane()
+        ))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._batch_ready.set()
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+        proposed_update = await future
+        return self.state_validator.validate(current_state, proposed_update)
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of interactions waiting for evaluation"""
+        return len(self._pending)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Batching, cache and fallback counters with the current queue depth"""
+        return {
+            **self.stats,
+            "queue_depth": self.queue_depth,
+            "cached": len(self._cache)
+        }
+
+    async def _flush_loop(self):
+        """Drain the pending queue one batch at a time"""
+        while self._pending:
+            if len(self._pending) < self.max_batch_size:
+                try:
+                    await asyncio.wait_for(
+                        self._batch_ready.wait(),
+                        timeout=self.max_wait_ms / 1000
+                    )
+                except asyncio.TimeoutError:
+                    pass
+            self._batch_ready.clear()
+
+            batch = self._pending[:self.max_batch_size]
+            del self._pending[:self.max_batch_size]
+
+            try:
+                await self._evaluate_batch(batch)
+            except Exception as e:
+                logger.error(f"Emotional policy batch failed: {e}")
+                for item in batch:
+                    if not item.future.done():
+                        item.future.set_result(heuristic_emotional_update(item.interaction))
+
+    async def _evaluate_batch(self, batch: List[PendingInteraction]):
+        """Evaluate a batch with a single LLM call and resolve its futures"""
+        groups: "OrderedDict[str, List[PendingInteraction]]" = OrderedDict()
+        for item in batch:
+            groups.setdefault(item.cache_key, []).append(item)
+
+        representatives = [items[0] for items in groups.values()]
+        self.stats["coalesced"] += len(batch) - len(representatives)
+
+        results: Dict[int, Dict[str, Any]] = {}
+        try:
+            prompt = self._build_batch_prompt(representatives)
+            # A batch is as urgent as the most urgent turn waiting on it
+            lane = min(item.lane for item in batch)
+            response = await self._ask(prompt, "emotional_policy", lane)
+            self.stats["llm_calls"] += 1
+            self.stats["batched_interactions"] += len(batch)
+            results = self._parse_batch_response(response)
+        except Exception as e:
+            logger.warning(f"Batched emotional analysis failed, using heuristics: {e}")
+
+        for index, items in enumerate(groups.values()):
+            proposed_update = None
+            data = results.get(index)
+
+            if data is not None:
+                try:
+                    proposed_update = self._update_from_data(data)
+                    self._cache_put(items[0].cache_key, proposed_update)
+                except (KeyError, ValueError, TypeError, AttributeError) as e:
+                    logger.warning(f"Failed to parse batched emotional update {index}: {e}")
+
+            if proposed_update is None:
+                self.stats["fallbacks"] += len(items)
+                proposed_update = heuristic_emotional_update(items[0].interaction)
+
+            for item in items:
+                if not item.future.done():
+                    item.future.set_result(deepcopy(proposed_update))
+
+    def _build_batch_prompt(self, batch: List[PendingInteraction]) -> str:
+        """Build one prompt covering every interaction in the batch"""
+        sections = []
+        for index, item in enumerate(batch):
+            state = item.current_state
+            sections.append(
+                f"""[Interaction {index}]
+Minion: {state.minion_id}
+Current Emotional State:
+- Mood: {state.mood.to_prompt_modifier()}
+- Energy Level: {state.energy_level:.1f}
+- Stress Level: {state.stress_level:.1f}
+- Commander Opinion: {state.get_opinion_of('commander').overall_sentiment:.0f}/100
+User Message: {item.interaction.get('user_message', 'N/A')}
+Minion Response: {item.interaction.get('minion_response', 'N/A')}"""
+            )
+
+        interactions = "\n\n".join(sections)
+
+        return f"""Analyze the emotional impact of each interaction below on the Minion involved.
+Each interaction is independent; do not let one influence another.
+
+{interactions}
+
+Provide one structured emotional update per interaction in JSON format:
+{{
+    "updates": [
+        {{
+            "id": <interaction number>,
+            "mood_changes": {{
+                "valence": <float between -0.3 and 0.3>,
+                "arousal": <float between -0.3 and 0.3>,
+                "curiosity": <float between -0.3 and 0.3>
+            }},
+            "energy_change": <float between -0.2 and 0.2>,
+            "stress_change": <float between -0.2 and 0.2>,
+            "opinion_changes": {{
+                "commander": {{
+                    "trust": <float between -20 and 20>,
+                    "respect": <float between -20 and 20>,
+                    "affection": <float between -20 and 20>
+                }}
+            }},
+            "reflection": "<optional insight about the interaction>",
+            "reasoning": "<brief explanation of emotional changes>"
+        }}
+    ]
+}}"""
+
+    def _parse_batch_response(self, llm_response: str) -> Dict[int, Dict[str, Any]]:
+        """Parse a batched LLM response into per-interaction update data"""
+        try:
+            json_start = llm_response.find('{')
+            json_end = llm_response.rfind('}') + 1
+            data = json.loads(llm_response[json_start:json_end])
+        except (json.JSONDecodeError, ValueError) as e:
+            logger.warning(f"Failed to parse batched emotional update: {e}")
+            return {}
+
+        updates = data.get("updates", []) if isinstance(data, dict) else []
+
+        results = {}
+        for position, entry in enumerate(updates):
+            if not isinstance(entry, dict):
+                continue
+            try:
+                index = int(entry.get("id", position))
+            except (TypeError, ValueError):
+                index = position
+            results[index] = entry
+
+        return results
+
+    def _cache_key(self, current_state: EmotionalState, interaction: Dict[str, Any]) -> str:
+        """Key an interaction by the Minion and the features that drive its emotional update"""
+        message = " ".join(str(interaction.get('user_message', '')).lower().split())
+        response = " ".join(str(interaction.get('minion_response', '')).lower().split())
+        features = (
+            current_state.minion_id,
+            message[:500],
+            response[:500],
+            round(float(interaction.get('emotional_impact', 0.0)), 1),
+            int(current_state.mood.valence * 4),
+            int(current_state.stress_level * 4),
+            int(current_state.energy_level * 4)
+        )
+        return hashlib.sha1(repr(features).encode("utf-8")).hexdigest()
+
+    def _cache_get(self, cache_key: str) -> Optional[EmotionalStateUpdate]:
+        """Get a cached proposed update if it is still fresh"""
+        entry = self._cache.get(cache_key)
+        if entry is None:
+            return None
+
+        stored_at, update = entry
+        if time.monotonic() - stored_at > self.cache_ttl_seconds:
+            del self._cache[cache_key]
+            return None
+
+        self._cache.move_to_end(cache_key)
+        return deepcopy(update)
+
+    def _cache_put(self, cache_key: str, update: EmotionalStateUpdate):
+        """Cache a proposed update, evicting the least recently used"""
+        self._cache[cache_key] = (time.monotonic(), deepcopy(update))
+        self._cache.move_to_end(cache_key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
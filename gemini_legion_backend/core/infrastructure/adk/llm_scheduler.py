@@ -0,0 +1,346 @@
+"""
+LLM Scheduler
+
+Legion-wide admission control for LLM calls. Every call waits for a
+slot in a priority lane, so under load the Commander's requests keep
+their latency while inter-Minion chatter queues up behind them.
+"""
+
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Awaitable, Callable, Deque, Dict, Iterable, Iterator, Optional, Tuple, TypeVar
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+import asyncio
+import logging
+import time
+
+from ...domain import is_commander
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LLMLane(IntEnum):
+    """Priority lanes, most urgent first"""
+    COMMANDER = 0  # Commander input and direct commands
+    TASK = 1  # Task decomposition and execution
+    CHATTER = 2  # Replies to other Minions
+    AUTONOMOUS = 3  # Self-initiated messages
+
+
+_current_lane: ContextVar[LLMLane] = ContextVar("llm_lane", default=LLMLane.CHATTER)
+
+
+@contextmanager
+def llm_lane(lane: LLMLane) -> Iterator[None]:
+    """Run the enclosed LLM calls (including awaited callees) in a lane"""
+    token = _current_lane.set(lane)
+    try:
+        yield
+    finally:
+        _current_lane.reset(token)
+
+
+def current_lane() -> LLMLane:
+    """Lane of LLM calls made from the current context"""
+    return _current_lane.get()
+
+
+def lane_for_senders(senders: Iterable[str]) -> LLMLane:
+    """Lane for answering messages: Commander if the Commander sent any, else chatter"""
+    if any(is_commander(sender) for sender in senders):
+        return LLMLane.COMMANDER
+    return LLMLane.CHATTER
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of a prompt or response (~4 characters per token)"""
+    return max(1, len(text) // 4)
+
+
+@dataclass
+class _Request:
+    """An LLM call waiting for a slot"""
+    minion_id: str
+    lane: LLMLane
+    tokens: int
+    granted: asyncio.Future
+    enqueued: float
+
+
+@dataclass
+class LaneStats:
+    """Counters and recent wait times of one lane"""
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    tokens: int = 0
+    waits: Deque[float] = field(default_factory=lambda: deque(maxlen=200))
+
+    def to_dict(self) -> Dict:
+        waits = sorted(self.waits)
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "tokens": self.tokens,
+            "avg_wait_ms": 1000 * sum(waits) / len(waits) if waits else 0.0,
+            "p95_wait_ms": 1000 * waits[int(0.95 * (len(waits) - 1))] if waits else 0.0
+        }
+
+
+class TokenBucket:
+    """Tokens-per-minute budget that refills continuously"""
+
+    def __init__(self, tokens_per_minute: int, clock: Callable[[], float] = time.monotonic):
+        self.rate = tokens_per_minute / 60.0
+        self.capacity = float(tokens_per_minute)
+        self.level = self.capacity
+        self.clock = clock
+        self._updated = clock()
+
+    def _refill(self):
+        now = self.clock()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, tokens: int) -> float:
+        """Seconds until tokens can be spent (0 if they can be now)"""
+        self._refill()
+        # A request larger than the whole budget only waits for a full bucket
+        needed = min(tokens, self.capacity) - self.level
+        return max(0.0, needed / self.rate)
+
+    def spend(self, tokens: int):
+        """Spend tokens; the level may go negative (debt repaid by refilling)"""
+        self._refill()
+        self.level -= tokens
+
+
+class LLMScheduler:
+    """
+    Priority, fairness and budget control for LLM calls
+
+    Calls are queued per lane and, within a lane, per Minion. Dispatch
+    is strict priority between lanes and round-robin between Minions in
+    a lane, so one chatty Minion cannot starve the others. At most
+    max_concurrency calls run at once, and reserved_slots of those are
+    kept free for the Commander lane, so a Commander request never waits
+    behind in-flight chatter.
+
+    A tokens-per-minute budget (global and optionally per lane) is
+    charged with each call's estimated tokens when it starts and
+    corrected by the response size when it finishes. The Commander lane
+    is charged but never held back by budgets; its spending delays the
+    other lanes instead.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        reserved_slots: int = 1,
+        tokens_per_minute: Optional[int] = None,
+        lane_tokens_per_minute: Optional[Dict[LLMLane, int]] = None,
+        response_tokens: int = 256,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the scheduler
+
+        Args:
+            max_concurrency: Most LLM calls in flight
+            reserved_slots: Slots only the Commander lane may use
+            tokens_per_minute: Legion-wide token budget (None for unlimited)
+            lane_tokens_per_minute: Token budgets of individual lanes
+            response_tokens: Expected response size charged up front
+            clock: Monotonic clock in seconds
+        """
+        self.max_concurrency = max_concurrency
+        self.reserved_slots = min(reserved_slots, max_concurrency - 1)
+        self.response_tokens = response_tokens
+        self.clock = clock
+
+        self.budget = TokenBucket(tokens_per_minute, clock) if tokens_per_minute else None
+        self.lane_budgets: Dict[LLMLane, TokenBucket] = {
+            lane: TokenBucket(limit, clock)
+            for lane, limit in (lane_tokens_per_minute or {}).items()
+        }
+
+        # lane -> minion_id -> requests, and the lane's round-robin order
+        self._queues: Dict[LLMLane, Dict[str, Deque[_Request]]] = {lane: {} for lane in LLMLane}
+        self._rotation: Dict[LLMLane, Deque[str]] = {lane: deque() for lane in LLMLane}
+        self._depth: Dict[LLMLane, int] = {lane: 0 for lane in LLMLane}
+
+        self.in_flight = 0
+        self.lane_stats: Dict[LLMLane, LaneStats] = {lane: LaneStats() for lane in LLMLane}
+        self.budget_waits = 0
+        self._budget_timer: Optional[asyncio.TimerHandle] = None
+
+    async def submit(
+        self,
+        call: Callable[[], Awaitable[T]],
+        minion_id: str,
+        prompt: str = "",
+        lane: Optional[LLMLane] = None
+    ) -> T:
+        """
+        Run an LLM call once the scheduler grants it a slot
+
+        Args:
+            call: Coroutine function issuing the LLM call
+            minion_id: Minion on whose behalf the call is made
+            prompt: Prompt text, used to estimate the call's tokens
+            lane: Priority lane (defaults to the current context's lane)
+
+        Returns:
+            The call's result
+        """
+        lane = current_lane() if lane is None else lane
+        stats = self.lane_stats[lane]
+        stats.submitted += 1
+
+        request = _Request(
+            minion_id=minion_id,
+            lane=lane,
+            tokens=estimate_tokens(prompt) + self.response_tokens,
+            granted=asyncio.get_running_loop().create_future(),
+            enqueued=self.clock()
+        )
+        self._enqueue(request)
+        self._dispatch()
+
+        try:
+            await request.granted
+        except asyncio.CancelledError:
+            if request.granted.done() and not request.granted.cancelled():
+                self._release()  # Granted just as the caller gave up
+            else:
+                self._depth[lane] -= 1
+            stats.cancelled += 1
+            raise
+
+        stats.waits.append(self.clock() - request.enqueued)
+        try:
+            result = await call()
+        except BaseException:
+            stats.failed += 1
+            raise
+        finally:
+            self._release()
+
+        stats.completed += 1
+        if isinstance(result, str):
+            # Correct the up-front charge by the actual response size
+            self._charge(lane, estimate_tokens(result) - self.response_tokens)
+        return result
+
+    def queue_depth(self) -> Dict[str, int]:
+        """Queued calls per lane"""
+        return {lane.name.lower(): self._depth[lane] for lane in LLMLane}
+
+    def get_stats(self) -> Dict:
+        """Concurrency, queue depths, budgets and per-lane metrics"""
+        return {
+            "in_flight": self.in_flight,
+            "max_concurrency": self.max_concurrency,
+            "queue_depth": self.queue_depth(),
+            "waiting_minions": {
+                lane.name.lower(): len(self._rotation[lane]) for lane in LLMLane
+            },
+            "budget_waits": self.budget_waits,
+            "budget": {
+                "legion": round(self.budget.level) if self.budget else None,
+                **{lane.name.lower(): round(bucket.level) for lane, bucket in self.lane_budgets.items()}
+            },
+            "lanes": {lane.name.lower(): self.lane_stats[lane].to_dict() for lane in LLMLane}
+        }
+
+    def _enqueue(self, request: _Request):
+        queues = self._queues[request.lane]
+        queue = queues.get(request.minion_id)
+        if queue is None:
+            queue = queues[request.minion_id] = deque()
+            self._rotation[request.lane].append(request.minion_id)
+        queue.append(request)
+        self._depth[request.lane] += 1
+
+    def _next(self, lane: LLMLane) -> Optional[_Request]:
+        """Peek the lane's next live request in round-robin order"""
+        rotation = self._rotation[lane]
+        queues = self._queues[lane]
+        while rotation:
+            minion_id = rotation[0]
+            queue = queues[minion_id]
+            while queue and queue[0].granted.done():
+                queue.popleft()  # Cancelled while queued
+            if queue:
+                return queue[0]
+            rotation.popleft()
+            del queues[minion_id]
+        return None
+
+    def _pop(self, request: _Request):
+        rotation = self._rotation[request.lane]
+        queue = self._queues[request.lane][request.minion_id]
+        queue.popleft()
+        rotation.popleft()
+        if queue:
+            rotation.append(request.minion_id)  # Back of the line for fairness
+        else:
+            del self._queues[request.lane][request.minion_id]
+        self._depth[request.lane] -= 1
+
+    def _dispatch(self):
+        """Grant slots to queued requests, most urgent lane first"""
+        budget_wait = None
+        for lane in LLMLane:
+            limit = self.max_concurrency
+            if lane != LLMLane.COMMANDER:
+                limit -= self.reserved_slots
+            legion_blocked = False
+            while self.in_flight < limit:
+                request = self._next(lane)
+                if request is None:
+                    break
+                if lane != LLMLane.COMMANDER:
+                    wait, legion_blocked = self._budget_wait(lane, request.tokens)
+                    if wait > 0:
+                        budget_wait = wait if budget_wait is None else min(budget_wait, wait)
+                        break
+                self._pop(request)
+                self._charge(lane, request.tokens)
+                self.in_flight += 1
+                request.granted.set_result(True)
+            if legion_blocked:
+                break  # Lower lanes must not spend the budget this lane waits for
+
+        if budget_wait is not None and self._budget_timer is None:
+            self.budget_waits += 1
+            self._budget_timer = asyncio.get_running_loop().call_later(budget_wait, self._budget_refilled)
+
+    def _budget_refilled(self):
+        self._budget_timer = None
+        self._dispatch()
+
+    def _budget_wait(self, lane: LLMLane, tokens: int) -> Tuple[float, bool]:
+        """Seconds until the lane may spend tokens, and whether the Legion budget is short"""
+        legion_wait = self.budget.wait_time(tokens) if self.budget else 0.0
+        lane_wait = self.lane_budgets[lane].wait_time(tokens) if lane in self.lane_budgets else 0.0
+        return max(legion_wait, lane_wait), legion_wait > 0
+
+    def _charge(self, lane: LLMLane, tokens: int):
+        self.lane_stats[lane].tokens += tokens
+        if self.budget:
+            self.budget.spend(tokens)
+        if lane in self.lane_budgets:
+            self.lane_budgets[lane].spend(tokens)
+
+    def _release(self):
+        self.in_flight -= 1
+        self._dispatch()
@@ -0,0 +1,337 @@
+"""
+Legion Relationship Matrix
+
+Holds every Minion's opinions of every other entity in one sparse
+matrix, so that relationship queries across the Legion (top friends,
+mutual affinity, communities) do not have to scan per-Minion dicts.
+"""
+
+from typing import Dict, List, Optional, Any, Tuple, Iterable
+from dataclasses import dataclass
+import logging
+
+import numpy as np
+
+from ...domain import EmotionalState, OpinionScore
+
+
+logger = logging.getLogger(__name__)
+
+
+OPINION_METRICS = ("trust", "respect", "affection")
+
+
+@dataclass
+class AffinityScore:
+    """Opinions two entities hold of each other"""
+    entity_a: str
+    entity_b: str
+    a_to_b: Optional[float]  # overall sentiment, None if no opinion
+    b_to_a: Optional[float]
+
+    @property
+    def mutual(self) -> Optional[float]:
+        """Affinity both sides share (the weaker of the two directions)"""
+        if self.a_to_b is None or self.b_to_a is None:
+            return None
+        return min(self.a_to_b, self.b_to_a)
+
+
+class LegionRelationshipMatrix:
+    """
+    Sparse holder x target matrix of trust, respect and affection
+
+    Reads go through a CSR layout (row offsets, sorted column indices and
+    an nnz x 3 value array). Writes are appended to a COO buffer and
+    folded into the CSR arrays lazily, before the next query or once the
+    buffer grows past compact_threshold; the latest write for a cell wins.
+    """
+
+    def __init__(self, compact_threshold: int = 1024):
+        """
+        Initialize the matrix
+
+        Args:
+            compact_threshold: Buffered writes that trigger a compaction
+        """
+        self.compact_threshold = compact_threshold
+
+        self._index: Dict[str, int] = {}
+        self._entities: List[str] = []
+
+        # CSR storage
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._indices = np.zeros(0, dtype=np.int64)
+        self._data = np.zeros((0, len(OPINION_METRICS)), dtype=np.float64)
+
+        # COO write buffer; NaN values mark deletions
+        self._pending_rows: List[int] = []
+        self._pending_cols: List[int] = []
+        self._pending_values: List[Tuple[float, float, float]] = []
+
+    @property
+    def entity_count(self) -> int:
+        """Number of entities with a row/column"""
+        return len(self._entities)
+
+    @property
+    def nnz(self) -> int:
+        """Number of stored opinions"""
+        self._compact()
+        return int(self._indices.size)
+
+    def _entity_index(self, entity_id: str) -> int:
+        """Get or assign the row/column index of an entity"""
+        index = self._index.get(entity_id)
+        if index is None:
+            index = len(self._entities)
+            self._index[entity_id] = index
+            self._entities.append(entity_id)
+        return index
+
+    def set_opinion(
+        self,
+        holder_id: str,
+        target_id: str,
+        trust: float,
+        respect: float,
+        affection: float
+    ):
+        """Record the current opinion holder_id has of target_id"""
+        self._pending_rows.append(self._entity_index(holder_id))
+        self._pending_cols.append(self._entity_index(target_id))
+        self._pending_values.append((trust, respect, affection))
+
+        if len(self._pending_rows) >= self.compact_threshold:
+            self._compact()
+
+    def set_opinion_score(self, holder_id: str, score: OpinionScore):
+        """Record an OpinionScore held by holder_id"""
+        self.set_opinion(holder_id, score.entity_id, score.trust, score.respect, score.affection)
+
+    def remove_opinion(self, holder_id: str, target_id: str):
+        """Forget the opinion holder_id has of target_id"""
+        if holder_id not in self._index or target_id not in self._index:
+            return
+        self._pending_rows.append(self._index[holder_id])
+        self._pending_cols.append(self._index[target_id])
+        self._pending_values.append((np.nan, np.nan, np.nan))
+
+    def load_state(self, holder_id: str, state: EmotionalState):
+        """Replace a holder's row with the opinions in an EmotionalState"""
+        self.remove_holder(holder_id)
+        for entity_id, score in state.opinion_scores.items():
+            if isinstance(score, OpinionScore):
+                self.set_opinion(holder_id, entity_id, score.trust, score.respect, score.affection)
+
+    def remove_holder(self, holder_id: str):
+        """Forget every opinion held by holder_id"""
+        row = self._index.get(holder_id)
+        if row is None:
+            return
+        for col in self._row_columns(row):
+            self.remove_opinion(holder_id, self._entities[col])
+
+    def _row_columns(self, row: int) -> List[int]:
+        """Columns currently set in a row, including buffered writes"""
+        self._compact()
+        if row + 1 >= self._indptr.size:
+            return []
+        return self._indices[self._indptr[row]:self._indptr[row + 1]].tolist()
+
+    def _compact(self):
+        """Fold the COO buffer into the CSR arrays"""
+        if not self._pending_rows:
+            if self._indptr.size < len(self._entities) + 1:
+                self._indptr = np.concatenate([
+                    self._indptr,
+                    np.full(len(self._entities) + 1 - self._indptr.size, self._indptr[-1])
+                ])
+            return
+
+        n = len(self._entities)
+        existing_rows = np.repeat(
+            np.arange(self._indptr.size - 1, dtype=np.int64), np.diff(self._indptr)
+        )
+
+        rows = np.concatenate([existing_rows, np.asarray(self._pending_rows, dtype=np.int64)])
+        cols = np.concatenate([self._indices, np.asarray(self._pending_cols, dtype=np.int64)])
+        values = np.vstack([self._data, np.asarray(self._pending_values, dtype=np.float64)])
+
+        self._pending_rows.clear()
+        self._pending_cols.clear()
+        self._pending_values.clear()
+
+        # Stable sort by cell keeps write order within a cell; keep the last
+        keys = rows * n + cols
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        last_of_cell = np.ones(keys.size, dtype=bool)
+        last_of_cell[:-1] = keys[1:] != keys[:-1]
+        order = order[last_of_cell]
+
+        # Drop deletions
+        order = order[~np.isnan(values[order, 0])]
+
+        rows = rows[order]
+        self._indices = cols[order]
+        self._data = values[order]
+        self._indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n), out=self._indptr[1:])
+
+    def _row(self, entity_id: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Columns and values of an entity's row"""
+        self._compact()
+        row = self._index.get(entity_id)
+        if row is None:
+            return self._indices[:0], self._data[:0]
+        start, end = self._indptr[row], self._indptr[row + 1]
+        return self._indices[start:end], self._data[start:end]
+
+    def _sentiment(self, row: int, col: int) -> Optional[float]:
+        """Overall sentiment of one cell via binary search in its row"""
+        start, end = self._indptr[row], self._indptr[row + 1]
+        position = start + np.searchsorted(self._indices[start:end], col)
+        if position < end and self._indices[position] == col:
+            return float(self._data[position].mean())
+        return None
+
+    def get_opinion(self, holder_id: str, target_id: str) -> Optional[Dict[str, float]]:
+        """Get the trust, respect and affection holder_id has of target_id"""
+        self._compact()
+        row, col = self._index.get(holder_id), self._index.get(target_id)
+        if row is None or col is None:
+            return None
+        start, end = self._indptr[row], self._indptr[row + 1]
+        position = start + np.searchsorted(self._indices[start:end], col)
+        if position < end and self._indices[position] == col:
+            return dict(zip(OPINION_METRICS, self._data[position].tolist()))
+        return None
+
+    def top_k_friends(
+        self,
+        holder_id: str,
+        k: int = 3,
+        min_sentiment: float = 60.0,
+        exclude: Iterable[str] = ("commander",)
+    ) -> List[Tuple[str, float]]:
+        """
+        Entities a holder feels most positively about
+
+        Args:
+            holder_id: Entity whose opinions are ranked
+            k: Maximum number of friends to return
+            min_sentiment: Minimum overall sentiment to count as a friend
+            exclude: Entity IDs never returned
+
+        Returns:
+            List of (entity_id, sentiment), highest sentiment first
+        """
+        cols, values = self._row(holder_id)
+        if cols.size == 0 or k <= 0:
+            return []
+
+        sentiment = values.mean(axis=1)
+        mask = sentiment > min_sentiment
+        for entity_id in exclude:
+            col = self._index.get(entity_id)
+            if col is not None:
+                mask &= cols != col
+
+        candidates = np.flatnonzero(mask)
+        if candidates.size > k:
+            top = np.argpartition(-sentiment[candidates], k - 1)[:k]
+            candidates = candidates[top]
+        candidates = candidates[np.argsort(-sentiment[candidates], kind="stable")]
+
+        return [(self._entities[cols[i]], float(sentiment[i])) for i in candidates]
+
+    def mutual_affinity(self, entity_a: str, entity_b: str) -> AffinityScore:
+        """Opinions two entities hold of each other"""
+        self._compact()
+        a, b = self._index.get(entity_a), self._index.get(entity_b)
+        if a is None or b is None:
+            return AffinityScore(entity_a, entity_b, None, None)
+        return AffinityScore(entity_a, entity_b, self._sentiment(a, b), self._sentiment(b, a))
+
+    def mutual_friends(
+        self,
+        holder_id: str,
+        min_sentiment: float = 60.0
+    ) -> List[Tuple[str, float]]:
+        """
+        Entities whose positive opinion of holder_id is reciprocated
+
+        Returns:
+            List of (entity_id, mutual affinity), strongest first
+        """
+        self._compact()
+        row = self._index.get(holder_id)
+        if row is None:
+            return []
+
+        friends = []
+        for entity_id, sentiment in self.top_k_friends(
+            holder_id, k=self.entity_count, min_sentiment=min_sentiment, exclude=()
+        ):
+            reverse = self._sentiment(self._index[entity_id], row)
+            if reverse is not None and reverse > min_sentiment:
+                friends.append((entity_id, min(sentiment, reverse)))
+
+        friends.sort(key=lambda friend: friend[1], reverse=True)
+        return friends
+
+    def communities(self, min_sentiment: float = 60.0) -> List[List[str]]:
+        """
+        Group entities connected by mutual positive opinions
+
+        Connected components over edges whose sentiment exceeds
+        min_sentiment in both directions.
+
+        Returns:
+            Communities of two or more entities, largest first
+        """
+        self._compact()
+        n = self.entity_count
+        if n == 0:
+            return []
+
+        rows = np.repeat(np.arange(n, dtype=np.int64), np.diff(self._indptr))
+        strong = self._data.mean(axis=1) > min_sentiment
+        strong_keys = set((rows[strong] * n + self._indices[strong]).tolist())
+
+        parent = list(range(n))
+
+        def find(x: int) -> int:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for key in strong_keys:
+            a, b = divmod(key, n)
+            if a < b and (b * n + a) in strong_keys:
+                root_a, root_b = find(a), find(b)
+                if root_a != root_b:
+                    parent[root_b] = root_a
+
+        groups: Dict[int, List[str]] = {}
+        for index, entity_id in enumerate(self._entities):
+            groups.setdefault(find(index), []).append(entity_id)
+
+        return sorted(
+            (members for members in groups.values() if len(members) > 1),
+            key=len,
+            reverse=True
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Summary statistics for monitoring"""
+        self._compact()
+        return {
+            "entities": self.entity_count,
+            "opinions": int(self._indices.size),
+            "density": (
+                self._indices.size / (self.entity_count ** 2) if self.entity_count else 0.0
+            )
+        }
@@ -6,6 +6,7 @@ Minion agents in the ADK framework.
 """
 
 from .communication_capability import (
+    BatchPolicy,
     CommunicationCapability,
     SendMessageTool,
     SubscribeChannelTool,
@@ -13,12 +14,16 @@ from .communication_capability import (
     MessagePriority,
     IncomingMessage
 )
+from ...messaging.relevance_gate import RelevanceGate, RelevanceDecision
 
 __all__ = [
+    'BatchPolicy',
     'CommunicationCapability',
     'SendMessageTool',
     'SubscribeChannelTool',
     'AutonomousCommunicationTool',
     'MessagePriority',
-    'IncomingMessage'
+    'IncomingMessage',
+    'RelevanceGate',
+    'RelevanceDecision'
 ]
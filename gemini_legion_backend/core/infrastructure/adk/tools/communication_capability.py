@@ -26,7 +26,10 @@ from ....infrastructure.messaging.autonomous_messaging import (
     AutonomousMessage
 )
 from ....infrastructure.messaging.safeguards import CommunicationSafeguards
+from ....infrastructure.messaging.lexicon import TextAnalysis
 from ....domain import Minion, EmotionalState
+from ..llm_scheduler import LLMLane, lane_for_senders, llm_lane
+from ....infrastructure.messaging.relevance_gate import RelevanceGate
 
 
 class MessagePriority(Enum):
@@ -45,6 +48,23 @@ class IncomingMessage:
     content: str
     timestamp: datetime
     priority: MessagePriority = MessagePriority.NORMAL
+    analysis: Optional[TextAnalysis] = None  # Cached tokenization of content
+
+
+@dataclass
+class BatchPolicy:
+    """How queued messages are folded into a single LLM turn per channel"""
+    max_batch: int = 10  # Most messages folded into one turn
+    max_wait: float = 1.0  # Seconds to wait for a batch to fill after the first message
+
+
+# Most urgent first, for picking a batch's reply priority
+_PRIORITY_RANK = {
+    MessagePriority.URGENT: 3,
+    MessagePriority.HIGH: 2,
+    MessagePriority.NORMAL: 1,
+    MessagePriority.LOW: 0
+}
 
 
 class SendMessageTool(BaseTool):
@@ -58,6 +78,17 @@ class SendMessageTool(BaseTool):
     name = "send_message"
     description = "Send a message to a specific channel or Minion"
     
+    # How long to wait in the channel's turn queue before giving up
+    TURN_TIMEOUT_SECONDS = 10.0
+    
+    # Turn urgency per message priority
+    PRIORITY_URGENCY = {
+        "low": 0.2,
+        "normal": 0.5,
+        "high": 0.8,
+        "urgent": 1.0
+    }
+    
     def __init__(
         self,
         minion_id: str,
@@ -108,7 +139,9 @@ class SendMessageTool(BaseTool):
             from_minion=self.minion_id,
             to_channel=channel,
             message=message,
-            personality_modifiers=personality_modifiers
+            personality_modifiers=personality_modifiers,
+            urgency=self.PRIORITY_URGENCY.get(priority, 0.5),
+            turn_timeout=self.TURN_TIMEOUT_SECONDS
         )
         
         if sent:
@@ -120,8 +153,8 @@ class SendMessageTool(BaseTool):
         else:
             return {
                 "success": False,
-                "reason": "Turn denied - another Minion is speaking",
-                "suggestion": "Wait for your turn or increase priority"
+                "reason": "Turn not granted in time - the channel is busy",
+                "suggestion": "Try again later or increase priority"
             }
     
     def _calculate_personality_modifiers(self, priority: str) -> Dict[str, Any]:
@@ -188,7 +221,8 @@ class SubscribeChannelTool(BaseTool):
                 channel=message.channel,
                 content=message.content,
                 timestamp=message.timestamp,
-                priority=self._assess_priority(message)
+                priority=self._assess_priority(message),
+                analysis=message.get_analysis()
             )
             
             # Call handler
@@ -206,14 +240,14 @@ class SubscribeChannelTool(BaseTool):
     
     def _assess_priority(self, message: ConversationalMessage) -> MessagePriority:
         """Assess the priority of an incoming message"""
-        content_lower = message.content.lower()
+        analysis = message.get_analysis()
         
         # Check for urgency indicators
-        if any(word in content_lower for word in ["urgent", "asap", "immediately", "critical"]):
+        if analysis.hit_count("urgent"):
             return MessagePriority.URGENT
-        elif any(word in content_lower for word in ["important", "priority", "need"]):
+        elif analysis.hit_count("important"):
             return MessagePriority.HIGH
-        elif any(word in content_lower for word in ["fyi", "casual", "chat"]):
+        elif analysis.hit_count("casual"):
             return MessagePriority.LOW
         
         return MessagePriority.NORMAL
@@ -316,21 +350,56 @@ class CommunicationCapability:
     
     Provides a complete set of communication tools that can be
     added to a MinionAgent to enable rich inter-Minion communication.
+    
+    Incoming messages are queued and signal an event, so the agent's
+    message loop sleeps until there is something to answer instead of
+    polling. With a batch policy, the messages pending for a channel are
+    answered in one LLM turn as a conversation transcript instead of
+    one turn per message. With a relevance gate, messages that do not
+    concern the Minion are dropped on arrival and never wake the agent.
     """
     
+    # A debounce never holds a message longer than this many windows
+    MAX_DEBOUNCE_WINDOWS = 5
+    
     def __init__(
         self,
         minion: Minion,
         comm_system: InterMinionCommunicationSystem,
-        safeguards: CommunicationSafeguards
+        safeguards: CommunicationSafeguards,
+        debounce_seconds: float = 0.0,
+        batch_policy: Optional[BatchPolicy] = None,
+        relevance_gate: Optional[RelevanceGate] = None
     ):
+        """
+        Initialize the capability
+        
+        Args:
+            minion: The Minion communicating
+            comm_system: Inter-Minion communication system
+            safeguards: Safeguards checked before sending
+            debounce_seconds: Quiet period awaited after a message arrives so
+                a burst is processed together (0 processes immediately)
+            batch_policy: Fold each channel's pending messages into one turn
+                (None answers every message separately)
+            relevance_gate: Pre-LLM filter of incoming messages (None
+                considers every message)
+        """
         self.minion = minion
         self.comm_system = comm_system
         self.safeguards = safeguards
+        self.debounce_seconds = debounce_seconds
+        self.batch_policy = batch_policy
+        self.relevance_gate = relevance_gate
+        self.batch_stats = {
+            "turns": 0,
+            "messages": 0
+        }
         self.autonomous_engine = AutonomousMessagingEngine(comm_system)
         
-        # Message queue for incoming messages
+        # Message queue for incoming messages, and its arrival signal
         self.message_queue: asyncio.Queue[IncomingMessage] = asyncio.Queue()
+        self._message_arrived = asyncio.Event()
         
         # Create tools
         self.send_tool = SendMessageTool(
@@ -361,8 +430,54 @@ class CommunicationCapability:
         ]
     
     async def _handle_incoming_message(self, message: IncomingMessage):
-        """Handle incoming messages by queueing them"""
+        """Handle incoming messages by queueing them and waking the agent"""
+        if self.relevance_gate and not self.relevance_gate.assess(message).respond:
+            return
+        
         await self.message_queue.put(message)
+        self._message_arrived.set()
+    
+    async def wait_for_messages(self):
+        """
+        Block until at least one message is queued
+        
+        With a debounce window, keeps waiting while messages keep arriving
+        within the window (up to MAX_DEBOUNCE_WINDOWS windows in total), so
+        a burst is handled in one pass.
+        """
+        while self.message_queue.empty():
+            self._message_arrived.clear()
+            await self._message_arrived.wait()
+        
+        loop = asyncio.get_running_loop()
+        
+        if self.batch_policy is not None:
+            # Wait for the batch to fill, at most max_wait
+            deadline = loop.time() + self.batch_policy.max_wait
+            while self.message_queue.qsize() < self.batch_policy.max_batch:
+                self._message_arrived.clear()
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    return
+                try:
+                    await asyncio.wait_for(self._message_arrived.wait(), timeout)
+                except asyncio.TimeoutError:
+                    return
+            return
+        
+        if self.debounce_seconds <= 0:
+            return
+        
+        deadline = loop.time() + self.debounce_seconds * self.MAX_DEBOUNCE_WINDOWS
+        while True:
+            self._message_arrived.clear()
+            timeout = min(self.debounce_seconds, deadline - loop.time())
+            if timeout <= 0:
+                return
+            try:
+                await asyncio.wait_for(self._message_arrived.wait(), timeout)
+            except asyncio.TimeoutError:
+                return
     
     def _extract_personality_hints(self) -> Dict[str, Any]:
         """Extract personality hints from Minion's persona"""
@@ -385,8 +500,7 @@ class CommunicationCapability:
         """
         Process queued messages and generate responses
         
-        This method should be called periodically by the agent to handle
-        incoming messages.
+        Called by the agent's message loop once wait_for_messages returns.
         
         Args:
             agent: The LlmAgent to use for generating responses
@@ -394,6 +508,9 @@ class CommunicationCapability:
         Returns:
             List of responses generated
         """
+        if self.batch_policy is not None:
+            return await self._process_batched(agent)
+        
         responses = []
         
         # Process up to 5 messages at a time
@@ -405,7 +522,8 @@ class CommunicationCapability:
             
             # Generate response using the agent
             prompt = self._format_message_for_agent(message)
-            response = await agent.think(prompt)
+            with llm_lane(self._lane_for([message])):
+                response = await agent.think(prompt)
             
             # Send response if appropriate
             if response and not response.lower().startswith("[no response]"):
@@ -414,10 +532,70 @@ class CommunicationCapability:
                     message=response,
                     priority=message.priority.value
                 )
+                if self.relevance_gate:
+                    self.relevance_gate.record_reply(message.channel)
                 responses.append(response)
         
         return responses
     
+    async def _process_batched(self, agent: LlmAgent) -> List[str]:
+        """Answer each channel's pending messages with a single turn"""
+        pending: Dict[str, List[IncomingMessage]] = {}
+        while not self.message_queue.empty():
+            message = self.message_queue.get_nowait()
+            pending.setdefault(message.channel, []).append(message)
+        
+        responses = []
+        max_batch = max(1, self.batch_policy.max_batch)
+        for channel, messages in pending.items():
+            for start in range(0, len(messages), max_batch):
+                batch = messages[start:start + max_batch]
+                self.batch_stats["turns"] += 1
+                self.batch_stats["messages"] += len(batch)
+                
+                with llm_lane(self._lane_for(batch)):
+                    response = await agent.think(self._format_batch_for_agent(channel, batch))
+                
+                # Reply once to the thread, as urgently as its most urgent message
+                if response and not response.lower().startswith("[no response]"):
+                    priority = max(batch, key=lambda m: _PRIORITY_RANK[m.priority]).priority
+                    await self.send_tool.execute(
+                        channel=channel,
+                        message=response,
+                        priority=priority.value
+                    )
+                    if self.relevance_gate:
+                        self.relevance_gate.record_reply(channel)
+                    responses.append(response)
+        
+        return responses
+    
+    def _lane_for(self, messages: List[IncomingMessage]) -> LLMLane:
+        """Commander messages are answered in the Commander lane, the rest is chatter"""
+        return lane_for_senders(m.sender for m in messages)
+    
+    def _format_batch_for_agent(self, channel: str, messages: List[IncomingMessage]) -> str:
+        """Format a channel's pending messages as one conversation transcript"""
+        if len(messages) == 1:
+            return self._format_message_for_agent(messages[0])
+        
+        priority_context = ""
+        if any(m.priority == MessagePriority.URGENT for m in messages):
+            priority_context = " [CONTAINS URGENT MESSAGES]"
+        elif any(m.priority == MessagePriority.HIGH for m in messages):
+            priority_context = " [CONTAINS HIGH PRIORITY MESSAGES]"
+        
+        transcript = "\n".join(
+            f"[{m.timestamp.strftime('%H:%M:%S')}] {m.sender}: {m.content}"
+            for m in messages
+        )
+        return (
+            f"{len(messages)} new messages in {channel}{priority_context}:\n\n"
+            f"{transcript}\n\n"
+            f"How do you respond to this conversation? Write a single reply to the thread "
+            f"(Reply with '[No response]' if you choose not to respond)"
+        )
+    
     def _format_message_for_agent(self, message: IncomingMessage) -> str:
         """Format an incoming message as a prompt for the agent"""
         priority_context = ""
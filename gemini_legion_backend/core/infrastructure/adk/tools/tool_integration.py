@@ -11,7 +11,8 @@ from pathlib import Path
 
 from google.adk.tools import BaseTool
 
-from .communication_capability import CommunicationCapability
+from .communication_capability import BatchPolicy, CommunicationCapability
+from ...messaging.relevance_gate import RelevanceGate
 from .mcp import (
     MCPToolRegistry,
     ToolPermissionManager,
@@ -121,10 +122,33 @@ class ToolIntegrationManager:
             )
             return None
         
+        # config["communication"]: debounce_seconds, batch_messages, max_batch,
+        # max_batch_wait, relevance_gate, relevance_threshold, relevance_classifier
+        comm_config = self.config.get("communication", {})
+        batch_policy = None
+        if comm_config.get("batch_messages"):
+            batch_policy = BatchPolicy(
+                max_batch=comm_config.get("max_batch", 10),
+                max_wait=comm_config.get("max_batch_wait", 1.0)
+            )
+        
+        relevance_gate = None
+        if comm_config.get("relevance_gate", False):
+            relevance_gate = RelevanceGate(
+                minion.persona,
+                minion.minion_id,
+                threshold=comm_config.get("relevance_threshold", 0.4),
+                classifier=comm_config.get("relevance_classifier"),
+                direct_channel=self.comm_system.is_direct_channel if self.comm_system else None
+            )
+        
         return CommunicationCapability(
             minion=minion,
             comm_system=self.comm_system,
-            safeguards=self.safeguards
+            safeguards=self.safeguards,
+            debounce_seconds=comm_config.get("debounce_seconds", 0.0),
+            batch_policy=batch_policy,
+            relevance_gate=relevance_gate
         )
     
     def get_tools_for_minion(self, minion: Minion) -> List[BaseTool]:
@@ -241,8 +241,9 @@ class AutonomousMessagingEngine:
     when and how Minions should initiate conversations.
     """
     
-    def __init__(self, communication_system):
+    def __init__(self, communication_system, relationship_matrix=None):
         self.comm_system = communication_system
+        self.relationship_matrix = relationship_matrix  # Optional LegionRelationshipMatrix
         self.conversation_planner = ConversationPlanner()
         self.social_reasoner = SocialReasoner()
         self.active_conversations: Dict[str, AutonomousMessage] = {}
@@ -385,6 +386,13 @@ class AutonomousMessagingEngine:
     
     def _find_friendly_minions(self, minion: Minion, context: AutonomousContext) -> List[str]:
         """Find minions with positive relationships"""
+        if self.relationship_matrix:
+            return [
+                entity_id for entity_id, _ in self.relationship_matrix.top_k_friends(
+                    minion.minion_id, k=3, min_sentiment=60, exclude=("commander",)
+                )
+            ]
+        
         friendly = []
         for entity_id, opinion in minion.emotional_state.opinion_scores.items():
             if opinion.overall_sentiment > 60 and entity_id != "commander":
@@ -0,0 +1,165 @@
+"""
+Channel Routing Trie
+
+Resolves hierarchical channel names against wildcard subscription
+patterns. Channel names are split into segments on CHANNEL_SEPARATOR
+(e.g. "task.123.updates"). A pattern segment may be:
+
+- a literal segment: "task"
+- "*": exactly one segment
+- a prefix ending in "*": one segment starting with the prefix ("#task_*")
+- "**": any number of remaining segments, including none (last segment only)
+"""
+
+from typing import Any, Dict, List, Set
+
+
+CHANNEL_SEPARATOR = "."
+SINGLE_WILDCARD = "*"
+MULTI_WILDCARD = "**"
+
+
+def is_channel_pattern(channel: str) -> bool:
+    """Whether a channel name contains wildcards"""
+    return SINGLE_WILDCARD in channel
+
+
+def split_channel(channel: str) -> List[str]:
+    """Split a channel name into its hierarchical segments"""
+    return channel.split(CHANNEL_SEPARATOR)
+
+
+class _TrieNode:
+    """One pattern segment"""
+
+    __slots__ = ("children", "prefix_children", "star", "globstar", "items")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.prefix_children: Dict[str, "_TrieNode"] = {}
+        self.star: "_TrieNode" = None
+        self.globstar: "_TrieNode" = None
+        self.items: List[Any] = []
+
+    def is_empty(self) -> bool:
+        return not (
+            self.items or self.children or self.prefix_children or self.star or self.globstar
+        )
+
+
+class ChannelTrie:
+    """
+    Trie of wildcard channel patterns
+
+    Matching walks the channel's segments once. At each level it only
+    probes the literal child, the "*" child, the "**" child and the
+    prefix children for the segment's own prefixes, so the cost depends
+    on channel depth and segment length, not on the number of patterns.
+    """
+
+    def __init__(self):
+        self._root = _TrieNode()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, pattern: str, item: Any):
+        """Register an item under a pattern"""
+        segments = split_channel(pattern)
+        for position, segment in enumerate(segments):
+            if segment == MULTI_WILDCARD and position != len(segments) - 1:
+                raise ValueError(f"'{MULTI_WILDCARD}' must be the last segment of '{pattern}'")
+
+        node = self._root
+        for segment in segments:
+            node = self._child(node, segment, create=True)
+        node.items.append(item)
+        self._size += 1
+
+    def remove(self, pattern: str, item: Any) -> bool:
+        """Unregister an item from a pattern, pruning empty nodes"""
+        path = [self._root]
+        segments = split_channel(pattern)
+        for segment in segments:
+            child = self._child(path[-1], segment, create=False)
+            if child is None:
+                return False
+            path.append(child)
+
+        if item not in path[-1].items:
+            return False
+        path[-1].items.remove(item)
+        self._size -= 1
+
+        for depth in range(len(segments), 0, -1):
+            if not path[depth].is_empty():
+                break
+            self._detach(path[depth - 1], segments[depth - 1])
+        return True
+
+    def match(self, channel: str) -> List[Any]:
+        """All items whose pattern matches a concrete channel name"""
+        matched: List[Any] = []
+        seen: Set[int] = set()
+
+        def collect(node: _TrieNode):
+            if id(node) not in seen:
+                seen.add(id(node))
+                matched.extend(node.items)
+
+        states = [self._root]
+        for segment in split_channel(channel):
+            next_states = []
+            for node in states:
+                if node.globstar:
+                    collect(node.globstar)
+                child = node.children.get(segment)
+                if child:
+                    next_states.append(child)
+                if node.star:
+                    next_states.append(node.star)
+                if node.prefix_children:
+                    for end in range(len(segment) + 1):
+                        prefixed = node.prefix_children.get(segment[:end])
+                        if prefixed:
+                            next_states.append(prefixed)
+            states = next_states
+            if not states:
+                break
+
+        for node in states:
+            collect(node)
+            if node.globstar:
+                collect(node.globstar)
+
+        return matched
+
+    def _child(self, node: _TrieNode, segment: str, create: bool) -> _TrieNode:
+        """Follow (or create) the edge for a pattern segment"""
+        if segment == MULTI_WILDCARD:
+            if node.globstar is None and create:
+                node.globstar = _TrieNode()
+            return node.globstar
+        if segment == SINGLE_WILDCARD:
+            if node.star is None and create:
+                node.star = _TrieNode()
+            return node.star
+        if segment.endswith(SINGLE_WILDCARD):
+            table, key = node.prefix_children, segment[:-1]
+        else:
+            table, key = node.children, segment
+        if key not in table and create:
+            table[key] = _TrieNode()
+        return table.get(key)
+
+    def _detach(self, node: _TrieNode, segment: str):
+        """Remove the edge for a pattern segment"""
+        if segment == MULTI_WILDCARD:
+            node.globstar = None
+        elif segment == SINGLE_WILDCARD:
+            node.star = None
+        elif segment.endswith(SINGLE_WILDCARD):
+            node.prefix_children.pop(segment[:-1], None)
+        else:
+            node.children.pop(segment, None)
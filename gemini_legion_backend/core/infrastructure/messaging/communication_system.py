@@ -7,12 +7,25 @@ conversational, structured data exchange, and event-driven messaging.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict, Optional, Any, Callable
+from typing import List, Dict, Optional, Any, Callable, Set, Tuple
 from enum import Enum
 import asyncio
+import heapq
+import itertools
+import time
+import uuid
 from collections import defaultdict
 import logging
 
+from ...domain import ChannelType
+from .lexicon import DEFAULT_LEXICON, TextAnalysis
+from .delivery import OverflowPolicy, Subscription
+from .channel_trie import ChannelTrie, is_channel_pattern
+from .message_bus import MessageBus, BusEnvelope, BusHandler
+from .rpc import RpcDispatcher, RpcCall, RpcHandlerFunc
+from .events import EventDispatcher
+from .transport import Transport, CHAT_TOPIC
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,6 +44,8 @@ class TurnRequest:
     channel_id: str
     urgency: float = 0.5  # 0.0 to 1.0
     estimated_length: int = 1  # Estimated messages
+    enqueued_at: float = 0.0  # Monotonic time the request was queued
+    grant: Optional[asyncio.Future] = field(default=None, repr=False, compare=False)
 
 
 class TurnTakingEngine:
@@ -39,27 +54,114 @@ class TurnTakingEngine:
     
     Implements sophisticated turn-taking logic from AeroChat to prevent
     spam and ensure realistic multi-agent conversations.
+    
+    Waiting requests sit in a per-channel heap. Priority grows with time
+    spent waiting (urgency + aging_rate * seconds waited) so low-urgency
+    requests are not starved; since every request ages at the same rate,
+    the order can be keyed once at enqueue time.
+    
+    last_spoke only matters within the cooldown, so entries older than
+    that are swept whenever the table doubles in size; deleted channels
+    and despawned Minions are forgotten outright.
     """
     
-    def __init__(self):
+    def __init__(self, aging_rate: float = 0.05):
+        """
+        Initialize the engine
+        
+        Args:
+            aging_rate: Urgency gained per second spent waiting
+        """
         self.current_speakers: Dict[str, str] = {}  # channel_id -> minion_id
-        self.turn_queue: Dict[str, List[TurnRequest]] = defaultdict(list)
-        self.recent_speakers: Dict[str, List[tuple[str, datetime]]] = defaultdict(list)
+        self.turn_queue: Dict[str, List[Tuple[float, int, TurnRequest]]] = defaultdict(list)
+        self.last_spoke: Dict[Tuple[str, str], float] = {}  # (channel_id, minion_id) -> monotonic time
         self.cooldown_seconds = 2.0
+        self.aging_rate = aging_rate
+        self._sequence = itertools.count()
+        self._sweep_at = 64  # last_spoke size that triggers the next sweep
     
-    async def request_turn(self, minion_id: str, channel_id: str, urgency: float = 0.5) -> bool:
+    async def request_turn(
+        self,
+        minion_id: str,
+        channel_id: str,
+        urgency: float = 0.5,
+        timeout: Optional[float] = None
+    ) -> bool:
         """
         Request permission to speak in a channel
         
+        Args:
+            minion_id: Minion asking to speak
+            channel_id: Channel to speak in
+            urgency: Request urgency (0.0 to 1.0)
+            timeout: Seconds to wait for the turn; None fails fast
+        
         Returns:
             True if turn granted, False if should wait
         """
+        if timeout is None:
+            return self._try_grant(minion_id, channel_id)
+        
+        try:
+            return await asyncio.wait_for(
+                self._wait_for_turn(minion_id, channel_id, urgency),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            return False
+    
+    def request_turn_future(
+        self,
+        minion_id: str,
+        channel_id: str,
+        urgency: float = 0.5
+    ) -> asyncio.Future:
+        """
+        Queue a turn request and return a future resolved when it is granted
+        
+        Cancel the future to withdraw the request. Cooldown is not applied
+        to queued requests; a queued grant implies the channel was busy.
+        """
+        grant = asyncio.get_running_loop().create_future()
+        
+        if self._try_grant(minion_id, channel_id):
+            grant.set_result(True)
+            return grant
+        
+        now = time.monotonic()
+        request = TurnRequest(minion_id, channel_id, urgency, enqueued_at=now, grant=grant)
+        heapq.heappush(
+            self.turn_queue[channel_id],
+            (-(urgency - self.aging_rate * now), next(self._sequence), request)
+        )
+        
+        # A free channel may still refuse due to cooldown; retry once it ends
+        if channel_id not in self.current_speakers:
+            asyncio.get_running_loop().call_later(
+                self._cooldown_remaining(minion_id, channel_id),
+                self._grant_next, channel_id
+            )
+        
+        return grant
+    
+    async def _wait_for_turn(self, minion_id: str, channel_id: str, urgency: float) -> bool:
+        """Wait in the channel's queue until the turn is granted"""
+        grant = self.request_turn_future(minion_id, channel_id, urgency)
+        try:
+            return await grant
+        except asyncio.CancelledError:
+            if grant.done() and not grant.cancelled():
+                # Granted just as we gave up; hand the turn on
+                self.release_turn(minion_id, channel_id)
+            else:
+                grant.cancel()
+            raise
+    
+    def _try_grant(self, minion_id: str, channel_id: str) -> bool:
+        """Grant the turn immediately if the channel is free"""
         # Check if someone else is currently speaking
         current_speaker = self.current_speakers.get(channel_id)
         if current_speaker and current_speaker != minion_id:
-            # Add to queue
-            request = TurnRequest(minion_id, channel_id, urgency)
-            self.turn_queue[channel_id].append(request)
             return False
         
         # Check cooldown
@@ -75,36 +177,82 @@ class TurnTakingEngine:
         """Release speaking turn in a channel"""
         if self.current_speakers.get(channel_id) == minion_id:
             del self.current_speakers[channel_id]
-            
-            # Process queue
-            if self.turn_queue[channel_id]:
-                # Sort by urgency
-                self.turn_queue[channel_id].sort(key=lambda x: x.urgency, reverse=True)
-                # Grant to next in line
-                next_request = self.turn_queue[channel_id].pop(0)
-                self.current_speakers[channel_id] = next_request.minion_id
+            self._grant_next(channel_id)
     
-    def _check_cooldown(self, minion_id: str, channel_id: str) -> bool:
-        """Check if Minion has waited enough since last speaking"""
-        recent = self.recent_speakers[channel_id]
-        now = datetime.now()
+    def _grant_next(self, channel_id: str):
+        """Grant the turn to the highest-priority live request"""
+        if channel_id in self.current_speakers:
+            return
         
-        # Clean old entries
-        self.recent_speakers[channel_id] = [
-            (mid, ts) for mid, ts in recent 
-            if (now - ts).total_seconds() < 60
-        ]
+        queue = self.turn_queue.get(channel_id)
+        deferred = []
         
-        # Check cooldown
-        for mid, ts in self.recent_speakers[channel_id]:
-            if mid == minion_id and (now - ts).total_seconds() < self.cooldown_seconds:
-                return False
+        while queue:
+            entry = heapq.heappop(queue)
+            request = entry[2]
+            if request.grant.done():
+                continue  # Withdrawn or timed out
+            
+            if not self._check_cooldown(request.minion_id, channel_id):
+                deferred.append(entry)
+                continue
+            
+            self.current_speakers[channel_id] = request.minion_id
+            self._record_speaker(request.minion_id, channel_id)
+            request.grant.set_result(True)
+            break
         
-        return True
+        for entry in deferred:
+            heapq.heappush(queue, entry)
+        
+        # Only cooling-down requests left: retry when the first cooldown ends
+        if deferred and channel_id not in self.current_speakers:
+            delay = min(self._cooldown_remaining(entry[2].minion_id, channel_id) for entry in deferred)
+            asyncio.get_running_loop().call_later(delay, self._grant_next, channel_id)
+        
+        if queue is not None and not queue:
+            del self.turn_queue[channel_id]
+    
+    def queue_depth(self, channel_id: str) -> int:
+        """Number of requests waiting for a channel (including withdrawn ones not yet popped)"""
+        return len(self.turn_queue.get(channel_id, ()))
+    
+    def _cooldown_remaining(self, minion_id: str, channel_id: str) -> float:
+        """Seconds until a Minion may speak again in a channel"""
+        last = self.last_spoke.get((channel_id, minion_id))
+        if last is None:
+            return 0.0
+        return max(0.0, self.cooldown_seconds - (time.monotonic() - last))
+    
+    def _check_cooldown(self, minion_id: str, channel_id: str) -> bool:
+        """Check if Minion has waited enough since last speaking"""
+        return self._cooldown_remaining(minion_id, channel_id) == 0.0
     
     def _record_speaker(self, minion_id: str, channel_id: str):
         """Record that a Minion spoke"""
-        self.recent_speakers[channel_id].append((minion_id, datetime.now()))
+        now = time.monotonic()
+        self.last_spoke[(channel_id, minion_id)] = now
+        if len(self.last_spoke) >= self._sweep_at:
+            self._sweep_last_spoke(now)
+    
+    def _sweep_last_spoke(self, now: float):
+        """Drop speakers whose cooldown has ended (amortized O(1) per record)"""
+        horizon = now - self.cooldown_seconds
+        self.last_spoke = {key: spoke for key, spoke in self.last_spoke.items() if spoke > horizon}
+        self._sweep_at = max(64, 2 * len(self.last_spoke))
+    
+    def forget_channel(self, channel_id: str):
+        """Drop the speaking history of a deleted channel"""
+        self.last_spoke = {key: spoke for key, spoke in self.last_spoke.items() if key[0] != channel_id}
+    
+    def forget_minion(self, minion_id: str):
+        """Drop the speaking history of a despawned Minion"""
+        self.last_spoke = {key: spoke for key, spoke in self.last_spoke.items() if key[1] != minion_id}
+
+
+def new_message_id() -> str:
+    """Canonical ID assigned to a message where it enters the system"""
+    return f"msg_{uuid.uuid4().hex}"
 
 
 @dataclass
@@ -115,26 +263,187 @@ class ConversationalMessage:
     content: str
     personality_hints: Optional[Dict[str, Any]] = None
     timestamp: datetime = field(default_factory=datetime.now)
+    message_id: str = field(default_factory=new_message_id)
+    analysis: Optional[TextAnalysis] = field(default=None, repr=False, compare=False)
+    
+    def get_analysis(self) -> TextAnalysis:
+        """Tokenize and lexicon-match the content once, caching the result"""
+        if self.analysis is None:
+            self.analysis = DEFAULT_LEXICON.analyze(self.content)
+        return self.analysis
+    
+    def to_wire(self) -> Dict[str, Any]:
+        """Serializable form for a message transport"""
+        return {
+            "message_id": self.message_id,
+            "sender": self.sender,
+            "channel": self.channel,
+            "content": self.content,
+            "personality_hints": self.personality_hints,
+            "timestamp": self.timestamp.isoformat()
+        }
+    
+    @classmethod
+    def from_wire(cls, data: Dict[str, Any]) -> "ConversationalMessage":
+        """Rebuild a message received from a transport"""
+        return cls(
+            sender=data["sender"],
+            channel=data["channel"],
+            content=data["content"],
+            personality_hints=data.get("personality_hints"),
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            message_id=data["message_id"]
+        )
 
 
 class MessageRouter:
-    """Routes messages between Minions"""
+    """
+    Routes messages between Minions
     
-    def __init__(self):
-        self.subscribers: Dict[str, List[Callable]] = defaultdict(list)
+    Each subscriber gets its own bounded queue and worker (see
+    delivery.Subscription), so routing only enqueues and a slow
+    subscriber cannot stall senders or other subscribers.
+    
+    Subscriptions may use wildcard patterns over hierarchical channel
+    names (see channel_trie). The subscribers matching a channel are
+    resolved once and cached until a subscription change affects them.
     
-    def subscribe(self, channel: str, callback: Callable):
-        """Subscribe to messages on a channel"""
-        self.subscribers[channel].append(callback)
+    With a transport attached, routed messages go through the transport
+    and every node delivers them to its local subscribers in transport
+    order; without one, routing is purely local.
+    
+    Ingress hooks see every message routed from this node before it is
+    queued anywhere, so consumers that must not lose messages (such as
+    persistence) do not depend on a droppable subscription.
+    """
+    
+    def __init__(
+        self,
+        max_queue: int = 100,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        slow_lag_seconds: float = 5.0
+    ):
+        """
+        Initialize the router
+        
+        Args:
+            max_queue: Default per-subscriber queue size
+            overflow_policy: Default overflow policy
+            slow_lag_seconds: Lag beyond which a subscriber is isolated
+        """
+        self.max_queue = max_queue
+        self.overflow_policy = overflow_policy
+        self.slow_lag_seconds = slow_lag_seconds
+        self.subscribers: Dict[str, List[Subscription]] = defaultdict(list)  # channel or pattern -> subscriptions
+        self._patterns = ChannelTrie()
+        self._route_cache: Dict[str, List[Subscription]] = {}
+        self.transport: Optional[Transport] = None
+        self.ingress_hooks: List[Callable] = []
+    
+    def add_ingress_hook(self, hook: Callable):
+        """Call a hook with every message routed from this node, before delivery"""
+        self.ingress_hooks.append(hook)
+    
+    async def attach_transport(self, transport: Transport):
+        """Route messages through a transport shared with other nodes"""
+        await transport.subscribe(CHAT_TOPIC, self._on_transport_message)
+        self.transport = transport
+    
+    async def _on_transport_message(self, payload: Dict[str, Any]):
+        await self.deliver(ConversationalMessage.from_wire(payload))
+    
+    def _invalidate(self, channel: str):
+        """Drop cached routes a subscription change could affect"""
+        if is_channel_pattern(channel):
+            self._route_cache.clear()
+        else:
+            self._route_cache.pop(channel, None)
+    
+    def resolve(self, channel: str) -> List[Subscription]:
+        """Subscriptions matching a concrete channel (exact and pattern)"""
+        subscriptions = self._route_cache.get(channel)
+        if subscriptions is None:
+            subscriptions = list(self.subscribers.get(channel, []))
+            if len(self._patterns):
+                subscriptions.extend(self._patterns.match(channel))
+            self._route_cache[channel] = subscriptions
+        return subscriptions
+    
+    def subscribe(
+        self,
+        channel: str,
+        callback: Callable,
+        max_queue: Optional[int] = None,
+        overflow_policy: Optional[OverflowPolicy] = None,
+        coalesce_key: Optional[Callable[[Any], Any]] = None
+    ) -> Subscription:
+        """Subscribe to messages on a channel or wildcard channel pattern"""
+        subscription = Subscription(
+            channel,
+            callback,
+            max_queue=max_queue or self.max_queue,
+            overflow_policy=overflow_policy or self.overflow_policy,
+            coalesce_key=coalesce_key,
+            slow_lag_seconds=self.slow_lag_seconds
+        )
+        if is_channel_pattern(channel):
+            self._patterns.add(channel, subscription)
+        self.subscribers[channel].append(subscription)
+        self._invalidate(channel)
+        return subscription
+    
+    def unsubscribe(self, channel: str, callback: Callable):
+        """Remove a callback's subscription to a channel or pattern"""
+        for subscription in list(self.subscribers.get(channel, [])):
+            if subscription.callback == callback:
+                subscription.close()
+                self.subscribers[channel].remove(subscription)
+                if is_channel_pattern(channel):
+                    self._patterns.remove(channel, subscription)
+        self._invalidate(channel)
+    
+    def clear_channel(self, channel: str) -> bool:
+        """Remove every subscription to a channel or pattern"""
+        subscriptions = self.subscribers.pop(channel, None)
+        for subscription in subscriptions or []:
+            subscription.close()
+            if is_channel_pattern(channel):
+                self._patterns.remove(channel, subscription)
+        self._invalidate(channel)
+        return subscriptions is not None
     
     async def route(self, message: ConversationalMessage):
-        """Route a message to all subscribers"""
-        callbacks = self.subscribers.get(message.channel, [])
+        """Send a message to every subscriber matching its channel, on every node"""
+        for hook in self.ingress_hooks:
+            try:
+                result = hook(message)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Ingress hook failed for message {message.message_id}: {e}")
         
-        # Notify all subscribers asynchronously
-        tasks = [callback(message) for callback in callbacks]
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        if self.transport is not None:
+            await self.transport.publish(CHAT_TOPIC, message.to_wire())
+        else:
+            await self.deliver(message)
+    
+    async def deliver(self, message: ConversationalMessage):
+        """Queue a message for every local subscriber matching its channel"""
+        # Offered concurrently, so a BLOCK subscription waiting for room
+        # holds up neither the other subscribers nor the rest of the list
+        subscriptions = self.resolve(message.channel)
+        if len(subscriptions) == 1:
+            await subscriptions[0].offer(message)
+        elif subscriptions:
+            await asyncio.gather(*(subscription.offer(message) for subscription in subscriptions))
+    
+    def get_stats(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Per-subscriber delivery and lag metrics by channel"""
+        return {
+            channel: [subscription.get_stats() for subscription in subscriptions]
+            for channel, subscriptions in self.subscribers.items()
+            if subscriptions
+        }
 
 
 class ConversationalLayer:
@@ -149,21 +458,30 @@ class ConversationalLayer:
         from_minion: str,
         to_channel: str,
         message: str,
-        personality_modifiers: Optional[Dict[str, Any]] = None
+        personality_modifiers: Optional[Dict[str, Any]] = None,
+        urgency: float = 0.5,
+        turn_timeout: Optional[float] = None
     ) -> bool:
         """
         Send a conversational message with personality
         
+        Args:
+            from_minion: Sending Minion
+            to_channel: Target channel
+            message: Message content
+            personality_modifiers: Personality hints for the message
+            urgency: Turn request urgency (0.0 to 1.0)
+            turn_timeout: Seconds to wait in the turn queue; None fails fast
+        
         Returns:
             True if message sent, False if turn denied
         """
         # Apply turn-taking logic
         can_speak = await self.turn_taking_engine.request_turn(
-            from_minion, to_channel
+            from_minion, to_channel, urgency=urgency, timeout=turn_timeout
         )
         
         if not can_speak:
-            # Could queue or wait
             return False
         
         try:
@@ -187,20 +505,48 @@ class InterMinionCommunicationSystem:
     Comprehensive inter-Minion communication framework
     
     Provides multiple layers of communication for different needs.
+    
+    Given a transport (see transport.py), the conversational, event and
+    RPC layers are carried across processes once start() is awaited;
+    otherwise all communication stays within this process.
     """
     
-    def __init__(self):
+    def __init__(self, transport: Optional[Transport] = None):
         # Layer 1: Conversational (AeroChat style)
         self.conversational_layer = ConversationalLayer()
         
-        # Layer 2: Structured Data Exchange (simplified for now)
-        self.data_exchange = {}  # Will implement MessageBus
+        # Layer 2: Structured Data Exchange
+        self.data_exchange = MessageBus()
         
         # Layer 3: Event-Driven Notifications
-        self.event_subscribers: Dict[str, List[Callable]] = defaultdict(list)
+        self.events = EventDispatcher()
+        self.event_subscribers = self.events.subscribers
         
         # Layer 4: Direct RPC (for time-critical)
-        self.rpc_handlers: Dict[str, Callable] = {}
+        self.rpc = RpcDispatcher()
+        self.rpc_handlers = self.rpc.handlers
+        
+        self.transport = transport
+        
+        # Channels created as direct messages (ChannelType.DIRECT)
+        self.direct_channels: Set[str] = set()
+    
+    async def start(self):
+        """Connect the transport and route the layers through it"""
+        if not self.transport:
+            return
+        await self.transport.start()
+        await self.conversational_layer.message_router.attach_transport(self.transport)
+        await self.events.attach_transport(self.transport)
+        await self.rpc.attach_transport(self.transport)
+        logger.info(f"Communication system joined {type(self.transport).__name__} as {self.transport.node_id}")
+    
+    async def close(self):
+        """Stop background dispatch and disconnect the transport"""
+        self.events.close()
+        await self.data_exchange.close()
+        if self.transport:
+            await self.transport.close()
     
     async def send_conversational_message(
         self,
@@ -214,18 +560,98 @@ class InterMinionCommunicationSystem:
             from_minion, to_channel, message, **kwargs
         )
     
-    def subscribe_to_channel(self, channel: str, callback: Callable):
-        """Subscribe to messages on a channel"""
-        self.conversational_layer.message_router.subscribe(channel, callback)
+    async def publish_data(
+        self,
+        topic: str,
+        payload: Dict[str, Any],
+        sender: str,
+        **kwargs
+    ) -> BusEnvelope:
+        """
+        Publish structured data on the message bus
+        
+        Keyword arguments (schema, key, artifact) are passed to
+        MessageBus.publish.
+        """
+        return await self.data_exchange.publish(topic, payload, sender, **kwargs)
+    
+    def subscribe_to_data(
+        self,
+        topic: str,
+        consumer_id: str,
+        handler: BusHandler,
+        manual_ack: bool = False
+    ):
+        """Consume structured data from a message bus topic"""
+        self.data_exchange.subscribe(topic, consumer_id, handler, manual_ack=manual_ack)
+    
+    def register_rpc_handler(
+        self,
+        minion_id: str,
+        method: str,
+        handler: RpcHandlerFunc,
+        max_concurrency: Optional[int] = None
+    ):
+        """Expose a Minion method for direct RPC"""
+        self.rpc.register(minion_id, method, handler, max_concurrency)
+    
+    def unregister_rpc_handlers(self, minion_id: str):
+        """Remove every RPC method of a Minion"""
+        self.rpc.unregister(minion_id)
+    
+    def forget_minion(self, minion_id: str):
+        """Drop a despawned Minion's turn-taking history"""
+        self.conversational_layer.turn_taking_engine.forget_minion(minion_id)
+    
+    async def call(
+        self,
+        minion_id: str,
+        method: str,
+        payload: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
+    ) -> Any:
+        """Call a Minion method directly, bypassing chat"""
+        return await self.rpc.call(minion_id, method, payload, timeout)
+    
+    async def call_many(self, calls: List[RpcCall], timeout: Optional[float] = None) -> List[Any]:
+        """Issue a batch of RPC calls concurrently"""
+        return await self.rpc.call_many(calls, timeout)
+    
+    def subscribe_to_channel(self, channel: str, callback: Callable, **kwargs) -> Subscription:
+        """
+        Subscribe to messages on a channel
+        
+        Keyword arguments (max_queue, overflow_policy, coalesce_key) are
+        passed to MessageRouter.subscribe.
+        """
+        return self.conversational_layer.message_router.subscribe(channel, callback, **kwargs)
+    
+    def add_ingress_hook(self, hook: Callable):
+        """Call a hook with every message routed from this node (see MessageRouter)"""
+        self.conversational_layer.message_router.add_ingress_hook(hook)
+    
+    def unsubscribe_from_channel(self, channel: str, callback: Callable):
+        """Stop delivering a channel's messages to a callback"""
+        self.conversational_layer.message_router.unsubscribe(channel, callback)
+    
+    def get_delivery_stats(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Per-subscriber queue depth, lag and drop metrics by channel"""
+        return self.conversational_layer.message_router.get_stats()
 
     # Methods required by ChannelService
-    def create_channel(self, channel_id: str):
+    def create_channel(self, channel_id: str, channel_type: Optional[str] = None):
         """
         Recognize a new channel in the communication system.
-        Currently, channels are implicitly handled by subscriptions in MessageRouter.
+        Currently, channels are implicitly handled by subscriptions in MessageRouter;
+        only direct-message channels are remembered (see is_direct_channel).
         """
         logger.debug(f"CommunicationSystem: Channel '{channel_id}' recognized/created.")
-        # No specific action needed for MessageRouter if channels are implicit.
+        if channel_type == ChannelType.DIRECT.value:
+            self.direct_channels.add(channel_id)
+    
+    def is_direct_channel(self, channel_id: str) -> bool:
+        """Whether a channel was created as a direct-message channel"""
+        return channel_id in self.direct_channels
 
     def add_channel_member(self, channel_id: str, member_id: str):
         """
@@ -247,8 +673,9 @@ class InterMinionCommunicationSystem:
         """
         Clean up a channel from the communication system, e.g., clear subscribers.
         """
-        if channel_id in self.conversational_layer.message_router.subscribers:
-            del self.conversational_layer.message_router.subscribers[channel_id]
+        self.direct_channels.discard(channel_id)
+        self.conversational_layer.turn_taking_engine.forget_channel(channel_id)
+        if self.conversational_layer.message_router.clear_channel(channel_id):
             logger.info(f"CommunicationSystem: Cleared subscribers for deleted channel '{channel_id}'.")
         else:
             logger.debug(f"CommunicationSystem: No subscribers to clear for non-existent/inactive channel '{channel_id}'.")
@@ -258,28 +685,40 @@ class InterMinionCommunicationSystem:
         channel_id: str,
         sender_id: str,
         content: str,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        message_id: Optional[str] = None,
+        timestamp: Optional[datetime] = None
     ):
         """
         Broadcasts a message directly via the MessageRouter, bypassing turn-taking.
         Suitable for system messages or when turn-taking is handled externally.
+        Pass the message_id (and timestamp) assigned at ingress so subscribers
+        can recognize a message they have already handled.
         """
         logger.debug(f"CommunicationSystem: Broadcasting message from '{sender_id}' to channel '{channel_id}'.")
         msg = ConversationalMessage(
             sender=sender_id,
             channel=channel_id,
             content=content,
-            personality_hints=metadata if metadata else {} # Or map specific metadata keys
+            personality_hints=metadata if metadata else {}, # Or map specific metadata keys
+            timestamp=timestamp or datetime.now(),
+            message_id=message_id or new_message_id()
         )
         await self.conversational_layer.message_router.route(msg)
     
     async def emit_event(self, event_type: str, data: Any):
-        """Emit an event to all subscribers"""
-        callbacks = self.event_subscribers.get(event_type, [])
-        tasks = [callback(data) for callback in callbacks]
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
-    
-    def subscribe_to_event(self, event_type: str, callback: Callable):
-        """Subscribe to an event type"""
-        self.event_subscribers[event_type].append(callback)
+        """Emit an event to all subscribers (returns without waiting for them)"""
+        await self.events.publish(event_type, data)
+    
+    def subscribe_to_event(self, event_type: str, callback: Callable, priority: int = 0):
+        """Subscribe to an event type; higher priority handlers run first"""
+        self.events.subscribe(event_type, callback, priority)
+    
+    def coalesce_events(
+        self,
+        event_type: str,
+        window: float,
+        key: Optional[Callable[[Any], Any]] = None
+    ):
+        """Deliver only the latest same-key event of a type per window"""
+        self.events.set_coalescing(event_type, window, key)
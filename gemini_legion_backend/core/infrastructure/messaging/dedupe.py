@@ -0,0 +1,54 @@
+"""
+Message Deduplication
+
+Bounded memory of recently seen message IDs, used to drop a message
+that reaches the same sink (persistence, broadcast) more than once.
+"""
+
+from collections import OrderedDict
+
+
+class RecentIdSet:
+    """
+    Exact set of the most recent capacity IDs
+
+    Insertion-ordered; once full, the oldest ID is forgotten. Both add
+    and membership are O(1).
+    """
+
+    def __init__(self, capacity: int = 10000):
+        """
+        Initialize the set
+
+        Args:
+            capacity: Number of most recent IDs remembered
+        """
+        self.capacity = max(1, capacity)
+        self._ids: "OrderedDict[str, None]" = OrderedDict()
+        self.duplicates = 0
+
+    def __contains__(self, message_id: str) -> bool:
+        return message_id in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, message_id: str) -> bool:
+        """
+        Remember an ID
+
+        Returns:
+            True if the ID is new, False if it was seen recently
+        """
+        if message_id in self._ids:
+            self.duplicates += 1
+            return False
+
+        self._ids[message_id] = None
+        if len(self._ids) > self.capacity:
+            self._ids.popitem(last=False)
+        return True
+
+    def discard(self, message_id: str):
+        """Forget an ID (e.g. after a failed write, so a retry is accepted)"""
+        self._ids.pop(message_id, None)
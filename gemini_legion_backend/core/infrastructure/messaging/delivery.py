@@ -0,0 +1,233 @@
+"""
+Per-Subscriber Delivery Queues
+
+Gives every channel subscriber its own bounded queue and worker task so
+that a slow subscriber only delays itself, never the sender or the
+other subscribers of the channel.
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+from collections import deque
+import asyncio
+import logging
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+class OverflowPolicy(Enum):
+    """What to do when a subscriber's queue is full"""
+    DROP_OLDEST = "drop_oldest"  # Discard the oldest queued message
+    BLOCK = "block"  # Make the sender wait for space
+    COALESCE = "coalesce"  # Supersede the queued message with the same key
+
+
+@dataclass
+class SubscriberStats:
+    """Delivery metrics for one subscriber"""
+    delivered: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    failures: int = 0
+    max_lag_ms: float = 0.0
+    last_lag_ms: float = 0.0
+    isolations: int = 0
+
+
+class Subscription:
+    """
+    A subscriber callback with its own bounded queue and worker
+
+    A subscriber whose oldest queued message is older than
+    slow_lag_seconds is isolated: senders stop blocking on it and its
+    overflow policy degrades to drop-oldest until it catches up.
+
+    Dropped messages are counted in stats.dropped and logged: once when
+    a subscriber starts dropping, and with the total once it catches up.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        callback: Callable,
+        max_queue: int = 100,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        coalesce_key: Optional[Callable[[Any], Any]] = None,
+        slow_lag_seconds: float = 5.0
+    ):
+        """
+        Initialize the subscription
+
+        Args:
+            channel: Channel subscribed to
+            callback: Sync or async callable receiving each message
+            max_queue: Maximum queued messages
+            overflow_policy: Behaviour when the queue is full
+            coalesce_key: Key for COALESCE (defaults to the message sender)
+            slow_lag_seconds: Queue age beyond which the subscriber is isolated
+        """
+        self.channel = channel
+        self.callback = callback
+        self.max_queue = max(1, max_queue)
+        self.overflow_policy = overflow_policy
+        self.coalesce_key = coalesce_key or (lambda message: getattr(message, "sender", None))
+        self.slow_lag_seconds = slow_lag_seconds
+
+        self.stats = SubscriberStats()
+        self.isolated = False
+        self._unreported_drops = 0  # Drops since the subscriber last caught up
+
+        self._queue: Deque[Tuple[float, Any]] = deque()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._worker: Optional[asyncio.Task] = None
+
+    @property
+    def name(self) -> str:
+        """Readable name of the subscriber callback"""
+        return getattr(self.callback, "__qualname__", repr(self.callback))
+
+    @property
+    def queue_depth(self) -> int:
+        """Messages waiting for delivery"""
+        return len(self._queue)
+
+    @property
+    def lag_seconds(self) -> float:
+        """Age of the oldest undelivered message"""
+        if not self._queue:
+            return 0.0
+        return time.monotonic() - self._queue[0][0]
+
+    async def offer(self, message: Any):
+        """Queue a message for delivery, applying the overflow policy"""
+        self._ensure_worker()
+        self._check_isolation()
+
+        if len(self._queue) >= self.max_queue:
+            policy = self.overflow_policy
+            if self.isolated and policy == OverflowPolicy.BLOCK:
+                policy = OverflowPolicy.DROP_OLDEST
+
+            if policy == OverflowPolicy.BLOCK:
+                while len(self._queue) >= self.max_queue:
+                    self._not_full.clear()
+                    try:
+                        await asyncio.wait_for(self._not_full.wait(), timeout=self.slow_lag_seconds)
+                    except asyncio.TimeoutError:
+                        self._check_isolation()
+                        if self.isolated:
+                            self._drop_oldest()
+            elif policy == OverflowPolicy.COALESCE:
+                if not self._coalesce(message):
+                    self._drop_oldest()
+            else:
+                self._drop_oldest()
+
+        self._queue.append((time.monotonic(), message))
+        self._not_empty.set()
+
+    def _drop_oldest(self):
+        """Discard the oldest queued message"""
+        if self._queue:
+            self._queue.popleft()
+            self.stats.dropped += 1
+            self._unreported_drops += 1
+            if self._unreported_drops == 1:
+                logger.warning(
+                    f"Subscriber {self.name} on {self.channel} is full "
+                    f"({self.max_queue} queued), dropping its oldest messages"
+                )
+
+    def _coalesce(self, message: Any) -> bool:
+        """Remove the newest queued message sharing the message's key"""
+        key = self.coalesce_key(message)
+        for index in range(len(self._queue) - 1, -1, -1):
+            if self.coalesce_key(self._queue[index][1]) == key:
+                del self._queue[index]
+                self.stats.coalesced += 1
+                return True
+        return False
+
+    def _check_isolation(self):
+        """Isolate the subscriber while it lags, restore it once caught up"""
+        lag = self.lag_seconds
+        if not self.isolated and lag > self.slow_lag_seconds:
+            self.isolated = True
+            self.stats.isolations += 1
+            logger.warning(
+                f"Isolating slow subscriber {self.name} on {self.channel} "
+                f"(lag {lag:.1f}s, {len(self._queue)} queued)"
+            )
+        elif self.isolated and not self._queue:
+            self.isolated = False
+            logger.info(f"Subscriber {self.name} on {self.channel} caught up")
+
+        if self._unreported_drops and not self._queue:
+            logger.warning(
+                f"Subscriber {self.name} on {self.channel} caught up after "
+                f"dropping {self._unreported_drops} messages"
+            )
+            self._unreported_drops = 0
+
+    def _ensure_worker(self):
+        """Start the delivery worker on first use"""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def _run(self):
+        """Deliver queued messages one at a time"""
+        while True:
+            try:
+                while not self._queue:
+                    self._not_empty.clear()
+                    await self._not_empty.wait()
+
+                enqueued_at, message = self._queue.popleft()
+                self._not_full.set()
+
+                lag_ms = (time.monotonic() - enqueued_at) * 1000
+                self.stats.last_lag_ms = lag_ms
+                self.stats.max_lag_ms = max(self.stats.max_lag_ms, lag_ms)
+
+                try:
+                    result = self.callback(message)
+                    if asyncio.iscoroutine(result):
+                        await result
+                    self.stats.delivered += 1
+                except Exception as e:
+                    self.stats.failures += 1
+                    logger.error(f"Subscriber {self.name} on {self.channel} failed: {e}")
+
+                self._check_isolation()
+
+            except asyncio.CancelledError:
+                break
+
+    def close(self):
+        """Stop the worker, discarding undelivered messages"""
+        if self._worker and not self._worker.done():
+            self._worker.cancel()
+        self._queue.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Delivery metrics for monitoring"""
+        return {
+            "subscriber": self.name,
+            "channel": self.channel,
+            "policy": self.overflow_policy.value,
+            "queue_depth": len(self._queue),
+            "lag_ms": self.lag_seconds * 1000,
+            "isolated": self.isolated,
+            "delivered": self.stats.delivered,
+            "dropped": self.stats.dropped,
+            "coalesced": self.stats.coalesced,
+            "failures": self.stats.failures,
+            "max_lag_ms": self.stats.max_lag_ms,
+            "last_lag_ms": self.stats.last_lag_ms,
+            "isolations": self.stats.isolations
+        }
@@ -0,0 +1,218 @@
+"""
+Event Dispatch
+
+Layer 3 of the inter-Minion communication system: fire-and-forget
+event notifications. Emitters enqueue and return immediately; a
+background worker runs the handlers, so an emitter's latency never
+includes its subscribers.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from collections import defaultdict, deque
+import asyncio
+import itertools
+import logging
+
+from .transport import Transport, EVENTS_TOPIC
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EventHandler:
+    """A subscriber callback and its priority"""
+    callback: Callable
+    priority: int = 0  # Higher runs first
+    order: int = 0  # Subscription order, breaks priority ties
+
+    @property
+    def name(self) -> str:
+        return getattr(self.callback, "__qualname__", repr(self.callback))
+
+
+@dataclass
+class DeadLetter:
+    """An event a handler failed to process"""
+    event_type: str
+    data: Any
+    handler: str
+    error: str
+    timestamp: datetime = field(default_factory=datetime.now)
+
+
+class EventDispatcher:
+    """
+    Background event queue with coalescing, priorities and dead letters
+
+    Handlers of an event type run one after another, highest priority
+    first. Event types configured with a coalescing window hold an event
+    for that window; further events with the same key emitted meanwhile
+    replace it, so only the latest (e.g. a Minion's newest status) is
+    dispatched. A handler that raises does not stop the remaining
+    handlers; the failure is recorded in the dead-letter list.
+
+    With a transport attached, published events reach the dispatchers
+    of every node; coalescing then happens on the receiving side.
+    """
+
+    def __init__(self, dead_letter_size: int = 1000):
+        """
+        Initialize the dispatcher
+
+        Args:
+            dead_letter_size: Failed deliveries kept for inspection
+        """
+        self.subscribers: Dict[str, List[EventHandler]] = defaultdict(list)
+        self.dead_letters: Deque[DeadLetter] = deque(maxlen=dead_letter_size)
+
+        self._coalescing: Dict[str, Tuple[float, Callable[[Any], Any]]] = {}  # event_type -> (window, key fn)
+        self._held: Dict[Tuple[str, Any], Any] = {}  # (event_type, key) -> latest data
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        self._order = itertools.count()
+        self.transport: Optional[Transport] = None
+
+        self.stats = {
+            "emitted": 0,
+            "dispatched": 0,
+            "coalesced": 0,
+            "handler_failures": 0
+        }
+
+    def subscribe(self, event_type: str, callback: Callable, priority: int = 0):
+        """
+        Subscribe to an event type
+
+        Args:
+            event_type: Event type to receive
+            callback: Sync or async callable receiving the event data
+            priority: Handlers with higher priority run first
+        """
+        handlers = self.subscribers[event_type]
+        handlers.append(EventHandler(callback, priority, next(self._order)))
+        handlers.sort(key=lambda handler: (-handler.priority, handler.order))
+
+    def unsubscribe(self, event_type: str, callback: Callable):
+        """Stop delivering an event type to a callback"""
+        handlers = self.subscribers.get(event_type)
+        if handlers:
+            handlers[:] = [handler for handler in handlers if handler.callback != callback]
+
+    def set_coalescing(
+        self,
+        event_type: str,
+        window: float,
+        key: Optional[Callable[[Any], Any]] = None
+    ):
+        """
+        Coalesce same-key events of a type within a window
+
+        Args:
+            event_type: Event type to coalesce
+            window: Seconds an event is held waiting for newer ones
+            key: Key function over the event data (defaults to data["minion_id"])
+        """
+        self._coalescing[event_type] = (
+            window,
+            key or (lambda data: data.get("minion_id") if isinstance(data, dict) else None)
+        )
+
+    async def attach_transport(self, transport: Transport):
+        """Share events with the other nodes on a transport"""
+        await transport.subscribe(EVENTS_TOPIC, self._on_transport_event)
+        self.transport = transport
+
+    async def _on_transport_event(self, payload: Dict[str, Any]):
+        self.emit(payload["event_type"], payload["data"])
+
+    async def publish(self, event_type: str, data: Any):
+        """Emit an event on every node (locally without a transport)"""
+        if self.transport is not None:
+            await self.transport.publish(EVENTS_TOPIC, {"event_type": event_type, "data": data})
+        else:
+            self.emit(event_type, data)
+
+    def emit(self, event_type: str, data: Any):
+        """Queue an event for local dispatch without waiting for its handlers"""
+        self.stats["emitted"] += 1
+        self._ensure_worker()
+
+        coalescing = self._coalescing.get(event_type)
+        if coalescing is not None:
+            window, key_fn = coalescing
+            key = key_fn(data)
+            if key is not None:
+                held_key = (event_type, key)
+                if held_key in self._held:
+                    self.stats["coalesced"] += 1
+                else:
+                    asyncio.get_running_loop().call_later(window, self._release, held_key)
+                self._held[held_key] = data
+                return
+
+        self._queue.put_nowait((event_type, data))
+
+    def _release(self, held_key: Tuple[str, Any]):
+        """Queue the latest event held for a coalescing key"""
+        if held_key in self._held:
+            self._queue.put_nowait((held_key[0], self._held.pop(held_key)))
+
+    def _ensure_worker(self):
+        """Start the dispatch worker on first use"""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def _run(self):
+        """Dispatch queued events one at a time"""
+        while True:
+            try:
+                event_type, data = await self._queue.get()
+                try:
+                    await self._dispatch(event_type, data)
+                finally:
+                    self._queue.task_done()
+            except asyncio.CancelledError:
+                break
+
+    async def _dispatch(self, event_type: str, data: Any):
+        """Run an event's handlers in priority order"""
+        for handler in list(self.subscribers.get(event_type, ())):
+            try:
+                result = handler.callback(data)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                self.stats["handler_failures"] += 1
+                self.dead_letters.append(DeadLetter(event_type, data, handler.name, str(e)))
+                logger.error(f"Event handler {handler.name} failed on {event_type}: {e}")
+        self.stats["dispatched"] += 1
+
+    async def drain(self):
+        """Wait until every queued event has been dispatched"""
+        for held_key in list(self._held):
+            self._release(held_key)
+        if self._worker is not None and not self._worker.done():
+            await self._queue.join()
+
+    def close(self):
+        """Stop the worker, discarding undispatched events"""
+        if self._worker and not self._worker.done():
+            self._worker.cancel()
+        self._held.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Dispatch counters and backlog"""
+        return {
+            **self.stats,
+            "queue_depth": self._queue.qsize(),
+            "held": len(self._held),
+            "dead_letters": len(self.dead_letters),
+            "subscribers": {
+                event_type: len(handlers)
+                for event_type, handlers in self.subscribers.items()
+                if handlers
+            }
+        }
@@ -0,0 +1,123 @@
+"""
+Compiled Lexicon Matching
+
+Tokenizes a message and matches every lexicon phrase in a single regex
+pass, so hot-path text heuristics (emotional impact, message priority,
+topic diversity) share one analysis per message instead of each
+scanning the text keyword by keyword.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Set, Tuple
+import re
+
+
+# Minimum length of a word counted as a topic keyword
+KEYWORD_MIN_LENGTH = 4
+
+
+@dataclass
+class TextAnalysis:
+    """Result of analyzing one message against a lexicon"""
+    lowered: str
+    words: List[str]
+    keywords: List[str]
+    matches: Dict[str, Set[str]] = field(default_factory=dict)  # category -> phrases
+    scores: Dict[str, float] = field(default_factory=dict)  # category -> summed weight
+
+    def hit_count(self, category: str) -> int:
+        """Number of distinct phrases of a category found in the message"""
+        return len(self.matches.get(category, ()))
+
+    def score(self, category: str) -> float:
+        """Summed weight of the distinct phrases of a category"""
+        return self.scores.get(category, 0.0)
+
+
+class Lexicon:
+    """
+    Weighted phrase categories compiled into a single alternation regex
+
+    Phrases match on word boundaries, longest first. A phrase may belong
+    to several categories. Any text that is not a phrase is consumed as
+    a plain word by the same pattern, so one scan yields both the word
+    list and the category matches.
+    """
+
+    def __init__(self, categories: Dict[str, Dict[str, float]]):
+        """
+        Compile the lexicon
+
+        Args:
+            categories: Category name -> {phrase: weight}
+        """
+        self.categories = categories
+        self._phrase_table: Dict[str, List[Tuple[str, float]]] = {}
+
+        for category, phrases in categories.items():
+            for phrase, weight in phrases.items():
+                normalized = " ".join(phrase.lower().split())
+                self._phrase_table.setdefault(normalized, []).append((category, weight))
+
+        alternation = "|".join(
+            r"\s+".join(re.escape(part) for part in phrase.split())
+            for phrase in sorted(self._phrase_table, key=len, reverse=True)
+        )
+        self._pattern = re.compile(
+            rf"(\b(?:{alternation})\b)|\w+" if alternation else r"\w+"
+        )
+
+    def analyze(self, text: str) -> TextAnalysis:
+        """
+        Tokenize text and match all lexicon phrases in one pass
+
+        Args:
+            text: Message content
+
+        Returns:
+            Words, topic keywords and per-category matches
+        """
+        lowered = text.lower()
+        words: List[str] = []
+        matches: Dict[str, Set[str]] = {}
+        scores: Dict[str, float] = {}
+
+        for match in self._pattern.finditer(lowered):
+            if match.group(1) is None:
+                words.append(match.group(0))
+                continue
+
+            phrase_words = match.group(1).split()
+            words.extend(phrase_words)
+            phrase = " ".join(phrase_words)
+            for category, weight in self._phrase_table[phrase]:
+                found = matches.setdefault(category, set())
+                if phrase not in found:
+                    found.add(phrase)
+                    scores[category] = scores.get(category, 0.0) + weight
+
+        return TextAnalysis(
+            lowered=lowered,
+            words=words,
+            keywords=[word for word in words if len(word) >= KEYWORD_MIN_LENGTH],
+            matches=matches,
+            scores=scores
+        )
+
+
+# Shared lexicon for the messaging heuristics
+DEFAULT_LEXICON = Lexicon({
+    # Emotional impact of a message on the Minion receiving it
+    "positive": {
+        "praise": 0.3, "good job": 0.3, "excellent": 0.3,
+        "perfect": 0.3, "love it": 0.3, "fuck yea": 0.3
+    },
+    "negative": {
+        "disappointed": 0.3, "wrong": 0.3, "failed": 0.3,
+        "bad": 0.3, "incorrect": 0.3
+    },
+    # Message priority
+    "urgent": {"urgent": 1.0, "asap": 1.0, "immediately": 1.0, "critical": 1.0},
+    "important": {"important": 1.0, "priority": 1.0, "need": 1.0, "needs": 1.0, "needed": 1.0},
+    "casual": {"fyi": 1.0, "casual": 1.0, "chat": 1.0}
+})
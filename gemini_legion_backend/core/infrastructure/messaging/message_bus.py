@@ -0,0 +1,334 @@
+"""
+Structured Message Bus
+
+Layer 2 of the inter-Minion communication system: typed data exchange
+between Minions without round-tripping through natural-language chat.
+Payloads are validated against a registered schema and carried as
+msgpack bytes; large artifacts travel alongside as a read-only
+memoryview so every consumer sees the publisher's buffer without a copy.
+"""
+
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple, Union
+from collections import defaultdict, deque
+import asyncio
+import logging
+import uuid
+import zlib
+
+import msgpack
+
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaValidationError(ValueError):
+    """Raised when a payload does not match its schema"""
+
+
+@dataclass
+class PayloadSchema:
+    """
+    Shape of a structured payload
+
+    Fields map names to a type or tuple of types accepted by isinstance.
+    """
+    name: str
+    fields: Dict[str, Any]
+    optional: Dict[str, Any] = field(default_factory=dict)
+    version: int = 1
+
+    def validate(self, payload: Dict[str, Any]):
+        """Check a payload against the schema"""
+        if not isinstance(payload, dict):
+            raise SchemaValidationError(f"{self.name}: payload must be a dict")
+
+        for name, expected in self.fields.items():
+            if name not in payload:
+                raise SchemaValidationError(f"{self.name}: missing field '{name}'")
+            if not isinstance(payload[name], expected):
+                raise SchemaValidationError(f"{self.name}: field '{name}' has wrong type")
+
+        for name, expected in self.optional.items():
+            if payload.get(name) is not None and not isinstance(payload[name], expected):
+                raise SchemaValidationError(f"{self.name}: field '{name}' has wrong type")
+
+
+@dataclass
+class BusEnvelope:
+    """A published message as seen by consumers"""
+    message_id: str
+    topic: str
+    partition: int
+    offset: int
+    sender: str
+    schema: Optional[str]
+    payload: bytes  # msgpack-encoded
+    artifact: Optional[memoryview] = None
+    timestamp: datetime = field(default_factory=datetime.now)
+    attempt: int = 1
+
+    def decode(self) -> Dict[str, Any]:
+        """Decode the msgpack payload"""
+        return msgpack.unpackb(self.payload, raw=False)
+
+
+BusHandler = Callable[[BusEnvelope], Awaitable[None]]
+
+
+class _Consumer:
+    """A subscriber with one ordered delivery queue per partition"""
+
+    def __init__(self, consumer_id: str, topic: str, handler: BusHandler, manual_ack: bool):
+        self.consumer_id = consumer_id
+        self.topic = topic
+        self.handler = handler
+        self.manual_ack = manual_ack
+        self.queues: Dict[int, asyncio.Queue] = {}
+        self.workers: Dict[int, asyncio.Task] = {}
+        self.pending_acks: Dict[str, asyncio.Event] = {}
+        self.delivered = 0
+        self.redelivered = 0
+
+
+class MessageBus:
+    """
+    Partitioned, schema-checked data bus with at-least-once delivery
+
+    Each topic is split into partitions chosen by hashing the publish
+    key (the sender by default), so messages with the same key stay in
+    order. Every consumer drains each partition with its own worker and
+    does not move past a message until it is acknowledged: either the
+    handler returns (auto-ack) or, with manual_ack, the consumer calls
+    ack(). Unacknowledged or failed deliveries are retried with backoff
+    and moved to the dead-letter list after max_attempts.
+    """
+
+    def __init__(
+        self,
+        default_partitions: int = 4,
+        ack_timeout: float = 30.0,
+        max_attempts: int = 5,
+        retry_backoff: float = 0.5,
+        dead_letter_size: int = 1000
+    ):
+        """
+        Initialize the bus
+
+        Args:
+            default_partitions: Partitions for topics created implicitly
+            ack_timeout: Seconds to wait for a manual ack before redelivery
+            max_attempts: Deliveries before a message is dead-lettered
+            retry_backoff: Base delay between redeliveries (doubles each time)
+            dead_letter_size: Dead-lettered deliveries kept for inspection
+        """
+        self.default_partitions = default_partitions
+        self.ack_timeout = ack_timeout
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+
+        self.schemas: Dict[str, PayloadSchema] = {}
+        self.topics: Dict[str, int] = {}  # topic -> partition count
+        self._offsets: Dict[Tuple[str, int], int] = defaultdict(int)
+        self._consumers: Dict[str, Dict[str, _Consumer]] = defaultdict(dict)  # topic -> consumer_id -> consumer
+        self.dead_letters: Deque[Tuple[str, BusEnvelope, str]] = deque(maxlen=dead_letter_size)
+
+        self.stats = {
+            "published": 0,
+            "delivered": 0,
+            "redelivered": 0,
+            "dead_lettered": 0,
+            "artifact_bytes": 0
+        }
+
+    def register_schema(self, schema: PayloadSchema):
+        """Register a payload schema by name"""
+        self.schemas[schema.name] = schema
+
+    def create_topic(self, topic: str, partitions: Optional[int] = None):
+        """Create a topic with a fixed number of partitions"""
+        if topic not in self.topics:
+            self.topics[topic] = max(1, partitions or self.default_partitions)
+
+    def partition_for(self, topic: str, key: str) -> int:
+        """Partition a key maps to (stable across processes)"""
+        self.create_topic(topic)
+        return zlib.crc32(key.encode("utf-8")) % self.topics[topic]
+
+    async def publish(
+        self,
+        topic: str,
+        payload: Dict[str, Any],
+        sender: str,
+        schema: Optional[str] = None,
+        key: Optional[str] = None,
+        artifact: Optional[Union[bytes, bytearray, memoryview]] = None
+    ) -> BusEnvelope:
+        """
+        Publish a structured payload to a topic
+
+        Args:
+            topic: Topic to publish to
+            payload: msgpack-serializable dict
+            sender: Publishing Minion
+            schema: Name of a registered schema to validate against
+            key: Partitioning key (defaults to sender)
+            artifact: Large binary data handed to consumers without copying
+
+        Returns:
+            The published envelope
+        """
+        if schema is not None:
+            if schema not in self.schemas:
+                raise SchemaValidationError(f"Unknown schema '{schema}'")
+            self.schemas[schema].validate(payload)
+
+        partition = self.partition_for(topic, key or sender)
+        offset = self._offsets[(topic, partition)]
+        self._offsets[(topic, partition)] = offset + 1
+
+        view = None
+        if artifact is not None:
+            view = memoryview(artifact).toreadonly()
+            self.stats["artifact_bytes"] += view.nbytes
+
+        envelope = BusEnvelope(
+            message_id=uuid.uuid4().hex,
+            topic=topic,
+            partition=partition,
+            offset=offset,
+            sender=sender,
+            schema=schema,
+            payload=msgpack.packb(payload, use_bin_type=True),
+            artifact=view
+        )
+        self.stats["published"] += 1
+
+        for consumer in list(self._consumers.get(topic, {}).values()):
+            self._queue_for(consumer, partition).put_nowait(envelope)
+
+        return envelope
+
+    def subscribe(
+        self,
+        topic: str,
+        consumer_id: str,
+        handler: BusHandler,
+        manual_ack: bool = False
+    ):
+        """
+        Consume a topic
+
+        Args:
+            topic: Topic to consume
+            consumer_id: Unique consumer name (e.g. the Minion ID)
+            handler: Async callable receiving each envelope
+            manual_ack: If True, deliveries count only once ack() is called
+        """
+        self.create_topic(topic)
+        self.unsubscribe(topic, consumer_id)
+        self._consumers[topic][consumer_id] = _Consumer(consumer_id, topic, handler, manual_ack)
+
+    def unsubscribe(self, topic: str, consumer_id: str):
+        """Stop consuming a topic"""
+        consumer = self._consumers.get(topic, {}).pop(consumer_id, None)
+        if consumer:
+            for worker in consumer.workers.values():
+                worker.cancel()
+
+    def ack(self, topic: str, consumer_id: str, message_id: str) -> bool:
+        """Acknowledge a manually acked delivery"""
+        consumer = self._consumers.get(topic, {}).get(consumer_id)
+        if not consumer:
+            return False
+        event = consumer.pending_acks.get(message_id)
+        if event is None:
+            return False
+        event.set()
+        return True
+
+    def _queue_for(self, consumer: _Consumer, partition: int) -> asyncio.Queue:
+        """Get a consumer's partition queue, starting its worker"""
+        queue = consumer.queues.get(partition)
+        if queue is None:
+            queue = consumer.queues[partition] = asyncio.Queue()
+            consumer.workers[partition] = asyncio.create_task(
+                self._consume_partition(consumer, queue)
+            )
+        return queue
+
+    async def _consume_partition(self, consumer: _Consumer, queue: asyncio.Queue):
+        """Deliver one partition to one consumer, in order"""
+        while True:
+            try:
+                envelope = await queue.get()
+                await self._deliver(consumer, envelope)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Bus consumer {consumer.consumer_id} on {consumer.topic} failed: {e}")
+
+    async def _deliver(self, consumer: _Consumer, envelope: BusEnvelope):
+        """Deliver until acknowledged or dead-lettered"""
+        last_error = ""
+        for attempt in range(1, self.max_attempts + 1):
+            if attempt > 1:
+                consumer.redelivered += 1
+                self.stats["redelivered"] += 1
+                await asyncio.sleep(self.retry_backoff * (2 ** (attempt - 2)))
+
+            delivery = replace(envelope, attempt=attempt)  # shares payload and artifact
+            acked = asyncio.Event()
+            if consumer.manual_ack:
+                consumer.pending_acks[envelope.message_id] = acked
+
+            try:
+                await consumer.handler(delivery)
+                if consumer.manual_ack:
+                    await asyncio.wait_for(acked.wait(), timeout=self.ack_timeout)
+                consumer.delivered += 1
+                self.stats["delivered"] += 1
+                return
+            except asyncio.TimeoutError:
+                last_error = "ack timeout"
+            except Exception as e:
+                last_error = str(e)
+                logger.warning(
+                    f"Bus delivery of {envelope.message_id} to {consumer.consumer_id} "
+                    f"failed (attempt {attempt}): {e}"
+                )
+            finally:
+                consumer.pending_acks.pop(envelope.message_id, None)
+
+        self.dead_letters.append((consumer.consumer_id, envelope, last_error))
+        self.stats["dead_lettered"] += 1
+        logger.error(
+            f"Dead-lettered {envelope.message_id} on {envelope.topic} for "
+            f"{consumer.consumer_id}: {last_error}"
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Bus metrics including per-consumer backlog"""
+        return {
+            **self.stats,
+            "topics": dict(self.topics),
+            "consumers": {
+                topic: {
+                    consumer_id: {
+                        "backlog": sum(queue.qsize() for queue in consumer.queues.values()),
+                        "awaiting_ack": len(consumer.pending_acks),
+                        "delivered": consumer.delivered,
+                        "redelivered": consumer.redelivered
+                    }
+                    for consumer_id, consumer in consumers.items()
+                }
+                for topic, consumers in self._consumers.items()
+            }
+        }
+
+    async def close(self):
+        """Stop all consumers"""
+        for topic in list(self._consumers):
+            for consumer_id in list(self._consumers[topic]):
+                self.unsubscribe(topic, consumer_id)
@@ -0,0 +1,187 @@
+"""
+Near-Duplicate Detection
+
+MinHash signatures in a banded locality-sensitive hashing (LSH) table,
+so a message's paraphrases among a channel's recent messages are found
+by looking up a few hash buckets instead of comparing against every
+message in the window.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple
+from collections import deque
+import itertools
+import random
+import zlib
+
+
+# Mersenne prime modulus of the universal hash family
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+class MinHasher:
+    """
+    MinHash signatures of token sets
+
+    The fraction of equal positions in two signatures estimates the
+    Jaccard similarity of the underlying sets.
+    """
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        """
+        Initialize the hash family
+
+        Args:
+            num_perm: Signature length (number of hash permutations)
+            seed: Seed of the permutation parameters
+        """
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._params = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, tokens: Iterable[str]) -> Tuple[int, ...]:
+        """MinHash signature of a token set (empty tuple for no tokens)"""
+        hashes = {zlib.crc32(token.encode("utf-8")) for token in tokens}
+        if not hashes:
+            return ()
+        return tuple(
+            min(((a * h + b) % _PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self._params
+        )
+
+    @staticmethod
+    def similarity(first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        if not first or len(first) != len(second):
+            return 0.0
+        return sum(1 for x, y in zip(first, second) if x == y) / len(first)
+
+
+@dataclass
+class IndexedMessage:
+    """A message held in a near-duplicate index"""
+    entry_id: int
+    sender: str
+    signature: Tuple[int, ...]
+    timestamp: datetime = field(default_factory=datetime.now)
+
+
+@dataclass
+class NearDuplicate:
+    """An earlier message similar to a new one"""
+    sender: str
+    similarity: float
+    timestamp: datetime
+
+
+class NearDuplicateIndex:
+    """
+    Sliding window of MinHash signatures in an LSH table
+
+    Signatures are split into bands of rows; two messages become
+    candidates when all rows of any band match, which for the defaults
+    (16 bands of 4 rows) happens with probability ~0.9 at a Jaccard
+    similarity of 0.6 and ~0.01 at 0.2. Candidates are then confirmed on
+    the full signature. Lookups touch one bucket per band, and messages
+    leaving the window are removed from their buckets, so cost per
+    message does not grow with the window.
+    """
+
+    def __init__(
+        self,
+        window: int = 500,
+        bands: int = 16,
+        rows: int = 4,
+        threshold: float = 0.6,
+        hasher: Optional[MinHasher] = None
+    ):
+        """
+        Initialize the index
+
+        Args:
+            window: Most recent messages kept
+            bands: LSH bands per signature
+            rows: Signature positions per band
+            threshold: Minimum estimated similarity reported as a near-duplicate
+            hasher: MinHasher of bands * rows permutations (shared between indexes)
+        """
+        self.window = window
+        self.bands = bands
+        self.rows = rows
+        self.threshold = threshold
+        self.hasher = hasher or MinHasher(bands * rows)
+        if self.hasher.num_perm != bands * rows:
+            raise ValueError("hasher signature length must equal bands * rows")
+
+        self._entries: Deque[IndexedMessage] = deque()
+        self._by_id: Dict[int, IndexedMessage] = {}
+        self._buckets: List[Dict[Tuple[int, ...], Set[int]]] = [{} for _ in range(bands)]
+        self._ids = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, sender: str, tokens: Iterable[str]) -> List[NearDuplicate]:
+        """
+        Index a message, returning its near-duplicates already in the window
+
+        Args:
+            sender: Sender of the message
+            tokens: Token set of the message
+
+        Returns:
+            Earlier near-duplicates, most similar first
+        """
+        signature = self.hasher.signature(tokens)
+        if not signature:
+            return []
+
+        matches = self._query(signature)
+
+        entry = IndexedMessage(next(self._ids), sender, signature)
+        self._entries.append(entry)
+        self._by_id[entry.entry_id] = entry
+        for band, key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(key, set()).add(entry.entry_id)
+
+        while len(self._entries) > self.window:
+            self._evict(self._entries.popleft())
+
+        return matches
+
+    def query(self, tokens: Iterable[str]) -> List[NearDuplicate]:
+        """Near-duplicates of a token set in the window, most similar first"""
+        signature = self.hasher.signature(tokens)
+        return self._query(signature) if signature else []
+
+    def _query(self, signature: Tuple[int, ...]) -> List[NearDuplicate]:
+        candidates: Set[int] = set()
+        for band, key in enumerate(self._band_keys(signature)):
+            candidates.update(self._buckets[band].get(key, ()))
+
+        matches = []
+        for entry_id in candidates:
+            entry = self._by_id[entry_id]
+            similarity = MinHasher.similarity(signature, entry.signature)
+            if similarity >= self.threshold:
+                matches.append(NearDuplicate(entry.sender, similarity, entry.timestamp))
+        matches.sort(key=lambda match: match.similarity, reverse=True)
+        return matches
+
+    def _evict(self, entry: IndexedMessage):
+        del self._by_id[entry.entry_id]
+        for band, key in enumerate(self._band_keys(entry.signature)):
+            bucket = self._buckets[band].get(key)
+            if bucket is not None:
+                bucket.discard(entry.entry_id)
+                if not bucket:
+                    del self._buckets[band][key]
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, ...]]:
+        rows = self.rows
+        return [signature[band * rows:(band + 1) * rows] for band in range(self.bands)]
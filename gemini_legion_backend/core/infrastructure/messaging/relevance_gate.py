@@ -0,0 +1,197 @@
+"""
+Relevance Gate
+
+Cheap pre-LLM check of whether a Minion should consider answering an
+incoming message at all. A turn through the agent (memory storage and
+retrieval, the LLM call, emotional processing) is only worth paying for
+messages that concern the Minion; the rest of #general's chatter is
+skipped before it reaches the agent.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, Optional, Set, Tuple, TYPE_CHECKING
+from collections import Counter, deque
+import logging
+
+from ...domain import MinionPersona, is_commander
+from .lexicon import DEFAULT_LEXICON, TextAnalysis
+
+if TYPE_CHECKING:
+    from ..adk.tools.communication_capability import IncomingMessage
+
+
+logger = logging.getLogger(__name__)
+
+
+# Words addressing the whole channel
+GROUP_ADDRESS = frozenset({"everyone", "anyone", "anybody", "all", "legion", "minions", "team"})
+
+
+def _stem(word: str) -> str:
+    """Crude plural folding so "databases" matches "database" """
+    return word[:-1] if len(word) > 4 and word.endswith("s") else word
+
+
+@dataclass
+class RelevanceDecision:
+    """Outcome of gating one message"""
+    respond: bool
+    reason: str
+    score: float
+
+
+class RelevanceGate:
+    """
+    Decide cheaply whether a message is worth an agent turn
+
+    Messages from the Commander, messages on direct-message channels,
+    messages mentioning the Minion (by its full name or ID), urgent or
+    important messages and replies to the Minion's own last message
+    always pass. Anything else is scored from the message's existing
+    lexicon analysis:
+
+    - each expertise keyword (from persona.expertise_areas) it contains
+    - whether it is a question, or addressed to the whole channel
+    - minus a penalty when the Minion already holds more than max_share
+      of the channel's recent turns, so others get to speak
+
+    and passes when the score reaches threshold. An optional classifier
+    (message -> probability of responding, e.g. a small local model)
+    replaces the score for messages inside classifier_band, the range
+    where the heuristics are least sure.
+    """
+
+    def __init__(
+        self,
+        persona: MinionPersona,
+        minion_id: str,
+        threshold: float = 0.4,
+        turn_window: int = 8,
+        max_share: float = 0.5,
+        classifier: Optional[Callable[["IncomingMessage"], float]] = None,
+        classifier_band: Tuple[float, float] = (0.15, 0.6),
+        direct_channel: Optional[Callable[[str], bool]] = None
+    ):
+        """
+        Initialize the gate
+
+        Args:
+            persona: Persona whose name and expertise the gate matches
+            minion_id: ID of the Minion, also matched as a mention
+            threshold: Score a message needs to pass
+            turn_window: Recent turns per channel considered for turn-taking
+            max_share: Share of recent turns above which the Minion holds back
+            classifier: Optional model scoring ambiguous messages
+            classifier_band: Heuristic scores deferred to the classifier
+            direct_channel: Whether a channel ID is a direct-message channel
+        """
+        self.minion_id = minion_id
+        self.threshold = threshold
+        self.max_share = max_share
+        self.turn_window = turn_window
+        self.classifier = classifier
+        self.classifier_band = classifier_band
+        self.direct_channel = direct_channel
+
+        # A mention is the whole name (or the ID), never one of its words:
+        # "The Code Wizard" must not wake on "the code is broken"
+        self.names: Set[str] = {minion_id.lower(), persona.name.lower()}
+        self.name_words: Tuple[str, ...] = tuple(DEFAULT_LEXICON.analyze(persona.name).words)
+        self.expertise: Set[str] = {
+            _stem(keyword)
+            for area in persona.expertise_areas
+            for keyword in DEFAULT_LEXICON.analyze(area).keywords
+        }
+
+        self._turns: Dict[str, Deque[str]] = {}  # channel -> recent senders
+        self.reasons: Counter = Counter()
+        self.stats = {
+            "checked": 0,
+            "skipped": 0,
+            "classified": 0
+        }
+
+    def assess(self, message: "IncomingMessage") -> RelevanceDecision:
+        """
+        Gate one incoming message and record it as a turn on its channel
+
+        Args:
+            message: The incoming message
+
+        Returns:
+            Whether to respond, why, and the score it reached
+        """
+        turns = self._turns.setdefault(message.channel, deque(maxlen=self.turn_window))
+        decision = self._decide(message, turns)
+        turns.append(message.sender)
+
+        self.stats["checked"] += 1
+        self.reasons[decision.reason] += 1
+        if not decision.respond:
+            self.stats["skipped"] += 1
+        return decision
+
+    def record_reply(self, channel: str):
+        """Record a turn the Minion took on a channel"""
+        self._turns.setdefault(channel, deque(maxlen=self.turn_window)).append(self.minion_id)
+
+    def get_stats(self) -> Dict:
+        """Checked and skipped counts, skip rate, and decisions by reason"""
+        checked = self.stats["checked"]
+        return {
+            **self.stats,
+            "skip_rate": self.stats["skipped"] / checked if checked else 0.0,
+            "reasons": dict(self.reasons)
+        }
+
+    def _decide(self, message: "IncomingMessage", turns: Deque[str]) -> RelevanceDecision:
+        if is_commander(message.sender):
+            return RelevanceDecision(True, "commander", 1.0)
+        if self.direct_channel is not None and self.direct_channel(message.channel):
+            return RelevanceDecision(True, "direct", 1.0)
+
+        analysis = message.analysis or DEFAULT_LEXICON.analyze(message.content)
+        if self._mentioned(analysis):
+            return RelevanceDecision(True, "mention", 1.0)
+        if message.priority.value in ("urgent", "high"):
+            return RelevanceDecision(True, "priority", 1.0)
+        if turns and turns[-1] == self.minion_id:
+            return RelevanceDecision(True, "reply_to_me", 1.0)
+
+        words = set(analysis.words)
+        score = 0.4 * sum(1 for keyword in {_stem(k) for k in analysis.keywords} if keyword in self.expertise)
+        if "?" in analysis.lowered:
+            score += 0.2
+        if words & GROUP_ADDRESS:
+            score += 0.3
+        if turns and sum(1 for sender in turns if sender == self.minion_id) / len(turns) > self.max_share:
+            score -= 0.3
+        score = max(0.0, min(1.0, score))
+
+        low, high = self.classifier_band
+        if self.classifier is not None and low <= score < high:
+            try:
+                score = float(self.classifier(message))
+                self.stats["classified"] += 1
+                reason = "classifier"
+            except Exception as e:
+                logger.warning(f"Relevance classifier failed for {self.minion_id}: {e}")
+                reason = "heuristics"
+        else:
+            reason = "heuristics"
+
+        if score >= self.threshold:
+            return RelevanceDecision(True, reason, score)
+        return RelevanceDecision(False, f"{reason}_skip", score)
+
+    def _mentioned(self, analysis: TextAnalysis) -> bool:
+        words = analysis.words
+        if any(word in self.names for word in words):
+            return True
+        span = len(self.name_words)
+        if span > 1 and any(
+            tuple(words[index:index + span]) == self.name_words
+            for index in range(len(words) - span + 1)
+        ):
+            return True
+        return any(f"@{name}" in analysis.lowered for name in self.names)
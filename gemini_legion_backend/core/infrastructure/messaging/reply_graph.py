@@ -0,0 +1,329 @@
+"""
+Reply Graph
+
+Legion-wide record of which Minion replied to which, across every
+channel, used to spot reply cycles (A answers B answers A ...) that a
+single channel's history cannot see, e.g. a topic bounced between
+#general and a direct message.
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from collections import defaultdict
+import logging
+import math
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Edge:
+    """A decaying reply count between two Minions"""
+    weight: float = 0.0
+    updated: float = 0.0
+
+
+@dataclass
+class ReplyCycle:
+    """Minions replying to each other in a cycle"""
+    members: Set[str]
+    heat: float  # Decayed, repetition-weighted replies inside the cycle
+    throttled_until: float
+    detected_at: float = field(default_factory=time.monotonic)
+
+
+class ReplyGraph:
+    """
+    Time-decayed "who replied to whom" graph with incremental cycles
+
+    A message sent within reply_window seconds of the previous one on
+    its channel adds a reply edge from its sender to that message's
+    sender. Edge weights halve every half_life seconds, and edges whose
+    weight falls below min_weight stop counting.
+
+    Strongly connected components (reply cycles) are kept in a
+    union-find structure: an edge inside a known component only adds
+    heat, and an edge between components searches, within a bounded
+    number of nodes, for a path back to its source. If one exists, the
+    components on that path are merged. Either way the cost per message
+    is amortized near-constant. Components can only grow between
+    compactions. Once enough edges may have decayed, the components are
+    rebuilt from the live edges.
+
+    Heat measures repetition, not volume: a reply adds heat in
+    proportion to how much it repeats earlier messages, and a reply that
+    repeats nothing adds only novel_heat. A normal back-and-forth stays
+    far below runaway_heat; a cycle of echoed replies reaches it. A
+    component of two or more Minions whose heat reaches runaway_heat is
+    a runaway cycle. Its members are throttled for throttle_seconds.
+    """
+
+    def __init__(
+        self,
+        half_life: float = 120.0,
+        min_weight: float = 0.25,
+        runaway_heat: float = 12.0,
+        throttle_seconds: float = 60.0,
+        reply_window: float = 300.0,
+        novel_heat: float = 0.1,
+        max_search: int = 64,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the graph
+
+        Args:
+            half_life: Seconds for a reply edge's weight to halve
+            min_weight: Weight below which an edge no longer links two Minions
+            runaway_heat: Cycle heat that triggers throttling
+            throttle_seconds: How long runaway cycle members are throttled
+            reply_window: Longest gap after which a message still answers the previous one
+            novel_heat: Heat added by a reply that repeats nothing
+            max_search: Most nodes visited when looking for a new cycle
+            clock: Monotonic clock in seconds
+        """
+        self.half_life = half_life
+        self.min_weight = min_weight
+        self.runaway_heat = runaway_heat
+        self.throttle_seconds = throttle_seconds
+        self.reply_window = reply_window
+        self.novel_heat = novel_heat
+        self.max_search = max_search
+        self.clock = clock
+
+        self._edges: Dict[Tuple[str, str], _Edge] = {}
+        self._successors: Dict[str, Set[str]] = defaultdict(set)
+        self._last_sender: Dict[str, Tuple[str, float]] = {}  # channel_id -> (minion_id, sent)
+
+        # Union-find over Minions: merged sets are reply cycles
+        self._parent: Dict[str, str] = {}
+        self._heat: Dict[str, Tuple[float, float]] = {}  # root -> (heat, updated)
+
+        self.throttled: Dict[str, float] = {}  # minion_id -> monotonic deadline
+        self.cycles: List[ReplyCycle] = []  # Runaway cycles, most recent last
+        self._last_compaction = clock()
+
+        self.stats = {
+            "replies": 0,
+            "cycles_detected": 0,
+            "runaway_cycles": 0,
+            "searches_truncated": 0,
+            "compactions": 0
+        }
+
+    def record(self, sender: str, channel_id: str, repetition: float = 1.0) -> Optional[ReplyCycle]:
+        """
+        Record a message as a reply to the previous sender on its channel
+
+        Args:
+            sender: Minion sending the message
+            channel_id: Channel it is sent on
+            repetition: How closely it repeats recent messages (0 to 1)
+
+        Returns:
+            The runaway cycle this reply completed, if any
+        """
+        now = self.clock()
+        if now - self._last_compaction >= self.half_life:
+            self._compact(now)
+
+        previous, sent = self._last_sender.get(channel_id, (None, now))
+        self._last_sender[channel_id] = (sender, now)
+        if previous is None or previous == sender or now - sent > self.reply_window:
+            return None
+
+        self.stats["replies"] += 1
+        edge = self._edges.get((sender, previous))
+        if edge is None:
+            edge = self._edges[(sender, previous)] = _Edge(updated=now)
+            self._successors[sender].add(previous)
+        edge.weight = self._decayed(edge.weight, edge.updated, now) + 1.0
+        edge.updated = now
+
+        root = self._find(sender)
+        if root != self._find(previous) and self._find_cycle(previous, sender, now):
+            root = self._find(sender)
+            self.stats["cycles_detected"] += 1
+
+        if root != self._find(previous):
+            return None
+
+        heat, updated = self._heat.get(root, (0.0, now))
+        repetition = min(1.0, max(0.0, repetition))
+        heat = self._decayed(heat, updated, now) + self.novel_heat + (1.0 - self.novel_heat) * repetition
+        self._heat[root] = (heat, now)
+
+        if heat < self.runaway_heat:
+            return None
+
+        members = self._members(root)
+        deadline = now + self.throttle_seconds
+        for member in members:
+            self.throttled[member] = deadline
+        self._heat[root] = (0.0, now)  # Start over once the throttle lifts
+
+        cycle = ReplyCycle(members, heat, deadline, now)
+        self.cycles = self.cycles[-99:] + [cycle]
+        self.stats["runaway_cycles"] += 1
+        logger.warning(f"Runaway reply cycle between {sorted(members)}, throttling for {self.throttle_seconds}s")
+        return cycle
+
+    def throttled_for(self, minion_id: str) -> float:
+        """Seconds a Minion remains throttled (0 if it is not)"""
+        deadline = self.throttled.get(minion_id)
+        if deadline is None:
+            return 0.0
+        remaining = deadline - self.clock()
+        if remaining <= 0:
+            del self.throttled[minion_id]
+            return 0.0
+        return remaining
+
+    def forget_channel(self, channel_id: str):
+        """Stop linking replies to a channel's last sender"""
+        self._last_sender.pop(channel_id, None)
+
+    def forget_minion(self, minion_id: str):
+        """Drop a Minion's edges and throttle, then rebuild the cycles"""
+        for key in [key for key in self._edges if minion_id in key]:
+            del self._edges[key]
+        self._successors.pop(minion_id, None)
+        for successors in self._successors.values():
+            successors.discard(minion_id)
+        for channel_id in [c for c, (s, _) in self._last_sender.items() if s == minion_id]:
+            del self._last_sender[channel_id]
+        self.throttled.pop(minion_id, None)
+        self._compact(self.clock())
+
+    def get_stats(self) -> Dict:
+        """Graph size, cycles and throttled Minions"""
+        now = self.clock()
+        components: Dict[str, int] = defaultdict(int)
+        for node in self._parent:
+            components[self._find(node)] += 1
+        return {
+            **self.stats,
+            "edges": len(self._edges),
+            "cycles": sum(1 for size in components.values() if size > 1),
+            "throttled": sorted(m for m, deadline in self.throttled.items() if deadline > now)
+        }
+
+    def _decayed(self, weight: float, updated: float, now: float) -> float:
+        return weight * math.pow(0.5, (now - updated) / self.half_life)
+
+    def _live(self, source: str, target: str, now: float) -> bool:
+        edge = self._edges.get((source, target))
+        return edge is not None and self._decayed(edge.weight, edge.updated, now) >= self.min_weight
+
+    def _find(self, node: str) -> str:
+        parent = self._parent.setdefault(node, node)
+        if parent == node:
+            return node
+        root = self._find(parent)
+        self._parent[node] = root
+        return root
+
+    def _union(self, first: str, second: str, now: float):
+        first, second = self._find(first), self._find(second)
+        if first == second:
+            return
+        heat = sum(
+            self._decayed(*self._heat.pop(root), now)
+            for root in (first, second) if root in self._heat
+        )
+        self._parent[second] = first
+        self._heat[first] = (heat, now)
+
+    def _find_cycle(self, start: str, target: str, now: float) -> bool:
+        """Search live edges for a path start -> target, merging its components"""
+        target_root = self._find(target)
+        came_from: Dict[str, Optional[str]] = {start: None}
+        stack = [start]
+
+        while stack:
+            if len(came_from) > self.max_search:
+                self.stats["searches_truncated"] += 1
+                return False
+            node = stack.pop()
+            for successor in self._successors.get(node, ()):
+                if successor in came_from or not self._live(node, successor, now):
+                    continue
+                came_from[successor] = node
+                if self._find(successor) == target_root:
+                    # Merge every component on the path into the cycle
+                    step: Optional[str] = successor
+                    while step is not None:
+                        self._union(target, step, now)
+                        step = came_from[step]
+                    return True
+                stack.append(successor)
+
+        return False
+
+    def _compact(self, now: float):
+        """Drop dead edges and rebuild components from the live ones (Tarjan)"""
+        self.stats["compactions"] += 1
+        self._last_compaction = now
+
+        for key in [key for key, edge in self._edges.items()
+                    if self._decayed(edge.weight, edge.updated, now) < self.min_weight]:
+            del self._edges[key]
+            self._successors[key[0]].discard(key[1])
+
+        old_heat = {node: self._heat.get(self._find(node)) for node in self._parent}
+        self._parent = {}
+        self._heat = {}
+
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        counter = 0
+
+        for root in list(self._successors):
+            if root in index:
+                continue
+            work = [(root, iter(self._successors.get(root, ())))]
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, successors = work[-1]
+                advanced = False
+                for successor in successors:
+                    if successor not in index:
+                        index[successor] = lowlink[successor] = counter
+                        counter += 1
+                        stack.append(successor)
+                        on_stack.add(successor)
+                        work.append((successor, iter(self._successors.get(successor, ()))))
+                        advanced = True
+                        break
+                    if successor in on_stack:
+                        lowlink[node] = min(lowlink[node], index[successor])
+                if advanced:
+                    continue
+                work.pop()
+                if work:
+                    lowlink[work[-1][0]] = min(lowlink[work[-1][0]], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    for member in component[1:]:
+                        self._union(node, member, now)
+                    if len(component) > 1:
+                        # A surviving cycle keeps the heat it had before
+                        heats = [old_heat[m] for m in component if old_heat.get(m)]
+                        if heats:
+                            self._heat[self._find(node)] = max(heats)
+
+    def _members(self, root: str) -> Set[str]:
+        return {node for node in list(self._parent) if self._find(node) == root}
@@ -0,0 +1,407 @@
+"""
+Inter-Minion RPC
+
+Layer 4 of the inter-Minion communication system: direct
+request/response calls for time-critical coordination (e.g. a
+taskmaster polling worker status) that should not go through chat.
+Each call is tracked by a correlation ID whose future is resolved when
+the handler's response arrives.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
+import json
+import logging
+import time
+import uuid
+
+from .transport import Transport, RPC_REQUEST_TOPIC, RPC_REPLY_TOPIC_PREFIX
+
+
+logger = logging.getLogger(__name__)
+
+
+RpcHandlerFunc = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+class RpcError(Exception):
+    """Raised when a remote procedure call cannot be completed"""
+
+
+class RpcMethodNotFound(RpcError):
+    """Raised when the target Minion has no handler for a method"""
+
+
+class RpcTimeoutError(RpcError, asyncio.TimeoutError):
+    """Raised when a call does not complete within its timeout"""
+
+
+@dataclass
+class RpcCall:
+    """One call in a batched multi-call"""
+    minion_id: str
+    method: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class RpcRequest:
+    """A call in flight"""
+    correlation_id: str
+    minion_id: str
+    method: str
+    payload: Dict[str, Any]
+    coalesce_key: Optional[Tuple[str, str, str]] = None
+    waiters: int = 1
+    started_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class RpcResponse:
+    """Outcome of a call, matched to its request by correlation ID"""
+    correlation_id: str
+    result: Any = None
+    error: Optional[BaseException] = None
+
+
+class _RegisteredHandler:
+    """A handler with its concurrency limit and metrics"""
+
+    def __init__(self, handler: RpcHandlerFunc, max_concurrency: int):
+        self.handler = handler
+        self.max_concurrency = max(1, max_concurrency)
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.active = 0
+        self.waiting = 0
+        self.calls = 0
+        self.failures = 0
+        self.total_ms = 0.0
+
+
+class RpcDispatcher:
+    """
+    Correlation-ID based request/response calls between Minions
+
+    Concurrent calls with the same target, method and payload are
+    coalesced onto the request already in flight, so a burst of
+    identical status queries runs the handler once. Each handler runs at
+    most max_concurrency calls at a time; further calls wait their turn
+    within their own timeout. A request whose every caller has given up
+    is cancelled.
+
+    With a transport attached, calls to Minions without a local handler
+    are published as requests; the node hosting the handler runs it and
+    publishes the response to the caller's reply topic, where it is
+    matched by correlation ID.
+    """
+
+    def __init__(self, default_timeout: float = 10.0, default_concurrency: int = 4):
+        """
+        Initialize the dispatcher
+
+        Args:
+            default_timeout: Seconds a call waits when no timeout is given
+            default_concurrency: Concurrent calls per handler when not specified
+        """
+        self.default_timeout = default_timeout
+        self.default_concurrency = default_concurrency
+
+        self.handlers: Dict[Tuple[str, str], _RegisteredHandler] = {}  # (minion_id, method) -> handler
+        self._pending: Dict[str, asyncio.Future] = {}  # correlation_id -> response future
+        self._requests: Dict[str, RpcRequest] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._inflight: Dict[Tuple[str, str, str], str] = {}  # coalesce key -> correlation_id
+        self.transport: Optional[Transport] = None
+
+        self.stats = {
+            "calls": 0,
+            "coalesced": 0,
+            "timeouts": 0,
+            "errors": 0,
+            "cancelled": 0,
+            "remote_calls": 0,
+            "remote_served": 0
+        }
+
+    def register(
+        self,
+        minion_id: str,
+        method: str,
+        handler: RpcHandlerFunc,
+        max_concurrency: Optional[int] = None
+    ):
+        """
+        Expose a method of a Minion
+
+        Args:
+            minion_id: Minion answering the calls
+            method: Method name
+            handler: Async callable receiving the payload dict
+            max_concurrency: Calls the handler may run at once
+        """
+        self.handlers[(minion_id, method)] = _RegisteredHandler(
+            handler, max_concurrency or self.default_concurrency
+        )
+
+    def unregister(self, minion_id: str, method: Optional[str] = None):
+        """Remove one method of a Minion, or all of them"""
+        for key in [k for k in self.handlers if k[0] == minion_id and method in (None, k[1])]:
+            del self.handlers[key]
+
+    async def attach_transport(self, transport: Transport):
+        """Serve and place calls across the nodes on a transport"""
+        await transport.subscribe(RPC_REQUEST_TOPIC, self._on_transport_request)
+        await transport.subscribe(RPC_REPLY_TOPIC_PREFIX + transport.node_id, self._on_transport_reply)
+        self.transport = transport
+
+    async def call(
+        self,
+        minion_id: str,
+        method: str,
+        payload: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
+    ) -> Any:
+        """
+        Call a method on a Minion and wait for the result
+
+        Args:
+            minion_id: Target Minion
+            method: Method name
+            payload: Arguments for the handler
+            timeout: Seconds to wait (defaults to default_timeout)
+
+        Returns:
+            The handler's return value
+
+        Raises:
+            RpcMethodNotFound: If the method is not registered (and no
+                transport could reach another node)
+            RpcTimeoutError: If the call does not complete in time
+            RpcError: If the handler raised
+        """
+        payload = payload or {}
+        timeout = self.default_timeout if timeout is None else timeout
+        self.stats["calls"] += 1
+
+        if (minion_id, method) not in self.handlers and self.transport is None:
+            raise RpcMethodNotFound(f"{minion_id} has no RPC method '{method}'")
+
+        request = self._join_or_start(minion_id, method, payload)
+        future = self._pending[request.correlation_id]
+
+        try:
+            response: RpcResponse = await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            raise RpcTimeoutError(
+                f"RPC {method} on {minion_id} timed out after {timeout}s"
+            ) from None
+        finally:
+            self._leave(request)
+
+        if response.error is not None:
+            raise response.error
+        return response.result
+
+    async def call_many(
+        self,
+        calls: List[RpcCall],
+        timeout: Optional[float] = None
+    ) -> List[Any]:
+        """
+        Issue several calls at once under a shared timeout
+
+        Identical calls in the batch are coalesced like concurrent calls.
+
+        Returns:
+            One entry per call, in order: the result or the raised RpcError
+        """
+        return await asyncio.gather(
+            *(self.call(c.minion_id, c.method, c.payload, timeout) for c in calls),
+            return_exceptions=True
+        )
+
+    def _join_or_start(self, minion_id: str, method: str, payload: Dict[str, Any]) -> RpcRequest:
+        """Attach to an identical call in flight or start a new request"""
+        coalesce_key = self._coalesce_key(minion_id, method, payload)
+        if coalesce_key is not None:
+            correlation_id = self._inflight.get(coalesce_key)
+            if correlation_id is not None:
+                request = self._requests[correlation_id]
+                request.waiters += 1
+                self.stats["coalesced"] += 1
+                return request
+
+        request = RpcRequest(
+            correlation_id=uuid.uuid4().hex,
+            minion_id=minion_id,
+            method=method,
+            payload=payload,
+            coalesce_key=coalesce_key
+        )
+        self._requests[request.correlation_id] = request
+        self._pending[request.correlation_id] = asyncio.get_running_loop().create_future()
+        if coalesce_key is not None:
+            self._inflight[coalesce_key] = request.correlation_id
+
+        if (minion_id, method) in self.handlers:
+            task = self._dispatch(request)
+        else:
+            self.stats["remote_calls"] += 1
+            task = self._send_remote(request)
+        self._tasks[request.correlation_id] = asyncio.create_task(task)
+        return request
+
+    @staticmethod
+    def _coalesce_key(minion_id: str, method: str, payload: Dict[str, Any]) -> Optional[Tuple[str, str, str]]:
+        """Identity of a call for coalescing, None if the payload is not canonicalizable"""
+        try:
+            return (minion_id, method, json.dumps(payload, sort_keys=True, separators=(",", ":")))
+        except (TypeError, ValueError):
+            return None
+
+    async def _dispatch(self, request: RpcRequest):
+        """Run the local handler for a request and resolve its future"""
+        try:
+            response = await self._execute(
+                request.correlation_id, request.minion_id, request.method, request.payload
+            )
+        except asyncio.CancelledError:
+            self.stats["cancelled"] += 1
+            response = RpcResponse(request.correlation_id, error=RpcError("RPC cancelled"))
+        self._resolve(response)
+
+    async def _execute(
+        self,
+        correlation_id: str,
+        minion_id: str,
+        method: str,
+        payload: Dict[str, Any]
+    ) -> RpcResponse:
+        """Run a local handler within its concurrency limit"""
+        registered = self.handlers.get((minion_id, method))
+        if registered is None:
+            return RpcResponse(
+                correlation_id,
+                error=RpcMethodNotFound(f"{minion_id} has no RPC method '{method}'")
+            )
+
+        registered.waiting += 1
+        acquired = False
+        try:
+            async with registered.semaphore:
+                registered.waiting -= 1
+                acquired = True
+                registered.active += 1
+                started = time.monotonic()
+                try:
+                    result = await registered.handler(payload)
+                    return RpcResponse(correlation_id, result=result)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    registered.failures += 1
+                    self.stats["errors"] += 1
+                    logger.error(f"RPC {method} on {minion_id} failed: {e}")
+                    return RpcResponse(
+                        correlation_id,
+                        error=RpcError(f"RPC {method} on {minion_id} failed: {e}")
+                    )
+                finally:
+                    registered.active -= 1
+                    registered.calls += 1
+                    registered.total_ms += (time.monotonic() - started) * 1000
+        except asyncio.CancelledError:
+            if not acquired:
+                registered.waiting -= 1
+            raise
+
+    async def _send_remote(self, request: RpcRequest):
+        """Publish a request for the node hosting the handler"""
+        try:
+            await self.transport.publish(RPC_REQUEST_TOPIC, {
+                "correlation_id": request.correlation_id,
+                "minion_id": request.minion_id,
+                "method": request.method,
+                "payload": request.payload,
+                "reply_to": self.transport.node_id
+            })
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._resolve(RpcResponse(request.correlation_id, error=RpcError(f"RPC send failed: {e}")))
+
+    async def _on_transport_request(self, message: Dict[str, Any]):
+        """Serve a request from another node if the handler lives here"""
+        if (message["minion_id"], message["method"]) in self.handlers:
+            self.stats["remote_served"] += 1
+            asyncio.create_task(self._serve_remote(message))
+
+    async def _serve_remote(self, message: Dict[str, Any]):
+        response = await self._execute(
+            message["correlation_id"], message["minion_id"], message["method"], message["payload"]
+        )
+        try:
+            await self.transport.publish(RPC_REPLY_TOPIC_PREFIX + message["reply_to"], {
+                "correlation_id": response.correlation_id,
+                "result": response.result,
+                "error": str(response.error) if response.error is not None else None
+            })
+        except Exception as e:
+            logger.error(f"RPC reply for {message['method']} on {message['minion_id']} failed: {e}")
+
+    async def _on_transport_reply(self, message: Dict[str, Any]):
+        """Resolve a remote call's future by correlation ID"""
+        error = message.get("error")
+        self._resolve(RpcResponse(
+            message["correlation_id"],
+            result=message.get("result"),
+            error=RpcError(error) if error is not None else None
+        ))
+
+    def _resolve(self, response: RpcResponse):
+        """Complete the future waiting on a correlation ID"""
+        request = self._requests.get(response.correlation_id)
+        if request is not None and request.coalesce_key is not None:
+            # New identical calls start fresh instead of joining a finished one
+            if self._inflight.get(request.coalesce_key) == response.correlation_id:
+                del self._inflight[request.coalesce_key]
+
+        future = self._pending.get(response.correlation_id)
+        if future is not None and not future.done():
+            future.set_result(response)
+
+    def _leave(self, request: RpcRequest):
+        """Drop a caller from a request, cleaning up once nobody waits"""
+        request.waiters -= 1
+        if request.waiters > 0:
+            return
+
+        correlation_id = request.correlation_id
+        task = self._tasks.pop(correlation_id, None)
+        if task is not None and not task.done():
+            task.cancel()  # Every caller gave up
+
+        if request.coalesce_key is not None and self._inflight.get(request.coalesce_key) == correlation_id:
+            del self._inflight[request.coalesce_key]
+        self._requests.pop(correlation_id, None)
+        self._pending.pop(correlation_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Call counters and per-handler load"""
+        return {
+            **self.stats,
+            "in_flight": len(self._requests),
+            "handlers": {
+                f"{minion_id}.{method}": {
+                    "active": registered.active,
+                    "waiting": registered.waiting,
+                    "max_concurrency": registered.max_concurrency,
+                    "calls": registered.calls,
+                    "failures": registered.failures,
+                    "avg_ms": registered.total_ms / registered.calls if registered.calls else 0.0
+                }
+                for (minion_id, method), registered in self.handlers.items()
+            }
+        }
@@ -6,10 +6,14 @@ conversation patterns between Minions.
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-from collections import deque, Counter
-import re
+from datetime import datetime
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple
+from collections import deque, Counter, OrderedDict
+import time
+
+from .lexicon import DEFAULT_LEXICON, TextAnalysis
+from .near_duplicates import MinHasher, NearDuplicate, NearDuplicateIndex
+from .reply_graph import ReplyGraph
 
 
 @dataclass
@@ -47,170 +51,410 @@ class LoopRisk:
     mitigation: str
 
 
+@dataclass
+class _LimiterState:
+    """GCRA state of one rate-limited key"""
+    tat_minute: float = 0.0  # Theoretical arrival time, per-minute limit
+    tat_hour: float = 0.0  # Theoretical arrival time, per-hour limit
+    last_sent: float = float("-inf")
+    last_seen: float = 0.0
+
+
 class RateLimiter:
-    """Rate limiting for message sending"""
+    """
+    Rate limiting for message sending
     
-    def __init__(self, config: RateLimitConfig):
+    Uses the generic cell rate algorithm (GCRA): each limit of N
+    messages per period is a single theoretical arrival time (TAT)
+    advanced by period / N per message, and a message is allowed while
+    the TAT is at most one period minus one interval ahead of now. This
+    allows bursts of N and otherwise spaces messages evenly, with O(1)
+    state and work per check.
+    
+    Keys (minion/channel pairs and channels with their own limit) are
+    kept in LRU order. A key idle for longer than the hour window has
+    fully recovered, so it is dropped without changing any decision;
+    max_keys bounds memory under churn.
+    """
+    
+    MINUTE = 60.0
+    HOUR = 3600.0
+    
+    def __init__(
+        self,
+        config: RateLimitConfig,
+        max_keys: int = 10000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the limiter
+        
+        Args:
+            config: Per minion/channel limits
+            max_keys: Maximum tracked keys before evicting the least recently used
+            clock: Monotonic clock in seconds
+        """
         self.config = config
-        self.message_history: Dict[str, Dict[str, deque]] = {}  # minion_id -> channel_id -> timestamps
+        self.max_keys = max_keys
+        self.clock = clock
+        self._state: "OrderedDict[Tuple[Optional[str], str], _LimiterState]" = OrderedDict()
+        self.channel_limits: Dict[str, int] = {}  # channel_id -> messages per minute
+    
+    def set_channel_limit(self, channel_id: str, messages_per_minute: Optional[int]):
+        """Limit the total message rate of a channel (None or <= 0 removes it)"""
+        if messages_per_minute and messages_per_minute > 0:
+            self.channel_limits[channel_id] = messages_per_minute
+        else:
+            self.channel_limits.pop(channel_id, None)
+            self._state.pop((None, channel_id), None)
     
     def check_allowed(self, minion_id: str, channel_id: str) -> bool:
-        """Check if a minion can send a message"""
-        now = datetime.now()
-        
-        # Initialize history if needed
-        if minion_id not in self.message_history:
-            self.message_history[minion_id] = {}
-        if channel_id not in self.message_history[minion_id]:
-            self.message_history[minion_id][channel_id] = deque()
+        """Check if a minion can send a message, counting it if so"""
+        now = self.clock()
+        self._expire(now)
         
-        history = self.message_history[minion_id][channel_id]
-        
-        # Clean old entries
-        cutoff_minute = now - timedelta(minutes=1)
-        cutoff_hour = now - timedelta(hours=1)
-        
-        # Remove old timestamps
-        while history and history[0] < cutoff_hour:
-            history.popleft()
-        
-        # Count recent messages
-        minute_count = sum(1 for ts in history if ts >= cutoff_minute)
-        hour_count = len(history)
-        
-        # Check limits
-        if minute_count >= self.config.messages_per_minute:
-            return False
-        if hour_count >= self.config.messages_per_hour:
+        state = self._touch((minion_id, channel_id), now)
+        if now - state.last_sent < self.config.cooldown_seconds:
             return False
         
-        # Check cooldown
-        if history and (now - history[-1]).total_seconds() < self.config.cooldown_seconds:
+        minute = self._gcra(state.tat_minute, now, self.config.messages_per_minute, self.MINUTE)
+        hour = self._gcra(state.tat_hour, now, self.config.messages_per_hour, self.HOUR)
+        if minute is None or hour is None:
             return False
         
-        # Add timestamp
-        history.append(now)
+        channel_state = None
+        channel_tat = None
+        channel_limit = self.channel_limits.get(channel_id)
+        if channel_limit:
+            channel_state = self._touch((None, channel_id), now)
+            channel_tat = self._gcra(channel_state.tat_minute, now, channel_limit, self.MINUTE)
+            if channel_tat is None:
+                return False
+        
+        # All limits pass: count the message
+        state.tat_minute, state.tat_hour, state.last_sent = minute, hour, now
+        if channel_state is not None:
+            channel_state.tat_minute = channel_tat
         return True
+    
+    def retry_after(self, minion_id: str, channel_id: str) -> float:
+        """Seconds until a minion's next message on a channel could be allowed"""
+        now = self.clock()
+        state = self._state.get((minion_id, channel_id))
+        if state is None:
+            return 0.0
+        waits = [
+            state.last_sent + self.config.cooldown_seconds - now,
+            self._wait(state.tat_minute, now, self.config.messages_per_minute, self.MINUTE),
+            self._wait(state.tat_hour, now, self.config.messages_per_hour, self.HOUR)
+        ]
+        channel_state = self._state.get((None, channel_id))
+        if channel_state is not None and channel_id in self.channel_limits:
+            waits.append(self._wait(channel_state.tat_minute, now, self.channel_limits[channel_id], self.MINUTE))
+        return max(0.0, *waits)
+    
+    def forget_minion(self, minion_id: str):
+        """Drop all state of a minion"""
+        for key in [k for k in self._state if k[0] == minion_id]:
+            del self._state[key]
+    
+    def forget_channel(self, channel_id: str):
+        """Drop all state and limits of a channel"""
+        self.channel_limits.pop(channel_id, None)
+        for key in [k for k in self._state if k[1] == channel_id]:
+            del self._state[key]
+    
+    @property
+    def tracked_keys(self) -> int:
+        """Number of keys currently holding state"""
+        return len(self._state)
+    
+    @staticmethod
+    def _gcra(tat: float, now: float, limit: int, period: float) -> Optional[float]:
+        """New TAT if a message is allowed now, None if it is over the limit"""
+        interval = period / limit
+        tat = max(tat, now)
+        if tat - now > period - interval:
+            return None
+        return tat + interval
+    
+    @staticmethod
+    def _wait(tat: float, now: float, limit: int, period: float) -> float:
+        """Seconds until a GCRA limit allows the next message"""
+        return tat - now - (period - period / limit)
+    
+    def _touch(self, key: Tuple[Optional[str], str], now: float) -> _LimiterState:
+        """Get a key's state, marking it most recently used"""
+        state = self._state.get(key)
+        if state is None:
+            state = self._state[key] = _LimiterState()
+        else:
+            self._state.move_to_end(key)
+        state.last_seen = now
+        return state
+    
+    def _expire(self, now: float):
+        """Evict keys idle past the longest window, then beyond max_keys"""
+        idle_after = max(self.HOUR, self.config.cooldown_seconds)
+        while self._state:
+            key, state = next(iter(self._state.items()))
+            if now - state.last_seen <= idle_after and len(self._state) < self.max_keys:
+                break
+            del self._state[key]
 
 
-class ConversationMonitor:
-    """Monitors conversation health metrics"""
+class ConversationWindow:
+    """
+    Shared recent history of one channel
     
-    def __init__(self):
-        self.conversation_history: Dict[str, List[Dict]] = {}  # channel_id -> messages
-        self.max_history = 100
+    Every safeguard reads the same window. A message is tokenized once
+    and appended once, and its analysis and anything derived from it
+    (loop intensity, near-duplicates) are cached on its entry. Health
+    metrics are sliding-window accumulators: each is updated when a
+    message enters or leaves its window, so reading them never rescans
+    the history.
+    """
     
-    def add_message(self, channel_id: str, sender: str, content: str):
-        """Add a message to conversation history"""
-        if channel_id not in self.conversation_history:
-            self.conversation_history[channel_id] = []
-        
-        self.conversation_history[channel_id].append({
+    # Messages with fewer topic keywords (acknowledgements, "sounds good")
+    # carry no content to paraphrase and are not indexed
+    MIN_SHINGLES = 4
+    
+    def __init__(self, max_history: int, metric_window: int, near_duplicates: NearDuplicateIndex):
+        self.metric_window = metric_window
+        self.history: Deque[Dict] = deque(maxlen=max_history)
+        self.length_sum = 0  # Content length over history
+        self.near_duplicates = near_duplicates
+        
+        # Over the last `metric_window` messages
+        self.recent: Deque[Dict] = deque()
+        self.senders: Counter = Counter()
+        self.keywords: Counter = Counter()
+        self.keyword_total = 0
+        self.pair_scores: Deque[float] = deque()  # Similarity of each message to its predecessor
+        self.pair_sum = 0.0
+        self._previous_words: Optional[Set[str]] = None
+        self._previous_text: Optional[str] = None
+    
+    def add(self, sender: str, content: str, analysis: TextAnalysis) -> Dict:
+        """Append a message, returning its history entry"""
+        entry = {
             'sender': sender,
             'content': content,
+            'analysis': analysis,
             'timestamp': datetime.now()
-        })
-        
-        # Trim history
-        if len(self.conversation_history[channel_id]) > self.max_history:
-            self.conversation_history[channel_id] = self.conversation_history[channel_id][-self.max_history:]
+        }
+        words = set(analysis.lowered.split())
+        
+        # Similarity with the previous message, computed once on arrival
+        if self._previous_text is None:
+            score = 0.0
+        elif analysis.lowered == self._previous_text:
+            score = 1.0
+        elif len(words & self._previous_words) > 5:
+            score = 0.5
+        else:
+            score = 0.0
+        self._previous_text, self._previous_words = analysis.lowered, words
+        
+        # Message leaving the history
+        if len(self.history) == self.history.maxlen:
+            self.length_sum -= len(self.history[0]['content'])
+        self.history.append(entry)
+        self.length_sum += len(content)
+        
+        # Message leaving the metric window
+        if len(self.recent) == self.metric_window:
+            self._remove(self.recent.popleft())
+        self.recent.append(entry)
+        self.senders[sender] += 1
+        self.keywords.update(analysis.keywords)
+        self.keyword_total += len(analysis.keywords)
+        
+        # Only pairs with both messages inside the window count
+        self.pair_scores.append(score)
+        self.pair_sum += score
+        if len(self.pair_scores) >= self.metric_window:
+            self.pair_sum -= self.pair_scores.popleft()
+        
+        return entry
     
-    async def check_health(self, channel_id: str) -> ConversationHealth:
-        """Check the health of a conversation"""
-        history = self.conversation_history.get(channel_id, [])
-        if len(history) < 5:
-            # Not enough data
-            return ConversationHealth(0.0, 1.0, 1.0, 50.0)
-        
-        # Calculate repetition score
-        repetition_score = self._calculate_repetition(history)
-        
-        # Calculate participation balance
-        participation_balance = self._calculate_participation_balance(history)
-        
-        # Calculate topic diversity
-        topic_diversity = self._calculate_topic_diversity(history)
-        
-        # Calculate average message length
-        avg_length = sum(len(msg['content']) for msg in history) / len(history)
-        
-        return ConversationHealth(
-            repetition_score=repetition_score,
-            participation_balance=participation_balance,
-            topic_diversity=topic_diversity,
-            average_message_length=avg_length
-        )
+    def last(self, count: int) -> List[Dict]:
+        """The most recent messages, oldest first"""
+        count = min(count, len(self.history))
+        return [self.history[i] for i in range(len(self.history) - count, len(self.history))]
+    
+    def index_near_duplicates(self, entry: Dict) -> List[NearDuplicate]:
+        """Near-duplicates of a message among earlier ones, indexing it on first use"""
+        if 'near_duplicates' not in entry:
+            # Topic keywords carry a paraphrase
+            shingles = set(entry['analysis'].keywords)
+            if len(shingles) < self.MIN_SHINGLES:
+                entry['near_duplicates'] = []
+            else:
+                entry['near_duplicates'] = self.near_duplicates.add(entry['sender'], shingles)
+        return entry['near_duplicates']
+    
+    def _remove(self, entry: Dict):
+        sender = entry['sender']
+        self.senders[sender] -= 1
+        if not self.senders[sender]:
+            del self.senders[sender]
+        for keyword in entry['analysis'].keywords:
+            self.keywords[keyword] -= 1
+            if not self.keywords[keyword]:
+                del self.keywords[keyword]
+        self.keyword_total -= len(entry['analysis'].keywords)
     
-    def _calculate_repetition(self, history: List[Dict]) -> float:
-        """Calculate how repetitive the conversation is"""
-        if len(history) < 2:
+    def repetition(self) -> float:
+        if len(self.recent) < 2:
             return 0.0
-        
-        # Check for repeated phrases
-        recent_messages = [msg['content'].lower() for msg in history[-20:]]
-        
-        # Simple repetition detection
-        repetitions = 0
-        for i in range(1, len(recent_messages)):
-            # Check similarity (simplified)
-            if recent_messages[i] == recent_messages[i-1]:
-                repetitions += 1
-            elif len(set(recent_messages[i].split()) & set(recent_messages[i-1].split())) > 5:
-                repetitions += 0.5
-        
-        return min(1.0, repetitions / len(recent_messages))
+        return min(1.0, self.pair_sum / len(self.recent))
     
-    def _calculate_participation_balance(self, history: List[Dict]) -> float:
-        """Calculate how balanced participation is"""
-        sender_counts = Counter(msg['sender'] for msg in history[-20:])
-        
-        if len(sender_counts) < 2:
+    def participation_balance(self) -> float:
+        if len(self.senders) < 2:
             return 0.0
-        
-        # Calculate entropy-like measure
-        total = sum(sender_counts.values())
-        proportions = [count/total for count in sender_counts.values()]
-        
-        # Perfect balance would have equal proportions
-        ideal_proportion = 1.0 / len(sender_counts)
-        deviation = sum(abs(p - ideal_proportion) for p in proportions)
-        
+        total = sum(self.senders.values())
+        ideal_proportion = 1.0 / len(self.senders)
+        deviation = sum(abs(count / total - ideal_proportion) for count in self.senders.values())
         return max(0.0, 1.0 - deviation)
     
-    def _calculate_topic_diversity(self, history: List[Dict]) -> float:
-        """Calculate diversity of topics discussed"""
-        # Simple keyword-based topic detection
-        keywords = []
-        for msg in history[-20:]:
-            words = re.findall(r'\b\w{4,}\b', msg['content'].lower())
-            keywords.extend(words)
-        
-        if not keywords:
+    def topic_diversity(self) -> float:
+        if not self.keyword_total:
             return 0.0
+        return min(1.0, len(self.keywords) / self.keyword_total * 2)
+    
+    def average_length(self) -> float:
+        return self.length_sum / len(self.history) if self.history else 0.0
+
+
+class ConversationWindows:
+    """Per-channel conversation windows shared by the safeguards"""
+    
+    MAX_HISTORY = 100
+    METRIC_WINDOW = 20
+    NEAR_DUPLICATE_WINDOW = 500
+    
+    def __init__(self):
+        self._windows: Dict[str, ConversationWindow] = {}  # channel_id -> window
+        self._hasher = MinHasher()
+    
+    def get(self, channel_id: str) -> Optional[ConversationWindow]:
+        """A channel's window, if it has one"""
+        return self._windows.get(channel_id)
+    
+    def window(self, channel_id: str) -> ConversationWindow:
+        """A channel's window, created on first use"""
+        window = self._windows.get(channel_id)
+        if window is None:
+            window = self._windows[channel_id] = ConversationWindow(
+                self.MAX_HISTORY,
+                self.METRIC_WINDOW,
+                NearDuplicateIndex(window=self.NEAR_DUPLICATE_WINDOW, hasher=self._hasher)
+            )
+        return window
+    
+    def add(
+        self,
+        channel_id: str,
+        sender: str,
+        content: str,
+        analysis: Optional[TextAnalysis] = None
+    ) -> Dict:
+        """Append a message to its channel's window, returning its entry"""
+        return self.window(channel_id).add(sender, content, analysis or DEFAULT_LEXICON.analyze(content))
+    
+    def forget(self, channel_id: str):
+        """Drop a channel's window"""
+        self._windows.pop(channel_id, None)
+    
+    def __contains__(self, channel_id: str) -> bool:
+        return channel_id in self._windows
+    
+    def items(self):
+        return self._windows.items()
+
+
+class ConversationMonitor:
+    """
+    Monitors conversation health metrics
+    
+    Repetition, participation balance and topic diversity cover the last
+    METRIC_WINDOW messages of a channel; average length covers the
+    retained history. All are read from the accumulators of the shared
+    ConversationWindow.
+    """
+    
+    def __init__(self, windows: Optional[ConversationWindows] = None):
+        self.windows = windows or ConversationWindows()
+        self.max_history = self.windows.MAX_HISTORY
+    
+    @property
+    def conversation_history(self) -> Dict[str, Deque[Dict]]:
+        """Recent messages by channel"""
+        return {channel_id: window.history for channel_id, window in self.windows.items()}
+    
+    def add_message(
+        self,
+        channel_id: str,
+        sender: str,
+        content: str,
+        analysis: Optional[TextAnalysis] = None
+    ):
+        """Add a message to conversation history"""
+        self.windows.add(channel_id, sender, content, analysis)
+    
+    def forget_channel(self, channel_id: str):
+        """Drop a channel's history"""
+        self.windows.forget(channel_id)
+    
+    async def check_health(self, channel_id: str) -> ConversationHealth:
+        """Check the health of a conversation"""
+        return self.health(self.windows.get(channel_id))
+    
+    @staticmethod
+    def health(window: Optional[ConversationWindow]) -> ConversationHealth:
+        """Health metrics of a conversation window"""
+        if window is None or len(window.history) < 5:
+            # Not enough data
+            return ConversationHealth(0.0, 1.0, 1.0, 50.0)
         
-        # Unique keywords ratio
-        unique_ratio = len(set(keywords)) / len(keywords)
-        return min(1.0, unique_ratio * 2)  # Scale up
+        return ConversationHealth(
+            repetition_score=window.repetition(),
+            participation_balance=window.participation_balance(),
+            topic_diversity=window.topic_diversity(),
+            average_message_length=window.average_length()
+        )
 
 
 class LoopPattern:
     """Base class for loop pattern detection"""
     
+    name = "loop_pattern"
+    cost = 1  # Relative evaluation cost; cheaper patterns run first
+    history_size = 10  # Most recent messages passed to evaluate
+    
     def evaluate(self, minion_id: str, message: str, history: List[Dict]) -> LoopRisk:
         """Evaluate if this pattern is present"""
         raise NotImplementedError
+    
+    def prepare(self, window: ConversationWindow, entry: Dict):
+        """Compute anything evaluate reads from the new message's entry"""
+        pass
 
 
 class PingPongPattern(LoopPattern):
     """Detects A says X, B says Y, A says X... patterns"""
     
+    name = "ping_pong"
+    cost = 1
+    
     def evaluate(self, minion_id: str, message: str, history: List[Dict]) -> LoopRisk:
         if len(history) < 4:
             return LoopRisk("ping_pong", 0.0, "No pattern detected", "")
         
         # Check for alternating similar messages
         minion_messages = [
-            msg['content'] for msg in history[-10:]
+            msg['analysis'].lowered for msg in history[-10:]
             if msg['sender'] == minion_id
         ]
         
@@ -218,7 +462,7 @@ class PingPongPattern(LoopPattern):
             return LoopRisk("ping_pong", 0.0, "No pattern detected", "")
         
         # Check similarity
-        if minion_messages[-1].lower() == minion_messages[-2].lower():
+        if minion_messages[-1] == minion_messages[-2]:
             return LoopRisk(
                 "ping_pong",
                 0.8,
@@ -232,19 +476,22 @@ class PingPongPattern(LoopPattern):
 class EscalatingPattern(LoopPattern):
     """Detects increasingly intense exchanges"""
     
+    name = "escalating"
+    cost = 2
+    history_size = 5
+    
     def evaluate(self, minion_id: str, message: str, history: List[Dict]) -> LoopRisk:
         if len(history) < 5:
             return LoopRisk("escalating", 0.0, "No pattern detected", "")
         
-        # Check for increasing exclamation marks or caps
+        # Check for increasing exclamation marks or caps (scored once per message)
         recent = history[-5:]
         intensity_scores = []
         
         for msg in recent:
-            score = 0
-            score += msg['content'].count('!')
-            score += msg['content'].count('?')
-            score += sum(1 for c in msg['content'] if c.isupper()) / max(1, len(msg['content']))
+            score = msg.get('intensity')
+            if score is None:
+                score = msg['intensity'] = self._intensity(msg['content'])
             intensity_scores.append(score)
         
         # Check if intensity is increasing
@@ -258,33 +505,114 @@ class EscalatingPattern(LoopPattern):
                 )
         
         return LoopRisk("escalating", 0.0, "No pattern detected", "")
+    
+    @staticmethod
+    def _intensity(content: str) -> float:
+        score = 0
+        score += content.count('!')
+        score += content.count('?')
+        score += sum(1 for c in content if c.isupper()) / max(1, len(content))
+        return score
+
+
+class ParaphrasePattern(LoopPattern):
+    """
+    Detects a minion repeating itself in different words
+    
+    Each near-duplicate counts less the older it is, halving every
+    HALF_LIFE seconds, so a topic revisited later in the day is not a
+    loop. It takes three fresh paraphrases of one's own messages, or
+    seven fresh echoes of others', to cross the loop threshold.
+    """
+    
+    name = "paraphrase"
+    cost = 5
+    history_size = 1
+    
+    OWN_WEIGHT = 0.25
+    ECHO_WEIGHT = 0.1
+    HALF_LIFE = 300.0
+    
+    def prepare(self, window: ConversationWindow, entry: Dict):
+        window.index_near_duplicates(entry)
+    
+    def evaluate(self, minion_id: str, message: str, history: List[Dict]) -> LoopRisk:
+        if not history or history[-1]['content'] != message:
+            return LoopRisk("paraphrase", 0.0, "No pattern detected", "")
+        
+        # Near-duplicates found when the message was indexed
+        near_duplicates = history[-1].get('near_duplicates', [])
+        now = history[-1]['timestamp']
+        own = echoed = 0
+        own_weight = echoed_weight = 0.0
+        for match in near_duplicates:
+            age = max(0.0, (now - match.timestamp).total_seconds())
+            weight = 0.5 ** (age / self.HALF_LIFE)
+            if match.sender == minion_id:
+                own += 1
+                own_weight += weight
+            else:
+                echoed += 1
+                echoed_weight += weight
+        
+        severity = min(0.9, self.OWN_WEIGHT * own_weight + self.ECHO_WEIGHT * echoed_weight)
+        if severity == 0.0:
+            return LoopRisk("paraphrase", 0.0, "No pattern detected", "")
+        
+        if own:
+            description = f"Message closely paraphrases {own} of your recent messages"
+        else:
+            description = f"Message closely echoes {echoed} recent messages from others"
+        return LoopRisk(
+            "paraphrase",
+            severity,
+            description,
+            "Add something new to the conversation or stay quiet"
+        )
 
 
 class LoopPatternDetector:
     """Detects communication patterns that indicate loops"""
     
-    def __init__(self):
+    def __init__(self, windows: Optional[ConversationWindows] = None):
         self.pattern_library = [
             PingPongPattern(),
             EscalatingPattern(),
+            ParaphrasePattern(),
             # More patterns can be added
         ]
-        self.conversation_history: Dict[str, List[Dict]] = {}
+        self.windows = windows or ConversationWindows()
     
-    def add_to_history(self, channel_id: str, sender: str, content: str):
+    @property
+    def patterns_by_cost(self) -> List[LoopPattern]:
+        """Patterns, cheapest first"""
+        return sorted(self.pattern_library, key=lambda pattern: pattern.cost)
+    
+    def add_to_history(
+        self,
+        channel_id: str,
+        sender: str,
+        content: str,
+        analysis: Optional[TextAnalysis] = None
+    ):
         """Add message to history for analysis"""
-        if channel_id not in self.conversation_history:
-            self.conversation_history[channel_id] = []
-        
-        self.conversation_history[channel_id].append({
-            'sender': sender,
-            'content': content,
-            'timestamp': datetime.now()
-        })
-        
-        # Keep only recent history
-        if len(self.conversation_history[channel_id]) > 50:
-            self.conversation_history[channel_id] = self.conversation_history[channel_id][-50:]
+        self.windows.add(channel_id, sender, content, analysis)
+    
+    def forget_channel(self, channel_id: str):
+        """Drop a channel's history"""
+        self.windows.forget(channel_id)
+    
+    def evaluate(
+        self,
+        pattern: LoopPattern,
+        minion_id: str,
+        message: str,
+        window: ConversationWindow
+    ) -> LoopRisk:
+        """Evaluate one pattern against the newest message of a window"""
+        if window.history:
+            pattern.prepare(window, window.history[-1])
+        return pattern.evaluate(minion_id, message, window.last(pattern.history_size))
     
     async def assess_loop_risk(
         self,
@@ -293,24 +621,50 @@ class LoopPatternDetector:
         message: str
     ) -> LoopRisk:
         """Assess risk of communication loop"""
-        history = self.conversation_history.get(channel_id, [])
+        window = self.windows.window(channel_id)
         
         # Evaluate each pattern
         risks = []
         for pattern in self.pattern_library:
-            risk = pattern.evaluate(minion_id, message, history)
+            risk = self.evaluate(pattern, minion_id, message, window)
             risks.append(risk)
         
         # Return highest risk
         return max(risks, key=lambda r: r.severity)
 
 
+@dataclass
+class SafeguardCheck:
+    """One stage of the safeguard pipeline and its timing"""
+    name: str
+    cost: int
+    runs: int = 0
+    denials: int = 0
+    total_seconds: float = 0.0
+    
+    def to_dict(self) -> Dict:
+        return {
+            "cost": self.cost,
+            "runs": self.runs,
+            "denials": self.denials,
+            "avg_us": round(self.total_seconds / self.runs * 1e6, 1) if self.runs else 0.0
+        }
+
+
 class CommunicationSafeguards:
     """
     Prevents runaway communication loops
     
     Integrates rate limiting, pattern detection, and health monitoring
-    to ensure healthy communication patterns.
+    to ensure healthy communication patterns. A legion-wide reply graph
+    throttles Minions caught in a runaway cycle of repeated replies,
+    even one spread over several channels.
+    
+    Checks run cheapest first and stop at the first denial. A message
+    that passes the O(1) gates is tokenized once and appended once to
+    its channel's shared ConversationWindow, which pattern detection and
+    health monitoring both read. Each check's run count, denials and
+    average time are exported by get_stats.
     """
     
     MAX_REPETITION = 0.7
@@ -318,8 +672,33 @@ class CommunicationSafeguards:
     
     def __init__(self):
         self.rate_limiter = RateLimiter(RateLimitConfig())
-        self.pattern_detector = LoopPatternDetector()
-        self.conversation_monitor = ConversationMonitor()
+        self.windows = ConversationWindows()
+        self.pattern_detector = LoopPatternDetector(self.windows)
+        self.conversation_monitor = ConversationMonitor(self.windows)
+        self.reply_graph = ReplyGraph()
+        # Every channel's messages, to see replies repeated across channels
+        self.legion_near_duplicates = NearDuplicateIndex(window=ConversationWindows.NEAR_DUPLICATE_WINDOW)
+        
+        self.checks: Dict[str, SafeguardCheck] = {}
+        for name, cost in [("rate_limit", 0), ("reply_cycle", 0), ("analysis", 1), ("conversation_health", 1)]:
+            self.checks[name] = SafeguardCheck(name, cost)
+        for pattern in self.pattern_detector.pattern_library:
+            self.checks[pattern.name] = SafeguardCheck(pattern.name, pattern.cost)
+    
+    def set_channel_rate_limit(self, channel_id: str, messages_per_minute: Optional[int]):
+        """Enforce a channel's overall message rate (Channel.max_message_rate)"""
+        self.rate_limiter.set_channel_limit(channel_id, messages_per_minute)
+    
+    def forget_channel(self, channel_id: str):
+        """Drop rate-limit state and history of a deleted channel"""
+        self.rate_limiter.forget_channel(channel_id)
+        self.reply_graph.forget_channel(channel_id)
+        self.windows.forget(channel_id)
+    
+    def forget_minion(self, minion_id: str):
+        """Drop rate-limit and reply-graph state of a removed minion"""
+        self.rate_limiter.forget_minion(minion_id)
+        self.reply_graph.forget_minion(minion_id)
     
     async def check_message_allowed(
         self,
@@ -334,23 +713,72 @@ class CommunicationSafeguards:
             Tuple of (allowed, reason_if_denied)
         """
         # Rate limiting
-        if not self.rate_limiter.check_allowed(minion_id, channel_id):
-            return False, "Rate limit exceeded"
-        
-        # Pattern detection
-        self.pattern_detector.add_to_history(channel_id, minion_id, message)
-        loop_risk = await self.pattern_detector.assess_loop_risk(
-            minion_id, channel_id, message
-        )
-        
-        if loop_risk.severity > self.LOOP_RISK_THRESHOLD:
-            return False, f"Potential loop detected: {loop_risk.description}"
-        
-        # Conversation health monitoring
-        self.conversation_monitor.add_message(channel_id, minion_id, message)
-        health = await self.conversation_monitor.check_health(channel_id)
-        
-        if health.repetition_score > self.MAX_REPETITION:
-            return False, "Conversation becoming too repetitive"
-        
+        with self._timed("rate_limit") as check:
+            if not self.rate_limiter.check_allowed(minion_id, channel_id):
+                return check.deny("Rate limit exceeded")
+        
+        # Legion-wide reply cycles
+        with self._timed("reply_cycle") as check:
+            throttled_for = self.reply_graph.throttled_for(minion_id)
+            if throttled_for > 0:
+                return check.deny(f"Caught in a runaway reply cycle, paused for {throttled_for:.0f}s")
+        
+        # Tokenize once and append once for all downstream checks
+        with self._timed("analysis"):
+            window = self.windows.window(channel_id)
+            window.add(minion_id, message, DEFAULT_LEXICON.analyze(message))
+        
+        # Conversation health monitoring (O(1) accumulators)
+        with self._timed("conversation_health") as check:
+            health = self.conversation_monitor.health(window)
+            if health.repetition_score > self.MAX_REPETITION:
+                return check.deny("Conversation becoming too repetitive")
+        
+        # Pattern detection, cheapest first
+        for pattern in self.pattern_detector.patterns_by_cost:
+            with self._timed(pattern.name) as check:
+                loop_risk = self.pattern_detector.evaluate(pattern, minion_id, message, window)
+                if loop_risk.severity > self.LOOP_RISK_THRESHOLD:
+                    return check.deny(f"Potential loop detected: {loop_risk.description}")
+        
+        self.reply_graph.record(minion_id, channel_id, self._repetition(minion_id, window.history[-1]))
         return True, None
+    
+    def get_stats(self) -> Dict:
+        """Per-check timing and denials, plus reply-graph state"""
+        return {
+            "checks": {name: check.to_dict() for name, check in self.checks.items()},
+            "channels": sum(1 for _ in self.windows.items()),
+            "rate_limited_keys": self.rate_limiter.tracked_keys,
+            "reply_graph": self.reply_graph.get_stats()
+        }
+    
+    def _repetition(self, minion_id: str, entry: Dict) -> float:
+        """How closely an allowed message repeats recent messages on any channel"""
+        shingles = set(entry['analysis'].keywords)
+        if len(shingles) < ConversationWindow.MIN_SHINGLES:
+            return 0.0
+        matches = self.legion_near_duplicates.add(minion_id, shingles)
+        return matches[0].similarity if matches else 0.0
+    
+    def _timed(self, name: str) -> "_CheckTimer":
+        return _CheckTimer(self.checks[name])
+
+
+class _CheckTimer:
+    """Times one run of a safeguard check"""
+    
+    def __init__(self, check: SafeguardCheck):
+        self.check = check
+    
+    def deny(self, reason: str) -> Tuple[bool, Optional[str]]:
+        self.check.denials += 1
+        return False, reason
+    
+    def __enter__(self) -> "_CheckTimer":
+        self._started = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.check.runs += 1
+        self.check.total_seconds += time.perf_counter() - self._started
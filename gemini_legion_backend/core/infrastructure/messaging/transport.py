@@ -0,0 +1,464 @@
+"""
+Message Transports
+
+Pluggable pub/sub transports carrying the conversational, event and RPC
+layers of the inter-Minion communication system between processes, so
+a Legion can be sharded across uvicorn workers or CPU cores.
+
+Every backend delivers the messages of a topic to each subscribed node
+in one global order (the order they reached the broker), and the
+layers keep all traffic of a kind on a single topic, so per-channel
+ordering holds across processes.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from collections import defaultdict
+from urllib.parse import urlparse
+import asyncio
+import logging
+import multiprocessing
+import threading
+import uuid
+
+import msgpack
+
+
+logger = logging.getLogger(__name__)
+
+
+# Topics used by the communication layers
+CHAT_TOPIC = "chat"
+EVENTS_TOPIC = "events"
+RPC_REQUEST_TOPIC = "rpc.request"
+RPC_REPLY_TOPIC_PREFIX = "rpc.reply."
+
+TransportHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class Transport(ABC):
+    """
+    Topic-based publish/subscribe between nodes (processes)
+
+    Payloads are dicts; backends that leave the process encode them
+    with msgpack, so they must hold msgpack-serializable values.
+    Incoming messages are handed to the topic's handlers one at a time,
+    in arrival order.
+    """
+
+    def __init__(self, node_id: Optional[str] = None):
+        self.node_id = node_id or uuid.uuid4().hex[:12]
+        self._handlers: Dict[str, List[TransportHandler]] = defaultdict(list)
+        self.stats = {"published": 0, "received": 0, "handler_failures": 0}
+
+    async def start(self):
+        """Connect the transport"""
+
+    async def close(self):
+        """Disconnect the transport"""
+
+    @abstractmethod
+    async def publish(self, topic: str, payload: Dict[str, Any]):
+        """Publish a payload to every node subscribed to a topic"""
+
+    async def subscribe(self, topic: str, handler: TransportHandler):
+        """Receive a topic's messages"""
+        first = not self._handlers.get(topic)
+        self._handlers[topic].append(handler)
+        if first:
+            await self._on_subscribe(topic)
+
+    async def unsubscribe(self, topic: str, handler: TransportHandler):
+        """Stop receiving a topic's messages"""
+        handlers = self._handlers.get(topic)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+            if not handlers:
+                del self._handlers[topic]
+                await self._on_unsubscribe(topic)
+
+    async def _on_subscribe(self, topic: str):
+        """Backend hook: first local handler for a topic"""
+
+    async def _on_unsubscribe(self, topic: str):
+        """Backend hook: last local handler for a topic removed"""
+
+    async def _deliver(self, topic: str, payload: Dict[str, Any]):
+        """Hand an incoming message to the topic's handlers"""
+        self.stats["received"] += 1
+        for handler in list(self._handlers.get(topic, ())):
+            try:
+                await handler(payload)
+            except Exception as e:
+                self.stats["handler_failures"] += 1
+                logger.error(f"Transport handler for {topic} failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Transport counters"""
+        return {
+            "backend": type(self).__name__,
+            "node_id": self.node_id,
+            "topics": sorted(self._handlers),
+            **self.stats
+        }
+
+
+class InProcessTransport(Transport):
+    """
+    Loopback transport within one event loop
+
+    Delivers synchronously to local handlers without serialization.
+    Several communication systems sharing one instance behave like
+    nodes on a common broker.
+    """
+
+    def __init__(self, node_id: Optional[str] = None):
+        super().__init__(node_id)
+        self._peers: List["InProcessTransport"] = [self]
+
+    def connect(self, other: "InProcessTransport"):
+        """Join another in-process transport's group of nodes"""
+        for peer in other._peers:
+            if peer not in self._peers:
+                self._peers.append(peer)
+        for peer in self._peers:
+            peer._peers = self._peers
+
+    async def publish(self, topic: str, payload: Dict[str, Any]):
+        self.stats["published"] += 1
+        for peer in list(self._peers):
+            if topic in peer._handlers:
+                await peer._deliver(topic, payload)
+
+
+class _ThreadedTransport(Transport):
+    """Base for backends with a blocking reader feeding the event loop"""
+
+    def __init__(self, node_id: Optional[str] = None):
+        super().__init__(node_id)
+        self._incoming: Optional[asyncio.Queue] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+
+    def _start_dispatcher(self):
+        self._incoming = asyncio.Queue()
+        self._dispatcher = asyncio.create_task(self._dispatch_loop())
+
+    async def _dispatch_loop(self):
+        """Deliver decoded messages in arrival order"""
+        while True:
+            try:
+                topic, payload = await self._incoming.get()
+                await self._deliver(topic, payload)
+            except asyncio.CancelledError:
+                break
+
+    async def _stop_dispatcher(self):
+        if self._dispatcher and not self._dispatcher.done():
+            self._dispatcher.cancel()
+
+
+class MultiprocessingHub:
+    """
+    Broker for MultiprocessingTransports in worker processes
+
+    Every node publishes into one shared inbox; a forwarding thread in
+    the process owning the hub copies each message, in inbox order, to
+    every node's outbox. Create the hub before starting the workers and
+    pass each worker its transport(index).
+    """
+
+    def __init__(self, nodes: int, context: Optional[Any] = None):
+        """
+        Create the shared queues
+
+        Args:
+            nodes: Number of worker nodes
+            context: multiprocessing context (defaults to the current one)
+        """
+        context = context or multiprocessing.get_context()
+        self.inbox = context.Queue()
+        self.outboxes = [context.Queue() for _ in range(nodes)]
+        self._thread: Optional[threading.Thread] = None
+
+    def transport(self, index: int) -> "MultiprocessingTransport":
+        """Transport for worker node index"""
+        return MultiprocessingTransport(self.inbox, self.outboxes[index], node_id=f"node-{index}")
+
+    def start(self):
+        """Start forwarding"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._forward, name="legion-mp-hub", daemon=True)
+            self._thread.start()
+
+    def _forward(self):
+        while True:
+            frame = self.inbox.get()
+            if frame is None:
+                break
+            for outbox in self.outboxes:
+                outbox.put(frame)
+
+    def stop(self):
+        """Stop forwarding"""
+        if self._thread is not None:
+            self.inbox.put(None)
+            self._thread.join(timeout=5)
+            self._thread = None
+
+
+class MultiprocessingTransport(_ThreadedTransport):
+    """
+    Transport over multiprocessing queues, brokered by a MultiprocessingHub
+
+    Each node receives every frame and filters by its subscribed topics.
+    """
+
+    def __init__(self, inbox: Any, outbox: Any, node_id: Optional[str] = None):
+        super().__init__(node_id)
+        self.inbox = inbox
+        self.outbox = outbox
+        self._reader: Optional[threading.Thread] = None
+
+    def __getstate__(self):
+        # Only the queues and identity travel to the worker process
+        return {"inbox": self.inbox, "outbox": self.outbox, "node_id": self.node_id}
+
+    def __setstate__(self, state):
+        self.__init__(state["inbox"], state["outbox"], state["node_id"])
+
+    async def start(self):
+        if self._reader is not None:
+            return
+        self._start_dispatcher()
+        loop = asyncio.get_running_loop()
+        self._reader = threading.Thread(
+            target=self._read, args=(loop,), name=f"legion-mp-{self.node_id}", daemon=True
+        )
+        self._reader.start()
+
+    def _read(self, loop: asyncio.AbstractEventLoop):
+        """Blocking reader thread"""
+        while True:
+            frame = self.outbox.get()
+            if frame is None:
+                break
+            topic, payload = msgpack.unpackb(frame, raw=False)
+            if topic in self._handlers:
+                loop.call_soon_threadsafe(self._incoming.put_nowait, (topic, payload))
+
+    async def publish(self, topic: str, payload: Dict[str, Any]):
+        self.stats["published"] += 1
+        self.inbox.put(msgpack.packb((topic, payload), use_bin_type=True))
+
+    async def close(self):
+        if self._reader is not None:
+            self.outbox.put(None)
+            await asyncio.get_running_loop().run_in_executor(None, self._reader.join, 5)
+            self._reader = None
+        await self._stop_dispatcher()
+
+
+class RespProtocolError(Exception):
+    """Raised on a malformed or error reply from a Redis-protocol server"""
+
+
+class RedisTransport(Transport):
+    """
+    Transport over Redis pub/sub, speaking RESP directly
+
+    Uses one connection for PUBLISH and one for SUBSCRIBE. Works with
+    Redis or any server implementing the same commands (e.g. a local
+    stand-in during tests). Topics are prefixed with channel_prefix.
+
+    subscribe returns once the server has acknowledged the
+    subscription, so messages published after it are received. A lost
+    subscriber connection is re-opened with exponential backoff and
+    its topics resubscribed; messages published while it is down are
+    missed, as with any Redis pub/sub client. A publish that fails on
+    a broken connection is retried once on a fresh one.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        channel_prefix: str = "legion:",
+        node_id: Optional[str] = None,
+        ack_timeout: float = 5.0,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 30.0
+    ):
+        super().__init__(node_id)
+        self.host = host
+        self.port = port
+        self.channel_prefix = channel_prefix
+        self.ack_timeout = ack_timeout
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self._pub: Optional[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = None
+        self._sub: Optional[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = None
+        self._pub_lock = asyncio.Lock()
+        self._reader_task: Optional[asyncio.Task] = None
+        self._sub_acks: Dict[bytes, List[asyncio.Future]] = defaultdict(list)  # channel -> waiting subscribes
+        self.stats["reconnects"] = 0
+
+    async def start(self):
+        if self._pub is not None:
+            return
+        self._pub = await asyncio.open_connection(self.host, self.port)
+        self._sub = await asyncio.open_connection(self.host, self.port)
+        self._reader_task = asyncio.create_task(self._read_loop())
+        for topic in list(self._handlers):
+            await self._on_subscribe(topic)
+
+    async def close(self):
+        if self._reader_task and not self._reader_task.done():
+            self._reader_task.cancel()
+        self._reader_task = None
+        for connection in (self._pub, self._sub):
+            if connection is not None:
+                connection[1].close()
+        self._pub = self._sub = None
+
+    async def publish(self, topic: str, payload: Dict[str, Any]):
+        self.stats["published"] += 1
+        command = self._encode_command(b"PUBLISH", self._channel(topic), msgpack.packb(payload, use_bin_type=True))
+        async with self._pub_lock:
+            try:
+                await self._publish_on(self._pub, command)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                logger.warning(f"Redis transport {self.node_id} lost its publisher connection, reconnecting")
+                self._pub[1].close()
+                self._pub = await asyncio.open_connection(self.host, self.port)
+                self.stats["reconnects"] += 1
+                await self._publish_on(self._pub, command)
+
+    async def _publish_on(self, connection: Tuple[asyncio.StreamReader, asyncio.StreamWriter], command: bytes):
+        reader, writer = connection
+        writer.write(command)
+        await writer.drain()
+        await self._read_reply(reader)
+
+    async def _on_subscribe(self, topic: str):
+        if self._sub is None:
+            return
+        channel = self._channel(topic)
+        ack = asyncio.get_running_loop().create_future()
+        self._sub_acks[channel].append(ack)
+        try:
+            self._sub[1].write(self._encode_command(b"SUBSCRIBE", channel))
+            await self._sub[1].drain()
+            await asyncio.wait_for(ack, self.ack_timeout)
+        finally:
+            acks = self._sub_acks.get(channel)
+            if acks and ack in acks:
+                acks.remove(ack)
+                if not acks:
+                    del self._sub_acks[channel]
+
+    async def _on_unsubscribe(self, topic: str):
+        if self._sub is not None:
+            self._sub[1].write(self._encode_command(b"UNSUBSCRIBE", self._channel(topic)))
+            await self._sub[1].drain()
+
+    def _channel(self, topic: str) -> bytes:
+        return (self.channel_prefix + topic).encode("utf-8")
+
+    async def _read_loop(self):
+        """Read pushed messages and subscription acks from the subscriber connection"""
+        prefix = len(self.channel_prefix)
+        while True:
+            try:
+                reply = await self._read_reply(self._sub[0])
+                if not isinstance(reply, list) or len(reply) != 3:
+                    continue
+                if reply[0] == b"message":
+                    topic = reply[1].decode("utf-8")[prefix:]
+                    await self._deliver(topic, msgpack.unpackb(reply[2], raw=False))
+                elif reply[0] == b"subscribe":
+                    acks = self._sub_acks.get(reply[1])
+                    if acks:
+                        ack = acks.pop(0)
+                        if not acks:
+                            del self._sub_acks[reply[1]]
+                        if not ack.done():
+                            ack.set_result(True)
+            except asyncio.CancelledError:
+                break
+            except (ConnectionError, asyncio.IncompleteReadError):
+                logger.warning(f"Redis transport {self.node_id} lost its subscriber connection, reconnecting")
+                await self._reconnect_subscriber()
+            except Exception as e:
+                logger.error(f"Redis transport {self.node_id} read failed: {e}")
+
+    async def _reconnect_subscriber(self):
+        """Re-open the subscriber connection with backoff and resubscribe every topic"""
+        self._sub[1].close()
+        delay = self.reconnect_delay
+        while True:
+            try:
+                self._sub = await asyncio.open_connection(self.host, self.port)
+                break
+            except OSError as e:
+                logger.warning(f"Redis transport {self.node_id} reconnect failed, retrying in {delay:.1f}s: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+        self.stats["reconnects"] += 1
+        # Acks arrive on this loop, so resubscribing does not wait for them
+        channels = [self._channel(topic) for topic in self._handlers]
+        if channels:
+            try:
+                self._sub[1].write(self._encode_command(b"SUBSCRIBE", *channels))
+                await self._sub[1].drain()
+            except ConnectionError:
+                pass  # The next read notices and reconnects again
+
+    @staticmethod
+    def _encode_command(*args: bytes) -> bytes:
+        """Encode a command as a RESP array of bulk strings"""
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        return b"".join(parts)
+
+    @classmethod
+    async def _read_reply(cls, reader: asyncio.StreamReader) -> Any:
+        """Parse one RESP reply"""
+        line = await reader.readuntil(b"\r\n")
+        kind, body = line[:1], line[1:-2]
+        if kind == b"+":
+            return body
+        if kind == b"-":
+            raise RespProtocolError(body.decode("utf-8", "replace"))
+        if kind == b":":
+            return int(body)
+        if kind == b"$":
+            length = int(body)
+            if length < 0:
+                return None
+            return (await reader.readexactly(length + 2))[:-2]
+        if kind == b"*":
+            length = int(body)
+            if length < 0:
+                return None
+            return [await cls._read_reply(reader) for _ in range(length)]
+        raise RespProtocolError(f"Unexpected reply type {kind!r}")
+
+
+def create_transport(url: Optional[str]) -> Optional[Transport]:
+    """
+    Build a transport from a URL
+
+    "memory://" gives an InProcessTransport and "redis://host:port" a
+    RedisTransport. Returns None for an empty URL (purely local
+    messaging). The multiprocessing backend needs queues shared before
+    the workers start, so it is built with MultiprocessingHub instead.
+    """
+    if not url:
+        return None
+    parsed = urlparse(url)
+    if parsed.scheme == "memory":
+        return InProcessTransport()
+    if parsed.scheme == "redis":
+        return RedisTransport(host=parsed.hostname or "localhost", port=parsed.port or 6379)
+    raise ValueError(f"Unsupported transport URL: {url}")
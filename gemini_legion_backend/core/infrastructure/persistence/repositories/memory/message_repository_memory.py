@@ -7,6 +7,7 @@ In-memory implementation of MessageRepository for testing and development.
 from typing import List, Optional, Dict
 from datetime import datetime
 import asyncio
+import bisect
 from copy import deepcopy
 from collections import defaultdict
 
@@ -19,12 +20,16 @@ class MessageRepositoryMemory(MessageRepository):
     In-memory implementation of MessageRepository
     
     Stores messages organized by channel for efficient retrieval.
+    Each channel's messages are kept in sequence order alongside a
+    parallel list of sequence numbers, so cursor pages are found by
+    binary search.
     """
     
     def __init__(self):
         """Initialize the in-memory storage"""
         # Messages stored by channel_id for efficient channel queries
         self._messages_by_channel: Dict[str, List[Message]] = defaultdict(list)
+        self._seqs_by_channel: Dict[str, List[int]] = defaultdict(list)
         # Also store by message_id for direct lookups
         self._messages_by_id: Dict[str, Message] = {}
         self._lock = asyncio.Lock()
@@ -45,22 +50,22 @@ class MessageRepositoryMemory(MessageRepository):
             
             # Update or add to channel list
             channel_messages = self._messages_by_channel[entity.channel_id]
-            
-            # Check if updating existing message
-            existing_index = None
-            for i, msg in enumerate(channel_messages):
-                if msg.message_id == entity.message_id:
-                    existing_index = i
-                    break
-            
-            if existing_index is not None:
-                # Update existing message
-                channel_messages[existing_index] = saved_message
+            channel_seqs = self._seqs_by_channel[entity.channel_id]
+            
+            existing = self._messages_by_id.get(entity.message_id)
+            if existing is not None and existing.channel_id == entity.channel_id:
+                # Update existing message in place
+                index = self._index_of(channel_messages, channel_seqs, existing)
+                channel_messages[index] = saved_message
+                channel_seqs[index] = self._seq_key(saved_message)
+                if channel_seqs[index] != self._seq_key(existing):
+                    self._resort(entity.channel_id)
             else:
-                # Add new message
-                channel_messages.append(saved_message)
-                # Sort by timestamp
-                channel_messages.sort(key=lambda m: m.timestamp)
+                # Add new message in sequence order (usually an append)
+                key = self._seq_key(saved_message)
+                index = bisect.bisect_right(channel_seqs, key)
+                channel_seqs.insert(index, key)
+                channel_messages.insert(index, saved_message)
             
             # Update ID lookup
             self._messages_by_id[entity.message_id] = saved_message
@@ -120,9 +125,10 @@ class MessageRepositoryMemory(MessageRepository):
             
             # Remove from channel list
             channel_messages = self._messages_by_channel[message.channel_id]
-            self._messages_by_channel[message.channel_id] = [
-                m for m in channel_messages if m.message_id != entity_id
-            ]
+            channel_seqs = self._seqs_by_channel[message.channel_id]
+            index = self._index_of(channel_messages, channel_seqs, message)
+            del channel_messages[index]
+            del channel_seqs[index]
             
             # Remove from ID lookup
             del self._messages_by_id[entity_id]
@@ -166,8 +172,8 @@ class MessageRepositoryMemory(MessageRepository):
         async with self._lock:
             messages = self._messages_by_channel.get(channel_id, [])
             
-            # Apply filters
-            filtered = messages
+            # Apply filters (on a copy; the stored list stays in sequence order)
+            filtered = list(messages)
             
             if before:
                 filtered = [m for m in filtered if m.timestamp < before]
@@ -186,6 +192,76 @@ class MessageRepositoryMemory(MessageRepository):
             
             return [deepcopy(m) for m in filtered]
     
+    async def get_messages_by_sequence(
+        self,
+        channel_id: str,
+        limit: int = 50,
+        before_seq: Optional[int] = None,
+        after_seq: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Message]:
+        """
+        Get a page of a channel's messages by sequence number
+        
+        Args:
+            channel_id: The ID of the channel
+            limit: Maximum number of messages to return
+            before_seq: Only messages with a lower sequence number
+            after_seq: Only messages with a higher sequence number
+            offset: Messages to skip, starting at the cursor
+            
+        Returns:
+            Messages in ascending sequence order
+        """
+        async with self._lock:
+            messages = self._messages_by_channel.get(channel_id, [])
+            seqs = self._seqs_by_channel.get(channel_id, [])
+            
+            low = bisect.bisect_right(seqs, after_seq) if after_seq is not None else 0
+            high = bisect.bisect_left(seqs, before_seq) if before_seq is not None else len(seqs)
+            
+            if after_seq is not None:
+                start = min(low + offset, high)
+                end = min(start + limit, high)
+            else:
+                end = max(high - offset, low)
+                start = max(end - limit, low)
+            
+            return [deepcopy(m) for m in messages[start:end]]
+    
+    async def get_latest_sequence(self, channel_id: str) -> int:
+        """
+        Get the highest sequence number stored for a channel
+        
+        Args:
+            channel_id: The ID of the channel
+            
+        Returns:
+            The highest sequence number, 0 if the channel has none
+        """
+        async with self._lock:
+            seqs = self._seqs_by_channel.get(channel_id)
+            return max(seqs[-1], 0) if seqs else 0
+    
+    @staticmethod
+    def _seq_key(message: Message) -> int:
+        """Sort key of a message; messages without a sequence sort first"""
+        return message.seq if message.seq is not None else -1
+    
+    def _index_of(self, messages: List[Message], seqs: List[int], message: Message) -> int:
+        """Position of a stored message, searching only its sequence number's run"""
+        key = self._seq_key(message)
+        index = bisect.bisect_left(seqs, key)
+        while messages[index].message_id != message.message_id:
+            index += 1
+        return index
+    
+    def _resort(self, channel_id: str):
+        """Restore sequence order after a message's sequence changed"""
+        messages = self._messages_by_channel[channel_id]
+        messages.sort(key=self._seq_key)
+        self._seqs_by_channel[channel_id] = [self._seq_key(m) for m in messages]
+    
     async def get_thread_messages(
         self,
         parent_message_id: str,
@@ -288,4 +364,5 @@ class MessageRepositoryMemory(MessageRepository):
         """Clear all messages from memory (for testing)"""
         async with self._lock:
             self._messages_by_channel.clear()
+            self._seqs_by_channel.clear()
             self._messages_by_id.clear()
\ No newline at end of file
@@ -4,7 +4,7 @@ Memory-based Minion Repository Implementation
 In-memory implementation of MinionRepository for testing and development.
 """
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Any
 from datetime import datetime
 import asyncio
 from copy import deepcopy
@@ -191,30 +191,31 @@ class MinionRepositoryMemory(MinionRepository):
     async def update_emotional_state(
         self,
         minion_id: str,
-        emotional_state_data: Dict
-    ) -> Optional[Minion]:
+        changes: Dict[str, Any],
+        state_version: int
+    ) -> bool:
         """
-        Update a minion's emotional state
+        Persist only the changed fields of a minion's emotional state
         
         Args:
             minion_id: The ID of the minion
-            emotional_state_data: The new emotional state data
+            changes: Changed fields in EmotionalState.to_field_map form
+            state_version: State version the changes bring the minion to
             
         Returns:
-            The updated minion if found, None otherwise
+            True if the minion was found and updated, False otherwise
         """
         async with self._lock:
             minion = self._minions.get(minion_id)
-            if not minion:
-                return None
+            if not minion or not minion.emotional_state:
+                return False
             
-            # Update emotional state from data
-            # This would typically deserialize the data into EmotionalState
-            # For now, we'll just update the timestamp
-            minion.emotional_state.last_updated = datetime.now()
+            # Apply in place; no full copy of the minion is needed
+            minion.emotional_state.apply_field_map(changes)
+            minion.emotional_state.state_version = state_version
             minion.last_activity = datetime.now()
             
-            return deepcopy(minion)
+            return True
     
     async def list_by_expertise(self, expertise: str) -> List[Minion]:
         """
@@ -43,6 +43,47 @@ class MessageRepository(Repository[Message]):
         """
         pass
     
+    @abstractmethod
+    async def get_messages_by_sequence(
+        self,
+        channel_id: str,
+        limit: int = 50,
+        before_seq: Optional[int] = None,
+        after_seq: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Message]:
+        """
+        Get a page of a channel's messages by sequence number
+        
+        With after_seq the page holds the oldest messages after the
+        cursor; otherwise the newest messages before before_seq (or the
+        latest messages). offset skips messages next to the cursor.
+        
+        Args:
+            channel_id: The ID of the channel
+            limit: Maximum number of messages to return
+            before_seq: Only messages with a lower sequence number
+            after_seq: Only messages with a higher sequence number
+            offset: Messages to skip, starting at the cursor
+            
+        Returns:
+            Messages in ascending sequence order
+        """
+        pass
+    
+    @abstractmethod
+    async def get_latest_sequence(self, channel_id: str) -> int:
+        """
+        Get the highest sequence number stored for a channel
+        
+        Args:
+            channel_id: The ID of the channel
+            
+        Returns:
+            The highest sequence number, 0 if the channel has none
+        """
+        pass
+    
     @abstractmethod
     async def get_thread_messages(self, parent_message_id: str) -> List[Message]:
         """
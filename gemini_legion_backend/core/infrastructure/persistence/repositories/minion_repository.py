@@ -4,7 +4,7 @@ Minion Repository Interface
 This module defines the repository interface for Minion entities.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Dict, Any
 from abc import abstractmethod
 
 from .base import Repository
@@ -57,4 +57,24 @@ class MinionRepository(Repository[Minion]):
         Returns:
             List of minions with the specified expertise
         """
-        pass
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    async def update_emotional_state(
+        self,
+        minion_id: str,
+        changes: Dict[str, Any],
+        state_version: int
+    ) -> bool:
+        """
+        Persist only the changed fields of a minion's emotional state
+        
+        Args:
+            minion_id: The ID of the minion
+            changes: Changed fields in EmotionalState.to_field_map form
+            state_version: State version the changes bring the minion to
+            
+        Returns:
+            True if the minion was found and updated, False otherwise
+        """
+        pass
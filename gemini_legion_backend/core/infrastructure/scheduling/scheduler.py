@@ -0,0 +1,449 @@
+"""
+Job Scheduler
+
+One scheduler owns the backend's periodic and deadline jobs (message
+persistence, cleanup, state sync, health checks, memory consolidation,
+...) instead of each service running its own sleep loop. Timers live in
+a hierarchical timer wheel, and a single driver task wakes only when a
+timer is due or a wheel level has to cascade.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+import asyncio
+import itertools
+import logging
+import random
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class _Timer:
+    """A pending expiry in the wheel"""
+    tick: int
+    job: "Job"
+    cancelled: bool = False
+
+
+class TimerWheel:
+    """
+    Hierarchical hashed timer wheel
+
+    Level 0 has one slot per tick; each higher level has slots spanning
+    a whole rotation of the level below. A timer goes into the lowest
+    level whose range covers its delay and cascades down one level each
+    time that level's slot comes around, so adding, cancelling and
+    expiring timers are all O(1) regardless of how many are pending.
+    """
+
+    def __init__(self, slot_bits: int = 6, levels: int = 4):
+        """
+        Initialize the wheel
+
+        Args:
+            slot_bits: log2 of the slots per level
+            levels: Number of levels (range is slots ** levels ticks)
+        """
+        self.slot_bits = slot_bits
+        self.slots = 1 << slot_bits
+        self.levels = levels
+        self.current = 0  # Last tick processed
+        self._wheel: List[List[Set[_Timer]]] = [
+            [set() for _ in range(self.slots)] for _ in range(levels)
+        ]
+        self._overflow: Set[_Timer] = set()
+        self.pending = 0
+
+    def add(self, timer: _Timer):
+        """Place a timer due at timer.tick"""
+        tick = max(timer.tick, self.current + 1)
+        timer.tick = tick
+        delta = tick - self.current
+        for level in range(self.levels):
+            if delta < 1 << (self.slot_bits * (level + 1)):
+                slot = (tick >> (self.slot_bits * level)) & (self.slots - 1)
+                self._wheel[level][slot].add(timer)
+                break
+        else:
+            self._overflow.add(timer)
+        self.pending += 1
+
+    def discard(self, timer: _Timer):
+        """Cancel a timer (removed lazily when its slot is reached)"""
+        if not timer.cancelled:
+            timer.cancelled = True
+            self.pending -= 1
+
+    def advance(self, to_tick: int) -> List[_Timer]:
+        """Process ticks up to to_tick, returning the live timers that expired"""
+        expired: List[_Timer] = []
+        mask = self.slots - 1
+        while self.current < to_tick:
+            self.current += 1
+            tick = self.current
+
+            # Cascade higher levels whose slot boundary has been reached
+            for level in range(1, self.levels):
+                if tick & ((1 << (self.slot_bits * level)) - 1):
+                    break
+                slot = (tick >> (self.slot_bits * level)) & mask
+                timers, self._wheel[level][slot] = self._wheel[level][slot], set()
+                for timer in timers:
+                    if timer.cancelled:
+                        continue
+                    self.pending -= 1
+                    if timer.tick > tick:
+                        self.add(timer)
+                    else:
+                        expired.append(timer)
+            else:
+                if not tick & ((1 << (self.slot_bits * self.levels)) - 1):
+                    timers, self._overflow = self._overflow, set()
+                    for timer in timers:
+                        if not timer.cancelled:
+                            self.pending -= 1
+                            self.add(timer)
+
+            slot = tick & mask
+            timers, self._wheel[0][slot] = self._wheel[0][slot], set()
+            for timer in timers:
+                if timer.cancelled:
+                    continue
+                if timer.tick > tick:  # Placed a full rotation ahead
+                    self._wheel[0][slot].add(timer)
+                    continue
+                self.pending -= 1
+                expired.append(timer)
+        return expired
+
+    def next_wakeup(self) -> int:
+        """Earliest tick the driver must process (an expiry or a cascade)"""
+        mask = self.slots - 1
+        for offset in range(1, self.slots + 1):
+            tick = self.current + offset
+            if self._wheel[0][tick & mask]:
+                return tick
+            if not tick & mask:
+                return tick  # Level 1 cascades here
+        return self.current + self.slots
+
+
+@dataclass
+class JobStats:
+    """Run-time metrics of a job"""
+    runs: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    skipped_overlaps: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    last_started: Optional[datetime] = None
+    last_seconds: float = 0.0
+    last_error: Optional[str] = None
+
+
+@dataclass(eq=False)
+class Job:
+    """A periodic or one-shot job"""
+    name: str
+    func: Callable[[], Awaitable[Any]]
+    interval: Optional[float]  # None for a one-shot (deadline) job
+    jitter: float = 0.0  # Fraction of the interval added at random
+    max_backoff: Optional[float] = None
+    timeout: Optional[float] = None
+    allow_overlap: bool = False
+    stats: JobStats = field(default_factory=JobStats)
+    next_run: Optional[float] = None
+    _nominal: Optional[float] = None  # Un-jittered due time, so fixed-rate runs do not drift
+    _timer: Optional[_Timer] = None
+    _running: Set[asyncio.Task] = field(default_factory=set)
+
+    def to_dict(self, now: float) -> Dict[str, Any]:
+        stats = self.stats
+        return {
+            "interval": self.interval,
+            "running": len(self._running),
+            "runs": stats.runs,
+            "failures": stats.failures,
+            "consecutive_failures": stats.consecutive_failures,
+            "skipped_overlaps": stats.skipped_overlaps,
+            "avg_ms": round(stats.total_seconds / stats.runs * 1000, 2) if stats.runs else 0.0,
+            "max_ms": round(stats.max_seconds * 1000, 2),
+            "last_ms": round(stats.last_seconds * 1000, 2),
+            "last_started": stats.last_started.isoformat() if stats.last_started else None,
+            "last_error": stats.last_error,
+            "next_run_in": round(self.next_run - now, 2) if self.next_run is not None else None
+        }
+
+
+class Scheduler:
+    """
+    Runs periodic and deadline jobs from one timer wheel
+
+    Periodic jobs run at a fixed rate with optional random jitter. A
+    run still in progress when the next one is due makes that run skip
+    (unless allow_overlap). A failing job is retried with exponential
+    backoff, starting at its interval and capped at max_backoff, until it
+    succeeds again. Per-job run counts, failures, skips and durations
+    are kept for get_stats.
+    """
+
+    def __init__(self, tick: float = 0.5, slot_bits: int = 6, levels: int = 4):
+        """
+        Initialize the scheduler
+
+        Args:
+            tick: Timer resolution in seconds
+            slot_bits: log2 of the wheel slots per level
+            levels: Wheel levels (range is tick * 2 ** (slot_bits * levels))
+        """
+        self.tick = tick
+        self.wheel = TimerWheel(slot_bits, levels)
+        self.jobs: Dict[str, Job] = {}
+        self._driver: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self._origin: Optional[float] = None
+        self._ids = itertools.count()
+        self.stats = {
+            "wakeups": 0,
+            "timers_fired": 0
+        }
+
+    @property
+    def running(self) -> bool:
+        return self._driver is not None and not self._driver.done()
+
+    def start(self):
+        """Start the driver task (idempotent)"""
+        if self.running:
+            return
+        self._loop_time()  # Fix the wheel origin
+        self._driver = asyncio.create_task(self._drive())
+
+    async def stop(self):
+        """Stop the driver and cancel running jobs"""
+        if self._driver is not None:
+            self._driver.cancel()
+            try:
+                await self._driver
+            except asyncio.CancelledError:
+                pass
+            self._driver = None
+
+        tasks = [task for job in self.jobs.values() for task in job._running]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def every(
+        self,
+        name: str,
+        interval: float,
+        func: Callable[[], Awaitable[Any]],
+        jitter: float = 0.1,
+        initial_delay: Optional[float] = None,
+        max_backoff: Optional[float] = None,
+        timeout: Optional[float] = None,
+        allow_overlap: bool = False
+    ) -> Job:
+        """
+        Register a periodic job (replacing any job of the same name)
+
+        Args:
+            name: Unique job name
+            interval: Seconds between runs
+            func: Coroutine function run by the job
+            jitter: Fraction of the interval added at random to each delay
+            initial_delay: Seconds to the first run (defaults to interval)
+            max_backoff: Longest retry delay after failures (defaults to 10 intervals)
+            timeout: Seconds a run may take before it is cancelled
+            allow_overlap: Start runs even while the previous one is running
+
+        Returns:
+            The registered job
+        """
+        job = Job(
+            name=name,
+            func=func,
+            interval=interval,
+            jitter=jitter,
+            max_backoff=max_backoff if max_backoff is not None else interval * 10,
+            timeout=timeout,
+            allow_overlap=allow_overlap
+        )
+        self._register(job, interval if initial_delay is None else initial_delay, jittered=initial_delay is None)
+        return job
+
+    def at(
+        self,
+        name: str,
+        delay: float,
+        func: Callable[[], Awaitable[Any]],
+        timeout: Optional[float] = None
+    ) -> Job:
+        """
+        Register a one-shot job to run after a delay
+
+        Args:
+            name: Unique job name
+            delay: Seconds until the deadline
+            func: Coroutine function run by the job
+            timeout: Seconds the run may take before it is cancelled
+
+        Returns:
+            The registered job
+        """
+        job = Job(name=name, func=func, interval=None, timeout=timeout)
+        self._register(job, delay, jittered=False)
+        return job
+
+    def cancel(self, name: str) -> bool:
+        """Unregister a job; a run in progress finishes"""
+        job = self.jobs.pop(name, None)
+        if job is None:
+            return False
+        if job._timer is not None:
+            self.wheel.discard(job._timer)
+            job._timer = None
+        job.next_run = None
+        return True
+
+    def cancel_prefix(self, prefix: str) -> int:
+        """Unregister every job whose name starts with a prefix"""
+        names = [name for name in self.jobs if name.startswith(prefix)]
+        for name in names:
+            self.cancel(name)
+        return len(names)
+
+    def trigger(self, name: str) -> bool:
+        """Run a job now (subject to overlap prevention)"""
+        job = self.jobs.get(name)
+        if job is None:
+            return False
+        self._launch(job)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Scheduler counters and per-job metrics"""
+        now = self._loop_time()
+        return {
+            **self.stats,
+            "running": self.running,
+            "pending_timers": self.wheel.pending,
+            "jobs": {name: job.to_dict(now) for name, job in self.jobs.items()}
+        }
+
+    def _register(self, job: Job, delay: float, jittered: bool):
+        self.cancel(job.name)
+        self.jobs[job.name] = job
+        self._schedule(job, delay, jittered)
+
+    def _schedule(self, job: Job, delay: float, jittered: bool = True, fixed_rate: bool = False):
+        """Arm a job's timer delay seconds from now (or from its last due time)"""
+        if job._timer is not None:
+            self.wheel.discard(job._timer)
+        now = self._loop_time()
+        base = job._nominal if fixed_rate and job._nominal is not None else now
+        job._nominal = max(base + delay, now)
+        job.next_run = job._nominal
+        if jittered and job.jitter > 0:
+            job.next_run += random.uniform(0, job.jitter * delay)
+        job._timer = _Timer(self._to_tick(job.next_run), job)
+        self.wheel.add(job._timer)
+        self._wakeup.set()
+
+    def _loop_time(self) -> float:
+        now = asyncio.get_running_loop().time()
+        if self._origin is None:
+            self._origin = now
+        return now
+
+    def _to_tick(self, when: float) -> int:
+        # Round up so a job never runs early
+        ticks = (when - self._origin) / self.tick
+        return int(ticks) + (ticks > int(ticks))
+
+    async def _drive(self):
+        """Sleep until the next due tick, then fire its timers"""
+        while True:
+            try:
+                self._wakeup.clear()
+                if not self.wheel.pending:
+                    await self._wakeup.wait()
+                    continue
+
+                target = self.wheel.next_wakeup()
+                delay = self._origin + target * self.tick - self._loop_time()
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), delay)
+                        continue  # A timer was added; recompute the target
+                    except asyncio.TimeoutError:
+                        pass
+
+                self.stats["wakeups"] += 1
+                now_tick = int((self._loop_time() - self._origin) / self.tick + 1e-9)
+                for timer in self.wheel.advance(now_tick):
+                    job = timer.job
+                    if job._timer is not timer or self.jobs.get(job.name) is not job:
+                        continue
+                    job._timer = None
+                    self.stats["timers_fired"] += 1
+                    if job.interval is not None:
+                        # Fixed rate: the next run is armed before this one starts
+                        self._schedule(job, job.interval, fixed_rate=True)
+                    else:
+                        self.jobs.pop(job.name, None)
+                        job.next_run = None
+                    self._launch(job)
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Scheduler driver error: {e}")
+
+    def _launch(self, job: Job):
+        if job._running and not job.allow_overlap:
+            job.stats.skipped_overlaps += 1
+            logger.debug(f"Skipping {job.name}: previous run still in progress")
+            return
+        task = asyncio.create_task(self._run(job))
+        job._running.add(task)
+        task.add_done_callback(job._running.discard)
+
+    async def _run(self, job: Job):
+        """Run a job once, recording metrics and applying backoff"""
+        loop = asyncio.get_running_loop()
+        stats = job.stats
+        stats.last_started = datetime.now()
+        started = loop.time()
+        try:
+            if job.timeout is not None:
+                await asyncio.wait_for(job.func(), job.timeout)
+            else:
+                await job.func()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            stats.failures += 1
+            stats.consecutive_failures += 1
+            stats.last_error = f"{type(e).__name__}: {e}"
+            logger.error(f"Job {job.name} failed: {stats.last_error}")
+            if job.interval is not None and self.jobs.get(job.name) is job:
+                backoff = min(
+                    job.interval * 2 ** (stats.consecutive_failures - 1),
+                    job.max_backoff
+                )
+                self._schedule(job, backoff)
+        else:
+            stats.consecutive_failures = 0
+        finally:
+            elapsed = loop.time() - started
+            stats.runs += 1
+            stats.total_seconds += elapsed
+            stats.last_seconds = elapsed
+            stats.max_seconds = max(stats.max_seconds, elapsed)
@@ -52,6 +52,11 @@ async def lifespan(app: FastAPI):
     connection_manager.set_sio_instance(sio) # We'll add this method to ConnectionManager
     connection_manager.set_services(app.state.services) # Existing call
     
+    # Periodic stress monitoring (backs off to 60s while failing)
+    app.state.services.scheduler.every(
+        "legion.health_check", 30, periodic_health_check, max_backoff=60
+    )
+    
     logger.info("✅ Gemini Legion Backend initialized")
     
     yield
@@ -221,36 +226,28 @@ async def root():
 # --- Background Tasks ---
 
 async def periodic_health_check():
-    """Periodic health check and monitoring"""
-    while True:
-        try:
-            # Get services
-            services = get_service_container()
-            minion_service = services.get_minion_service()
-            
-            # Check all minions
-            minions = await minion_service.list_minions()
-            for minion_data in minions:
-                minion_id = minion_data["minion_id"]
-                emotional_state = minion_data.get("emotional_state", {})
-                
-                # Broadcast if stress is high
-                stress_level = emotional_state.get("stress_level", 0.0)
-                if stress_level > 0.8:
-                    await broadcast_minion_update(
-                        minion_id,
-                        "high_stress",
-                        {
-                            "stress_level": stress_level,
-                            "mood": emotional_state.get("mood", {})
-                        }
-                    )
-            
-            await asyncio.sleep(30)  # Check every 30 seconds
-            
-        except Exception as e:
-            logger.error(f"Error in periodic health check: {e}")
-            await asyncio.sleep(60)  # Back off on error
+    """Periodic health check and monitoring (scheduled every 30 seconds)"""
+    # Get services
+    services = get_service_container()
+    minion_service = services.get_minion_service()
+    
+    # Check all minions
+    minions = await minion_service.list_minions()
+    for minion_data in minions:
+        minion_id = minion_data["minion_id"]
+        emotional_state = minion_data.get("emotional_state", {})
+        
+        # Broadcast if stress is high
+        stress_level = emotional_state.get("stress_level", 0.0)
+        if stress_level > 0.8:
+            await broadcast_minion_update(
+                minion_id,
+                "high_stress",
+                {
+                    "stress_level": stress_level,
+                    "mood": emotional_state.get("mood", {})
+                }
+            )
 
 
 # --- Main Entry Point ---
@@ -0,0 +1,12 @@
+"""
+Test configuration
+
+The backend is imported as the gemini_legion_backend package, so the
+directory containing it goes on the import path.
+"""
+
+from pathlib import Path
+import sys
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
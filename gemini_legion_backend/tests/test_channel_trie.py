@@ -0,0 +1,86 @@
+"""Tests for wildcard channel routing"""
+
+import itertools
+import random
+
+import pytest
+
+from gemini_legion_backend.core.infrastructure.messaging.channel_trie import ChannelTrie
+
+
+def reference_match(pattern: str, channel: str) -> bool:
+    """Segment-by-segment matcher the trie must agree with"""
+    pattern_segments, channel_segments = pattern.split("."), channel.split(".")
+
+    def match(i: int, j: int) -> bool:
+        if i == len(pattern_segments):
+            return j == len(channel_segments)
+        segment = pattern_segments[i]
+        if segment == "**":
+            return True
+        if j == len(channel_segments):
+            return False
+        if segment == "*" or segment == channel_segments[j]:
+            return match(i + 1, j + 1)
+        if segment.endswith("*") and channel_segments[j].startswith(segment[:-1]):
+            return match(i + 1, j + 1)
+        return False
+
+    return match(0, 0)
+
+
+def test_wildcard_forms():
+    trie = ChannelTrie()
+    for pattern in ["task.*.updates", "task.**", "#task_*", "**", "#general"]:
+        trie.add(pattern, pattern)
+
+    assert sorted(trie.match("task.123.updates")) == sorted(["**", "task.*.updates", "task.**"])
+    assert sorted(trie.match("task")) == ["**", "task.**"]
+    assert sorted(trie.match("#task_42")) == ["#task_*", "**"]
+    assert sorted(trie.match("#general")) == ["#general", "**"]
+    assert trie.match("#general.x") == ["**"]
+
+
+def test_matches_reference_on_random_patterns():
+    rng = random.Random(3)
+    pattern_segments = ["task", "t1", "*", "t*", "g*", "**"]
+    channel_segments = ["task", "t1", "t2", "general", "dm"]
+
+    patterns = set()
+    while len(patterns) < 150:
+        segments = [rng.choice(pattern_segments) for _ in range(rng.randint(1, 4))]
+        if "**" in segments[:-1]:
+            continue
+        patterns.add(".".join(segments))
+
+    trie = ChannelTrie()
+    for pattern in patterns:
+        trie.add(pattern, pattern)
+
+    for depth in range(1, 5):
+        for segments in itertools.product(channel_segments, repeat=depth):
+            channel = ".".join(segments)
+            expected = sorted(p for p in patterns if reference_match(p, channel))
+            assert sorted(trie.match(channel)) == expected, channel
+
+
+def test_remove_prunes_and_keeps_other_items():
+    trie = ChannelTrie()
+    trie.add("task.*.updates", "first")
+    trie.add("task.*.updates", "second")
+    trie.add("task.**", "third")
+
+    assert trie.remove("task.*.updates", "first")
+    assert not trie.remove("task.*.updates", "first")
+    assert not trie.remove("task.*.missing", "second")
+    assert sorted(trie.match("task.1.updates")) == ["second", "third"]
+
+    assert trie.remove("task.*.updates", "second")
+    assert trie.remove("task.**", "third")
+    assert len(trie) == 0
+    assert trie._root.is_empty()
+
+
+def test_globstar_must_be_last():
+    with pytest.raises(ValueError):
+        ChannelTrie().add("task.**.updates", "item")
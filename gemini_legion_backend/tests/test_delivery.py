@@ -0,0 +1,169 @@
+"""Tests for per-subscriber delivery queues"""
+
+from types import SimpleNamespace
+import asyncio
+import logging
+
+from gemini_legion_backend.core.infrastructure.messaging.communication_system import (
+    ConversationalMessage,
+    MessageRouter
+)
+from gemini_legion_backend.core.infrastructure.messaging.delivery import OverflowPolicy, Subscription
+
+
+class Recorder:
+    """Subscriber that records messages and can be held up"""
+
+    def __init__(self):
+        self.received = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def __call__(self, message):
+        await self.gate.wait()
+        self.received.append(message)
+
+
+async def drain(subscription: Subscription):
+    while subscription.queue_depth:
+        await asyncio.sleep(0.001)
+    await asyncio.sleep(0)
+
+
+def test_drop_oldest_counts_and_logs_drops(caplog):
+    async def scenario():
+        recorder = Recorder()
+        recorder.gate.clear()
+        subscription = Subscription("#general", recorder, max_queue=3)
+        for index in range(10):
+            await subscription.offer(index)  # The worker has not run yet: 0-6 are dropped
+        await asyncio.sleep(0)  # The worker takes message 7 and waits at the gate
+        for index in range(10, 13):
+            await subscription.offer(index)
+        recorder.gate.set()
+        await drain(subscription)
+        subscription.close()
+        return recorder.received, subscription.get_stats()
+
+    with caplog.at_level(logging.WARNING):
+        received, stats = asyncio.run(scenario())
+
+    assert received == [7, 10, 11, 12]
+    assert stats["dropped"] == 9
+    assert stats["delivered"] == 4
+    drop_logs = [record.getMessage() for record in caplog.records if "drop" in record.getMessage()]
+    assert len(drop_logs) == 2
+    assert "dropping 9 messages" in drop_logs[1]
+
+
+def test_block_makes_the_sender_wait_without_dropping():
+    async def scenario():
+        recorder = Recorder()
+        recorder.gate.clear()
+        subscription = Subscription("#general", recorder, max_queue=2, overflow_policy=OverflowPolicy.BLOCK)
+        sender = asyncio.gather(*[subscription.offer(index) for index in range(6)])
+        await asyncio.sleep(0.01)
+        blocked = not sender.done()
+        recorder.gate.set()
+        await sender
+        await drain(subscription)
+        subscription.close()
+        return blocked, recorder.received, subscription.stats
+
+    blocked, received, stats = asyncio.run(scenario())
+    assert blocked
+    assert sorted(received) == list(range(6))
+    assert stats.dropped == 0
+
+
+def test_stuck_subscriber_is_isolated_and_stops_blocking():
+    async def scenario():
+        recorder = Recorder()
+        recorder.gate.clear()
+        subscription = Subscription(
+            "#general", recorder, max_queue=2, overflow_policy=OverflowPolicy.BLOCK, slow_lag_seconds=0.02
+        )
+        for index in range(3):
+            await subscription.offer(index)
+        await asyncio.wait_for(subscription.offer(3), 1.0)  # Would block forever without isolation
+        isolated = subscription.isolated
+        recorder.gate.set()
+        await drain(subscription)
+        subscription.close()
+        return isolated, subscription.stats
+
+    isolated, stats = asyncio.run(scenario())
+    assert isolated
+    assert stats.isolations == 1
+    assert stats.dropped >= 1
+
+
+def test_coalesce_supersedes_the_same_sender():
+    async def scenario():
+        recorder = Recorder()
+        recorder.gate.clear()
+        subscription = Subscription("#status", recorder, max_queue=2, overflow_policy=OverflowPolicy.COALESCE)
+        await subscription.offer(SimpleNamespace(sender="blocker", state=0))
+        await asyncio.sleep(0)  # Held at the gate
+        for state in range(1, 4):
+            await subscription.offer(SimpleNamespace(sender="sparky", state=state))
+        await subscription.offer(SimpleNamespace(sender="bolt", state=1))
+        recorder.gate.set()
+        await drain(subscription)
+        subscription.close()
+        return [(message.sender, message.state) for message in recorder.received], subscription.stats
+
+    received, stats = asyncio.run(scenario())
+    assert received == [("blocker", 0), ("sparky", 3), ("bolt", 1)]
+    assert stats.coalesced == 1
+    assert stats.dropped == 1  # bolt has nothing to supersede, so sparky's oldest update goes
+
+
+def test_router_full_block_subscriber_does_not_stall_the_others():
+    async def scenario():
+        router = MessageRouter(max_queue=1)
+        stuck, healthy = Recorder(), Recorder()
+        stuck.gate.clear()
+        stuck_subscription = router.subscribe("#general", stuck, overflow_policy=OverflowPolicy.BLOCK)
+        healthy_subscription = router.subscribe("#general", healthy)
+        await router.route(ConversationalMessage(sender="sparky", channel="#general", content="one"))
+        await asyncio.sleep(0)  # The stuck worker takes "one" and waits at the gate
+        await router.route(ConversationalMessage(sender="sparky", channel="#general", content="two"))
+        sender = asyncio.ensure_future(
+            router.route(ConversationalMessage(sender="sparky", channel="#general", content="three"))
+        )
+        await asyncio.sleep(0.01)
+        await drain(healthy_subscription)
+        delivered_while_blocked = [message.content for message in healthy.received]
+        blocked = not sender.done()
+        stuck.gate.set()
+        await sender
+        await drain(stuck_subscription)
+        stuck_subscription.close()
+        healthy_subscription.close()
+        return blocked, delivered_while_blocked, [message.content for message in stuck.received]
+
+    blocked, delivered_while_blocked, stuck_received = asyncio.run(scenario())
+    assert blocked
+    assert delivered_while_blocked == ["one", "two", "three"]
+    assert stuck_received == ["one", "two", "three"]
+
+
+def test_router_ingress_hooks_see_messages_a_subscription_drops():
+    async def scenario():
+        router = MessageRouter(max_queue=1)
+        persisted = []
+        router.add_ingress_hook(lambda message: persisted.append(message.content))
+        recorder = Recorder()
+        recorder.gate.clear()
+        subscription = router.subscribe("#general", recorder)
+        for index in range(5):
+            await router.route(ConversationalMessage(sender="sparky", channel="#general", content=str(index)))
+        recorder.gate.set()
+        await drain(subscription)
+        subscription.close()
+        return persisted, subscription.stats
+
+    persisted, stats = asyncio.run(scenario())
+    assert persisted == ["0", "1", "2", "3", "4"]
+    assert stats.dropped == 4
@@ -0,0 +1,128 @@
+"""Tests for the batched emotional policy engine"""
+
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("google.adk")
+
+from gemini_legion_backend.core.domain import EmotionalState, MoodVector
+from gemini_legion_backend.core.infrastructure.adk.emotional_policy_batcher import BatchedEmotionalPolicyEngine
+from gemini_legion_backend.core.infrastructure.adk.llm_scheduler import LLMLane, LLMScheduler, llm_lane
+
+
+class FakeAgent:
+    """Answers every batch prompt with one cheerful update per interaction"""
+
+    def __init__(self):
+        self.prompts = []
+
+    async def think(self, prompt):
+        self.prompts.append(prompt)
+        count = prompt.count("[Interaction ")
+        return json.dumps({"updates": [
+            {"id": index, "mood_changes": {"valence": 0.2, "arousal": -0.1}, "stress_change": -0.05}
+            for index in range(count)
+        ]})
+
+
+def make_state(minion_id: str) -> EmotionalState:
+    return EmotionalState(minion_id=minion_id, mood=MoodVector(valence=0.0, arousal=0.5, dominance=0.3))
+
+
+def interaction(response: str) -> dict:
+    return {"user_message": "How are you?", "minion_response": response, "emotional_impact": 0.2}
+
+
+def test_cache_is_per_minion_and_response():
+    async def scenario():
+        engine = BatchedEmotionalPolicyEngine(FakeAgent(), max_wait_ms=1)
+        await engine.process_interaction(make_state("sparky"), interaction("Great!"))
+        await engine.process_interaction(make_state("bolt"), interaction("Great!"))
+        await engine.process_interaction(make_state("sparky"), interaction("Terrible."))
+        hits_before_repeat = engine.stats["cache_hits"]
+        await engine.process_interaction(make_state("sparky"), interaction("Great!"))
+        return engine, hits_before_repeat
+
+    engine, hits_before_repeat = asyncio.run(scenario())
+    assert hits_before_repeat == 0
+    assert engine.stats["cache_hits"] == 1
+
+
+def test_batch_call_goes_through_scheduler_in_most_urgent_lane():
+    async def scenario():
+        scheduler = LLMScheduler()
+        engine = BatchedEmotionalPolicyEngine(FakeAgent(), max_wait_ms=20, llm_scheduler=scheduler)
+
+        async def commander_turn():
+            with llm_lane(LLMLane.COMMANDER):
+                await engine.process_interaction(make_state("sparky"), interaction("Yes, Commander!"))
+
+        await asyncio.gather(
+            engine.process_interaction(make_state("bolt"), interaction("meh")),
+            commander_turn()
+        )
+        return scheduler
+
+    scheduler = asyncio.run(scenario())
+    assert scheduler.lane_stats[LLMLane.COMMANDER].completed == 1
+    assert scheduler.lane_stats[LLMLane.CHATTER].submitted == 0
+
+
+def test_parsed_update_moves_the_validated_mood():
+    async def scenario():
+        engine = BatchedEmotionalPolicyEngine(FakeAgent(), max_wait_ms=1)
+        updates = await asyncio.gather(
+            engine.process_interaction(make_state("sparky"), interaction("Great!")),
+            engine.process_interaction(make_state("bolt"), interaction("Lovely."))
+        )
+        return engine, updates
+
+    engine, updates = asyncio.run(scenario())
+    assert engine.stats["llm_calls"] == 1
+    assert engine.stats["fallbacks"] == 0
+    for update in updates:
+        assert update.mood_delta.valence > 0
+        assert update.mood_delta.arousal < 0
+        assert update.stress_delta < 0
+
+
+def test_agent_runner_returns_the_final_response_text():
+    from gemini_legion_backend.core.infrastructure.adk.agent_runner import AgentRunner
+
+    class Part:
+        def __init__(self, text):
+            self.text = text
+
+    class Event:
+        def __init__(self, text, final):
+            self.content = type("Content", (), {"parts": [Part(text)]})()
+            self.final = final
+
+        def is_final_response(self):
+            return self.final
+
+    class Sessions:
+        def __init__(self):
+            self.live = set()
+
+        async def create_session(self, app_name, user_id):
+            session = type("Session", (), {"id": f"s{len(self.live)}"})()
+            self.live.add(session.id)
+            return session
+
+        async def delete_session(self, app_name, user_id, session_id):
+            self.live.discard(session_id)
+
+    class Runner:
+        session_service = Sessions()
+
+        async def run_async(self, user_id, session_id, new_message):
+            yield Event("thinking...", False)
+            yield Event('{"updates": []}', True)
+
+    runner = Runner()
+    adapter = AgentRunner(agent=None, runner=runner)
+    assert asyncio.run(adapter.think("prompt")) == '{"updates": []}'
+    assert not runner.session_service.live
@@ -0,0 +1,65 @@
+"""Tests for emotional state field maps and websocket sync events"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from gemini_legion_backend.core.domain import EmotionalState, MoodVector
+
+
+def make_state(minion_id: str = "sparky_01") -> EmotionalState:
+    return EmotionalState(minion_id=minion_id, mood=MoodVector(valence=0.0, arousal=0.5, dominance=0.3))
+
+
+def test_field_map_reproduces_decay():
+    state = make_state()
+    state.mood.valence = 0.9
+    state.stress_level = 0.8
+    state.decay_rate = 0.5
+    state.decay_reference_time = datetime.now() - timedelta(minutes=10)
+
+    receiver = EmotionalState(minion_id="sparky_01", mood=MoodVector(valence=-0.5, arousal=0.1, dominance=0.9))
+    receiver.apply_field_map(state.to_field_map())
+
+    at = datetime.now()
+    mood, energy, stress = state.decayed_values(at)
+    received_mood, received_energy, received_stress = receiver.decayed_values(at)
+    assert received_mood == mood
+    assert received_energy == pytest.approx(energy)
+    assert received_stress == pytest.approx(stress)
+    assert receiver.baseline_mood == state.baseline_mood
+
+
+def test_sync_events_keyframe_then_nested_deltas():
+    pytest.importorskip("fastapi")
+    from gemini_legion_backend.core.application.services.minion_service import MinionService
+
+    service = MinionService.__new__(MinionService)
+    service._broadcast_snapshots = {}
+    service._deltas_since_keyframe = {}
+    service.emotional_keyframe_interval = 20
+
+    state = make_state()
+    state.decay_rate = 1.0
+    agent = SimpleNamespace(emotional_engine=SimpleNamespace(get_current_state=lambda: state))
+
+    name, keyframe = service._emotional_sync_event("sparky_01", agent)
+    assert name == "minion_emotional_state_updated"
+    assert keyframe["emotional_state"]["mood"]["valence"] == 0.0
+    assert "opinion_scores" in keyframe["emotional_state"]
+
+    state.get_opinion_of("commander")
+    name, _ = service._emotional_sync_event("sparky_01", agent)
+    assert name == "minion_emotional_state_updated"  # opinion_scores {} was replaced
+
+    state.mood.valence = 0.4
+    state.get_opinion_of("commander").trust = 25.0
+    state.state_version += 1
+    name, delta = service._emotional_sync_event("sparky_01", agent)
+    assert name == "minion_emotional_state_delta"
+    assert delta["base_version"] == delta["state_version"] - 1
+    changes = {tuple(path): value for path, value in delta["changes"]}
+    assert changes[("mood", "valence")] == 0.4
+    assert changes[("opinion_scores", "commander", "trust")] == 25.0
+    assert ("mood", "arousal") not in changes
@@ -0,0 +1,217 @@
+"""Tests for the Legion-wide LLM scheduler"""
+
+from datetime import datetime
+import asyncio
+import time
+
+import pytest
+
+from gemini_legion_backend.core.infrastructure.adk.llm_scheduler import (
+    LLMLane,
+    LLMScheduler,
+    lane_for_senders,
+    llm_lane
+)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def reply(text: str = "ok", delay: float = 0.0) -> str:
+    await asyncio.sleep(delay)
+    return text
+
+
+def test_lane_for_senders():
+    assert lane_for_senders(["COMMANDER_PRIME"]) == LLMLane.COMMANDER
+    assert lane_for_senders(["bolt_02", "commander"]) == LLMLane.COMMANDER
+    assert lane_for_senders(["bolt_02", "sparky_01"]) == LLMLane.CHATTER
+
+
+def test_lane_comes_from_context():
+    async def scenario():
+        scheduler = LLMScheduler()
+        with llm_lane(LLMLane.TASK):
+            await scheduler.submit(reply, "sparky")
+        await scheduler.submit(reply, "sparky")
+        return scheduler
+
+    scheduler = run(scenario())
+    assert scheduler.lane_stats[LLMLane.TASK].completed == 1
+    assert scheduler.lane_stats[LLMLane.CHATTER].completed == 1
+
+
+def test_commander_uses_reserved_slot_while_chatter_is_saturated():
+    async def scenario():
+        scheduler = LLMScheduler(max_concurrency=2, reserved_slots=1)
+        release = asyncio.Event()
+
+        async def slow():
+            await release.wait()
+            return "ok"
+
+        chatter = [
+            asyncio.create_task(scheduler.submit(slow, f"minion_{i}", lane=LLMLane.CHATTER))
+            for i in range(5)
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.in_flight == 1
+        assert scheduler.queue_depth()["chatter"] == 4
+
+        started = time.monotonic()
+        await asyncio.wait_for(scheduler.submit(reply, "sparky", lane=LLMLane.COMMANDER), 1)
+        commander_latency = time.monotonic() - started
+
+        release.set()
+        await asyncio.gather(*chatter)
+        return scheduler, commander_latency
+
+    scheduler, commander_latency = run(scenario())
+    assert commander_latency < 0.1
+    assert scheduler.lane_stats[LLMLane.CHATTER].completed == 5
+    assert scheduler.in_flight == 0
+
+
+def test_strict_priority_between_lanes():
+    async def scenario():
+        scheduler = LLMScheduler(max_concurrency=1, reserved_slots=0)
+        order = []
+        gate = asyncio.Event()
+
+        async def call(tag):
+            order.append(tag)
+            await gate.wait()
+            return "ok"
+
+        first = asyncio.create_task(scheduler.submit(lambda: call("first"), "a", lane=LLMLane.CHATTER))
+        await asyncio.sleep(0)
+        queued = [
+            asyncio.create_task(scheduler.submit(lambda lane=lane: call(lane.name), "b", lane=lane))
+            for lane in (LLMLane.AUTONOMOUS, LLMLane.CHATTER, LLMLane.TASK, LLMLane.COMMANDER)
+        ]
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(first, *queued)
+        return order
+
+    assert run(scenario()) == ["first", "COMMANDER", "TASK", "CHATTER", "AUTONOMOUS"]
+
+
+def test_round_robin_between_minions_in_a_lane():
+    async def scenario():
+        scheduler = LLMScheduler(max_concurrency=1, reserved_slots=0)
+        order = []
+
+        async def call(tag):
+            order.append(tag)
+            await asyncio.sleep(0)
+            return "ok"
+
+        tasks = [
+            asyncio.create_task(scheduler.submit(lambda i=i: call(f"a{i}"), "a"))
+            for i in range(4)
+        ]
+        tasks += [
+            asyncio.create_task(scheduler.submit(lambda i=i: call(f"b{i}"), "b"))
+            for i in range(2)
+        ]
+        await asyncio.gather(*tasks)
+        return order
+
+    order = run(scenario())
+    # b does not wait for all of a's backlog
+    assert order.index("b0") < order.index("a2")
+    assert order.index("b1") < order.index("a3")
+
+
+def test_token_budget_delays_other_lanes_but_not_the_commander():
+    async def scenario():
+        # 600 tokens/minute = 10 tokens/second
+        scheduler = LLMScheduler(max_concurrency=4, tokens_per_minute=600, response_tokens=0)
+        await scheduler.submit(reply, "a", prompt="x" * 2400, lane=LLMLane.CHATTER)  # Spends the budget
+
+        started = time.monotonic()
+        chatter = asyncio.create_task(scheduler.submit(reply, "b", prompt="xxxx", lane=LLMLane.CHATTER))
+        await asyncio.sleep(0)
+        assert scheduler.queue_depth()["chatter"] == 1
+
+        await asyncio.wait_for(scheduler.submit(reply, "c", prompt="xxxx", lane=LLMLane.COMMANDER), 0.05)
+        await chatter
+        return scheduler, time.monotonic() - started
+
+    scheduler, chatter_wait = run(scenario())
+    assert chatter_wait >= 0.1
+    assert scheduler.budget_waits >= 1
+    assert scheduler.lane_stats[LLMLane.COMMANDER].completed == 1
+
+
+def test_cancelled_request_leaves_the_queue():
+    async def scenario():
+        scheduler = LLMScheduler(max_concurrency=1, reserved_slots=0)
+        gate = asyncio.Event()
+
+        async def held():
+            await gate.wait()
+            return "ok"
+
+        running = asyncio.create_task(scheduler.submit(held, "a"))
+        queued = asyncio.create_task(scheduler.submit(reply, "b"))
+        await asyncio.sleep(0)
+        queued.cancel()
+        await asyncio.sleep(0)
+        depth = scheduler.queue_depth()["chatter"]
+
+        gate.set()
+        await running
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        return scheduler, depth
+
+    scheduler, depth = run(scenario())
+    assert depth == 0
+    assert scheduler.in_flight == 0
+    assert scheduler.lane_stats[LLMLane.CHATTER].cancelled == 1
+
+
+def test_commander_channel_message_runs_in_commander_lane():
+    pytest.importorskip("google.adk")
+    from gemini_legion_backend.core.domain import Minion, MinionPersona, EmotionalState, MoodVector, WorkingMemory
+    from gemini_legion_backend.core.infrastructure.adk.tools.communication_capability import (
+        CommunicationCapability,
+        IncomingMessage,
+        MessagePriority
+    )
+    from gemini_legion_backend.core.infrastructure.messaging.communication_system import InterMinionCommunicationSystem
+    from gemini_legion_backend.core.infrastructure.messaging.safeguards import CommunicationSafeguards
+
+    async def scenario():
+        scheduler = LLMScheduler()
+        minion = Minion(
+            minion_id="sparky_01",
+            persona=MinionPersona(name="Sparky", base_personality="eager"),
+            emotional_state=EmotionalState(
+                minion_id="sparky_01",
+                mood=MoodVector(valence=0.0, arousal=0.5, dominance=0.3)
+            ),
+            working_memory=WorkingMemory()
+        )
+        capability = CommunicationCapability(minion, InterMinionCommunicationSystem(), CommunicationSafeguards())
+
+        class Agent:
+            async def think(self, prompt):
+                return await scheduler.submit(lambda: reply("[No response]"), "sparky_01", prompt)
+
+        await capability._handle_incoming_message(IncomingMessage(
+            sender="COMMANDER_PRIME",
+            channel="#general",
+            content="Tell me a joke",
+            timestamp=datetime.now(),
+            priority=MessagePriority.NORMAL
+        ))
+        await capability.process_message_queue(Agent())
+        return scheduler
+
+    scheduler = run(scenario())
+    assert scheduler.lane_stats[LLMLane.COMMANDER].submitted == 1
+    assert scheduler.lane_stats[LLMLane.CHATTER].submitted == 0
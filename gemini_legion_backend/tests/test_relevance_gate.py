@@ -0,0 +1,86 @@
+"""Tests for the pre-LLM relevance gate"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+from gemini_legion_backend.core.domain import COMMANDER_IDS, MinionPersona
+from gemini_legion_backend.core.infrastructure.messaging.lexicon import DEFAULT_LEXICON, TextAnalysis
+from gemini_legion_backend.core.infrastructure.messaging.relevance_gate import RelevanceGate
+
+
+class Priority(Enum):
+    LOW = "low"
+    NORMAL = "normal"
+    HIGH = "high"
+    URGENT = "urgent"
+
+
+@dataclass
+class Message:
+    """The fields of an IncomingMessage the gate reads"""
+    sender: str
+    channel: str
+    content: str
+    timestamp: datetime
+    priority: Priority = Priority.NORMAL
+    analysis: Optional[TextAnalysis] = None
+
+
+def message(sender: str, content: str, channel: str = "#general") -> Message:
+    return Message(sender, channel, content, datetime.now(), analysis=DEFAULT_LEXICON.analyze(content))
+
+
+def make_gate(**kwargs) -> RelevanceGate:
+    persona = MinionPersona(
+        name="Sparky",
+        base_personality="eager",
+        expertise_areas=["Database optimization", "Python programming"]
+    )
+    return RelevanceGate(persona, "sparky_01", **kwargs)
+
+
+def test_ui_commander_messages_pass():
+    gate = make_gate()
+    for content in ("Tell me a joke", "What should we have for lunch today?"):
+        decision = gate.assess(message("COMMANDER_PRIME", content))
+        assert decision.respond
+        assert decision.reason == "commander"
+
+
+def test_every_commander_id_passes():
+    gate = make_gate()
+    for sender in COMMANDER_IDS:
+        assert gate.assess(message(sender, "ok")).respond
+
+
+def test_direct_channels_pass():
+    gate = make_gate(direct_channel=lambda channel: channel == "dm_sparky")
+    assert gate.assess(message("bolt_02", "lol same", channel="dm_sparky")).respond
+    assert not gate.assess(message("bolt_02", "lol same")).respond
+
+
+def test_mentions_and_expertise_pass_chatter_is_skipped():
+    gate = make_gate()
+    assert gate.assess(message("bolt_02", "hey sparky what do you think")).reason == "mention"
+    assert gate.assess(message("bolt_02", "our databases need optimization")).respond
+    assert not gate.assess(message("bolt_02", "nice weather today")).respond
+
+    stats = gate.get_stats()
+    assert stats["checked"] == 3
+    assert stats["skipped"] == 1
+
+
+def test_reply_to_own_turn_passes():
+    gate = make_gate()
+    gate.record_reply("#general")
+    assert gate.assess(message("bolt_02", "ok")).reason == "reply_to_me"
+
+
+def test_multi_word_names_match_only_as_a_whole():
+    persona = MinionPersona(name="The Code Wizard", base_personality="wise", expertise_areas=["Spells"])
+    gate = RelevanceGate(persona, "wizard_03")
+    assert not gate.assess(message("bolt_02", "the code is broken")).respond
+    assert gate.assess(message("bolt_02", "ask the code wizard about it")).reason == "mention"
+    assert gate.assess(message("bolt_02", "@wizard_03 thoughts")).reason == "mention"
@@ -0,0 +1,96 @@
+"""Tests for the legion-wide reply graph"""
+
+import asyncio
+
+from gemini_legion_backend.core.infrastructure.messaging.reply_graph import ReplyGraph
+from gemini_legion_backend.core.infrastructure.messaging.safeguards import CommunicationSafeguards
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_sustained_normal_conversation_is_not_throttled():
+    clock = FakeClock()
+    graph = ReplyGraph(clock=clock)
+    # Two Minions answering each other every 5 seconds for half an hour
+    for turn in range(360):
+        clock.now += 5
+        assert graph.record("sparky" if turn % 2 else "bolt", "#general", repetition=0.0) is None
+    assert graph.stats["runaway_cycles"] == 0
+    assert graph.throttled_for("sparky") == 0.0
+
+
+def test_echoed_replies_across_channels_are_throttled():
+    clock = FakeClock()
+    graph = ReplyGraph(clock=clock)
+    cycle = None
+    turns = 0
+    # A answers B on #general, B answers A in their direct channel, and so on
+    while cycle is None and turns < 40:
+        clock.now += 5
+        channel = "#general" if turns % 4 < 2 else "dm_bolt_sparky"
+        cycle = graph.record("sparky" if turns % 2 else "bolt", channel, repetition=0.9)
+        turns += 1
+    assert cycle is not None
+    assert cycle.members == {"sparky", "bolt"}
+    assert graph.throttled_for("sparky") > 0
+    assert graph.throttled_for("bolt") > 0
+
+
+def test_messages_far_apart_are_not_replies():
+    clock = FakeClock()
+    graph = ReplyGraph(clock=clock)
+    graph.record("bolt", "#general")
+    clock.now += graph.reply_window + 1
+    graph.record("sparky", "#general")
+    assert graph.stats["replies"] == 0
+
+
+def send(safeguards, clock, minion_id, channel, message):
+    clock.now += 6
+    return asyncio.run(safeguards.check_message_allowed(minion_id, channel, message))
+
+
+def make_safeguards(clock):
+    safeguards = CommunicationSafeguards()
+    safeguards.rate_limiter.clock = clock
+    safeguards.reply_graph = ReplyGraph(clock=clock)
+    return safeguards
+
+
+def test_safeguards_allow_a_long_productive_exchange():
+    clock = FakeClock()
+    safeguards = make_safeguards(clock)
+    for turn in range(100):
+        minion_id = "sparky" if turn % 2 else "bolt"
+        message = f"Step {turn}: module{turn} parser{turn} returns record{turn} with field{turn}"
+        allowed, reason = send(safeguards, clock, minion_id, "#general", message)
+        assert allowed, reason
+
+
+def test_safeguards_throttle_echoes_bounced_between_channels():
+    clock = FakeClock()
+    safeguards = make_safeguards(clock)
+    denials = []
+    for turn in range(120):
+        topic = turn // 2
+        if turn % 2:
+            # Sparky echoes Bolt's last message on the other channel
+            minion_id = "sparky"
+            message = f"Agreed, topic{topic} needs alpha{topic} beta{topic} gamma{topic} delta{topic}"
+        else:
+            minion_id = "bolt"
+            message = f"Topic{topic} needs alpha{topic} beta{topic} gamma{topic} delta{topic}"
+        channel = "#general" if turn % 4 in (0, 3) else "dm_bolt_sparky"
+        allowed, reason = send(safeguards, clock, minion_id, channel, message)
+        if not allowed:
+            denials.append(reason)
+            break
+    # Neither channel alone holds a loop, so only the reply graph can stop it
+    assert len(denials) == 1
+    assert "reply cycle" in denials[0]
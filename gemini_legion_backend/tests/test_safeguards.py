@@ -0,0 +1,144 @@
+"""Tests for the communication safeguards"""
+
+from datetime import datetime, timedelta
+import asyncio
+
+from gemini_legion_backend.core.infrastructure.messaging.near_duplicates import NearDuplicate
+from gemini_legion_backend.core.infrastructure.messaging.safeguards import (
+    CommunicationSafeguards,
+    ParaphrasePattern,
+    RateLimitConfig,
+    RateLimiter
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_safeguards() -> CommunicationSafeguards:
+    safeguards = CommunicationSafeguards()
+    safeguards.rate_limiter.clock = FakeClock()
+    return safeguards
+
+
+def send(safeguards: CommunicationSafeguards, minion_id: str, message: str, channel: str = "#general"):
+    # Space messages out so the rate limiter stays out of the way
+    safeguards.rate_limiter.clock.now += 30
+    return asyncio.run(safeguards.check_message_allowed(minion_id, channel, message))
+
+
+def test_repeated_short_acknowledgement_is_allowed():
+    safeguards = make_safeguards()
+    for _ in range(3):
+        allowed, reason = send(safeguards, "sparky_01", "Thanks, on it!")
+        assert allowed, reason
+
+
+def test_many_minions_agreeing_is_allowed():
+    safeguards = make_safeguards()
+    replies = ["Sounds good!", "sounds good to me", "Sounds good, let's do it", "ok sounds good", "Sounds good."]
+    for index, reply in enumerate(replies):
+        allowed, reason = send(safeguards, f"minion_{index}", reply)
+        assert allowed, reason
+
+
+def test_paraphrase_loop_is_denied():
+    safeguards = make_safeguards()
+    paraphrases = [
+        "We should refactor the database layer to use connection pooling",
+        "I think we should refactor the database layer and use connection pooling",
+        "Really, the database layer should use connection pooling, so refactor it",
+        "Honestly we should refactor the database layer for connection pooling"
+    ]
+    results = [send(safeguards, "sparky_01", message) for message in paraphrases]
+    assert all(allowed for allowed, _ in results[:3])
+    allowed, reason = results[3]
+    assert not allowed
+    assert "paraphrases" in reason
+
+
+def test_old_paraphrases_count_less():
+    pattern = ParaphrasePattern()
+    now = datetime.now()
+
+    def risk(age_seconds: float):
+        matches = [NearDuplicate("sparky_01", 0.9, now - timedelta(seconds=age_seconds)) for _ in range(3)]
+        entry = {"content": "msg", "timestamp": now, "near_duplicates": matches}
+        return pattern.evaluate("sparky_01", "msg", [entry]).severity
+
+    assert risk(0) > CommunicationSafeguards.LOOP_RISK_THRESHOLD
+    assert risk(ParaphrasePattern.HALF_LIFE) < CommunicationSafeguards.LOOP_RISK_THRESHOLD
+    assert risk(3600) < 0.01
+
+
+def make_limiter(**config) -> RateLimiter:
+    return RateLimiter(RateLimitConfig(**{"cooldown_seconds": 0.0, **config}), clock=FakeClock())
+
+
+def test_rate_limiter_allows_a_burst_then_spaces_messages():
+    limiter = make_limiter(messages_per_minute=10)
+    assert all(limiter.check_allowed("sparky", "#general") for _ in range(10))
+    assert not limiter.check_allowed("sparky", "#general")
+    assert limiter.retry_after("sparky", "#general") == 6.0
+
+    limiter.clock.now += 5.9
+    assert not limiter.check_allowed("sparky", "#general")
+    limiter.clock.now += 0.1
+    assert limiter.check_allowed("sparky", "#general")
+    assert not limiter.check_allowed("sparky", "#general")
+
+
+def test_rate_limiter_keys_are_per_minion_and_channel():
+    limiter = make_limiter(messages_per_minute=1)
+    assert limiter.check_allowed("sparky", "#general")
+    assert not limiter.check_allowed("sparky", "#general")
+    assert limiter.check_allowed("sparky", "#tasks")
+    assert limiter.check_allowed("bolt", "#general")
+
+
+def test_rate_limiter_cooldown_and_hourly_limit():
+    limiter = make_limiter(messages_per_minute=60, messages_per_hour=3, cooldown_seconds=2.0)
+    assert limiter.check_allowed("sparky", "#general")
+    assert not limiter.check_allowed("sparky", "#general")
+    assert limiter.retry_after("sparky", "#general") == 2.0
+
+    for _ in range(2):
+        limiter.clock.now += 2
+        assert limiter.check_allowed("sparky", "#general")
+    limiter.clock.now += 2
+    assert not limiter.check_allowed("sparky", "#general")  # Hourly limit reached
+    limiter.clock.now += limiter.retry_after("sparky", "#general")
+    assert limiter.check_allowed("sparky", "#general")
+
+
+def test_rate_limiter_channel_limit_is_shared_and_denials_are_free():
+    limiter = make_limiter(messages_per_minute=1)
+    limiter.set_channel_limit("#general", 2)
+    assert limiter.check_allowed("sparky", "#general")
+    assert limiter.check_allowed("bolt", "#general")
+    assert not limiter.check_allowed("zap", "#general")
+
+    # A denied message spends nothing: zap goes first once the channel recovers
+    limiter.clock.now += 30
+    assert limiter.check_allowed("zap", "#general")
+
+    limiter.set_channel_limit("#general", None)
+    assert limiter.check_allowed("nova", "#general")
+
+
+def test_rate_limiter_forgets_idle_and_excess_keys():
+    limiter = make_limiter(messages_per_minute=1)
+    limiter.max_keys = 3
+    for minion_id in ("a", "b", "c", "d"):
+        limiter.check_allowed(minion_id, "#general")
+    assert limiter.tracked_keys == 3
+    assert limiter.check_allowed("a", "#general")  # Evicted least recently used
+
+    limiter.clock.now += RateLimiter.HOUR + 1
+    limiter.check_allowed("e", "#general")
+    assert limiter.tracked_keys == 1
@@ -0,0 +1,224 @@
+"""Tests for the timer wheel and job scheduler, on a virtual clock"""
+
+import asyncio
+import random
+import selectors
+
+from gemini_legion_backend.core.infrastructure.scheduling.scheduler import Scheduler, TimerWheel, _Timer
+
+
+class _JumpingSelector(selectors.DefaultSelector):
+    """Selector that advances its loop's clock instead of blocking"""
+
+    def __init__(self, loop: "VirtualClockLoop"):
+        super().__init__()
+        self.loop = loop
+
+    def select(self, timeout=None):
+        events = super().select(0)
+        if not events and timeout:
+            self.loop.now += timeout
+        return events
+
+
+class VirtualClockLoop(asyncio.SelectorEventLoop):
+    """Event loop whose clock jumps to the next timer instead of sleeping"""
+
+    def __init__(self):
+        self.now = 0.0
+        super().__init__(selector=_JumpingSelector(self))
+
+    def time(self) -> float:
+        return self.now
+
+
+def run(coro):
+    loop = VirtualClockLoop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def now() -> float:
+    return asyncio.get_running_loop().time()
+
+
+def test_wheel_expires_each_timer_on_its_tick_across_levels():
+    # 4 slots per level and 3 levels: boundaries at 4, 16 and 64 ticks, overflow beyond
+    for start in range(0, 70, 3):
+        wheel = TimerWheel(slot_bits=2, levels=3)
+        wheel.advance(start)
+        timers = [_Timer(tick, None) for tick in range(start + 1, start + 150)]
+        for timer in timers:
+            wheel.add(timer)
+
+        fired = {}
+        for tick in range(start + 1, start + 150):
+            for timer in wheel.advance(tick):
+                fired[id(timer)] = tick
+
+        assert all(fired.get(id(timer)) == timer.tick for timer in timers)
+        assert wheel.pending == 0
+
+
+def test_wheel_next_wakeup_never_skips_a_timer():
+    rng = random.Random(7)
+    wheel = TimerWheel(slot_bits=2, levels=3)
+    timers = [_Timer(rng.randrange(1, 300), None) for _ in range(200)]
+    for timer in timers:
+        wheel.add(timer)
+
+    fired = {}
+    while wheel.pending:
+        tick = wheel.next_wakeup()
+        for timer in wheel.advance(tick):
+            fired[id(timer)] = tick
+
+    assert all(fired[id(timer)] == timer.tick for timer in timers)
+
+
+def test_wheel_cancelled_timers_do_not_fire():
+    wheel = TimerWheel(slot_bits=2, levels=3)
+    kept, cancelled = _Timer(20, None), _Timer(20, None)
+    wheel.add(kept)
+    wheel.add(cancelled)
+    wheel.discard(cancelled)
+    wheel.discard(cancelled)
+    assert wheel.pending == 1
+    assert wheel.advance(20) == [kept]
+    assert wheel.pending == 0
+
+
+def test_periodic_job_runs_at_fixed_rate():
+    async def scenario():
+        scheduler = Scheduler(tick=0.5)
+        starts = []
+
+        async def sync():
+            starts.append(now())
+            await asyncio.sleep(3)  # Run time does not shift later runs
+
+        scheduler.start()
+        scheduler.every("sync", 10, sync, jitter=0)
+        await asyncio.sleep(105)
+        await scheduler.stop()
+        return starts
+
+    assert run(scenario()) == [10.0 * i for i in range(1, 11)]
+
+
+def test_overlapping_run_is_skipped():
+    async def scenario():
+        scheduler = Scheduler(tick=0.5)
+
+        async def slow():
+            await asyncio.sleep(25)
+
+        scheduler.start()
+        job = scheduler.every("slow", 10, slow, jitter=0)
+        await asyncio.sleep(61)
+        await scheduler.stop()
+        return job.stats
+
+    stats = run(scenario())
+    # Starts at 10, 40; the runs due at 20, 30, 50 and 60 find one in progress
+    assert stats.skipped_overlaps == 4
+    assert stats.runs == 2
+
+
+def test_failing_job_backs_off_then_recovers():
+    async def scenario():
+        scheduler = Scheduler(tick=0.5)
+        starts = []
+
+        async def flaky():
+            starts.append(now())
+            if len(starts) <= 4:
+                raise RuntimeError("database unavailable")
+
+        scheduler.start()
+        job = scheduler.every("flaky", 10, flaky, jitter=0, max_backoff=40)
+        await asyncio.sleep(145)
+        await scheduler.stop()
+        return starts, job.stats
+
+    starts, stats = run(scenario())
+    assert starts == [10.0, 20.0, 40.0, 80.0, 120.0, 130.0, 140.0]
+    assert stats.failures == 4
+    assert stats.consecutive_failures == 0
+
+
+def test_reregistering_a_name_replaces_the_job():
+    async def scenario():
+        scheduler = Scheduler(tick=0.5)
+        calls = []
+
+        async def old():
+            calls.append(("old", now()))
+
+        async def new():
+            calls.append(("new", now()))
+
+        scheduler.start()
+        scheduler.every("job", 10, old, jitter=0)
+        await asyncio.sleep(5)
+        scheduler.every("job", 10, new, jitter=0)
+        await asyncio.sleep(21)
+        pending = scheduler.wheel.pending
+        await scheduler.stop()
+        return calls, pending
+
+    calls, pending = run(scenario())
+    assert calls == [("new", 15.0), ("new", 25.0)]
+    assert pending == 1
+
+
+def test_cancelled_job_stops_running():
+    async def scenario():
+        scheduler = Scheduler(tick=0.5)
+        calls = []
+
+        async def job():
+            calls.append(now())
+
+        scheduler.start()
+        scheduler.every("cleanup.a", 10, job, jitter=0)
+        scheduler.every("cleanup.b", 10, job, jitter=0)
+        await asyncio.sleep(15)
+        assert scheduler.cancel_prefix("cleanup.") == 2
+        assert not scheduler.cancel("cleanup.a")
+        await asyncio.sleep(30)
+        pending = scheduler.wheel.pending
+        await scheduler.stop()
+        return calls, pending
+
+    calls, pending = run(scenario())
+    assert calls == [10.0, 10.0]
+    assert pending == 0
+
+
+def test_one_shot_job_runs_once_and_times_out():
+    async def scenario():
+        scheduler = Scheduler(tick=0.5)
+        calls = []
+
+        async def deadline():
+            calls.append(now())
+
+        async def hangs():
+            await asyncio.sleep(100)
+
+        scheduler.start()
+        scheduler.at("deadline", 7.2, deadline)
+        hung = scheduler.at("hangs", 1, hangs, timeout=5)
+        await asyncio.sleep(30)
+        jobs = set(scheduler.jobs)
+        await scheduler.stop()
+        return calls, jobs, hung.stats
+
+    calls, jobs, hung = run(scenario())
+    assert calls == [7.5]  # Rounded up to the next tick, never early
+    assert jobs == set()
+    assert hung.failures == 1
+    assert hung.last_error.startswith("TimeoutError")
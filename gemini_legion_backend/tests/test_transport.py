@@ -0,0 +1,214 @@
+"""Tests for the message transports, against an in-process RESP server"""
+
+from collections import defaultdict
+import asyncio
+
+from gemini_legion_backend.core.infrastructure.messaging.transport import (
+    InProcessTransport,
+    RedisTransport
+)
+
+
+class StubRespServer:
+    """Minimal Redis stand-in implementing PUBLISH, SUBSCRIBE and UNSUBSCRIBE"""
+
+    def __init__(self):
+        self.subscribers = defaultdict(set)  # channel -> writers
+        self.writers = set()
+        self.handlers = set()
+        self.server = None
+
+    @property
+    def port(self) -> int:
+        return self.server.sockets[0].getsockname()[1]
+
+    async def start(self, port: int = 0):
+        self.server = await asyncio.start_server(self._serve, "127.0.0.1", port)
+
+    async def stop(self):
+        self.server.close()
+        self.drop_connections()
+        await asyncio.gather(*self.handlers)
+        await self.server.wait_closed()
+
+    def drop_connections(self):
+        """Close every client connection, as a restarting server would"""
+        for writer in list(self.writers):
+            writer.close()
+        self.writers.clear()
+        self.subscribers.clear()
+
+    async def _serve(self, reader, writer):
+        self.handlers.add(asyncio.current_task())
+        self.writers.add(writer)
+        try:
+            while True:
+                command = await RedisTransport._read_reply(reader)
+                name, args = command[0].upper(), command[1:]
+                if name == b"PUBLISH":
+                    channel, data = args
+                    receivers = list(self.subscribers.get(channel, ()))
+                    for subscriber in receivers:
+                        subscriber.write(self._array(b"message", channel, data))
+                    writer.write(b":%d\r\n" % len(receivers))
+                elif name in (b"SUBSCRIBE", b"UNSUBSCRIBE"):
+                    for channel in args:
+                        if name == b"SUBSCRIBE":
+                            self.subscribers[channel].add(writer)
+                        else:
+                            self.subscribers[channel].discard(writer)
+                        count = sum(1 for writers in self.subscribers.values() if writer in writers)
+                        writer.write(self._array(name.lower(), channel) + b":%d\r\n" % count)
+                else:
+                    writer.write(b"-ERR unknown command\r\n")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.handlers.discard(asyncio.current_task())
+            self.writers.discard(writer)
+            for writers in self.subscribers.values():
+                writers.discard(writer)
+
+    @staticmethod
+    def _array(*items: bytes) -> bytes:
+        # The subscription count is appended by the caller as an integer
+        extra = 1 if items[0] in (b"subscribe", b"unsubscribe") else 0
+        parts = [b"*%d\r\n" % (len(items) + extra)]
+        for item in items:
+            parts.append(b"$%d\r\n%s\r\n" % (len(item), item))
+        return b"".join(parts)
+
+
+async def wait_for(predicate, timeout: float = 2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+def with_server(scenario):
+    async def run():
+        server = StubRespServer()
+        await server.start()
+        try:
+            return await scenario(server)
+        finally:
+            await server.stop()
+    return asyncio.run(run())
+
+
+def test_in_process_transport_round_trip():
+    async def scenario():
+        first, second = InProcessTransport(), InProcessTransport()
+        first.connect(second)
+        received = []
+
+        async def handler(payload):
+            received.append(payload)
+
+        await second.subscribe("chat", handler)
+        await first.publish("chat", {"content": "hi"})
+        await first.publish("events", {"ignored": True})
+        return received
+
+    assert asyncio.run(scenario()) == [{"content": "hi"}]
+
+
+def test_redis_round_trip_in_order():
+    async def scenario(server):
+        publisher = RedisTransport(port=server.port, node_id="a")
+        subscriber = RedisTransport(port=server.port, node_id="b")
+        await publisher.start()
+        await subscriber.start()
+        received = []
+
+        async def handler(payload):
+            received.append(payload)
+
+        await subscriber.subscribe("chat", handler)
+        for index in range(20):
+            await publisher.publish("chat", {"seq": index, "content": "hi", "tags": ["x", 1]})
+        await wait_for(lambda: len(received) == 20)
+
+        await publisher.close()
+        await subscriber.close()
+        return received
+
+    received = with_server(scenario)
+    assert [payload["seq"] for payload in received] == list(range(20))
+    assert received[0] == {"seq": 0, "content": "hi", "tags": ["x", 1]}
+
+
+def test_subscribe_returns_after_server_ack():
+    async def scenario(server):
+        transport = RedisTransport(port=server.port)
+        await transport.start()
+
+        async def handler(payload):
+            pass
+
+        await transport.subscribe("events", handler)
+        subscribed = bool(server.subscribers.get(b"legion:events"))
+        pending_acks = len(transport._sub_acks)
+
+        await transport.unsubscribe("events", handler)
+        await wait_for(lambda: not server.subscribers.get(b"legion:events"))
+        await transport.close()
+        return subscribed, pending_acks
+
+    subscribed, pending_acks = with_server(scenario)
+    assert subscribed
+    assert pending_acks == 0
+
+
+def test_reconnects_and_resubscribes_after_connection_loss():
+    async def scenario(server):
+        publisher = RedisTransport(port=server.port, node_id="a")
+        subscriber = RedisTransport(port=server.port, node_id="b", reconnect_delay=0.01)
+        await publisher.start()
+        await subscriber.start()
+        received = []
+
+        async def handler(payload):
+            received.append(payload)
+
+        await subscriber.subscribe("chat", handler)
+        await publisher.publish("chat", {"seq": 0})
+        await wait_for(lambda: len(received) == 1)
+
+        server.drop_connections()
+        await wait_for(lambda: subscriber.stats["reconnects"] == 1)
+        await wait_for(lambda: bool(server.subscribers.get(b"legion:chat")))
+
+        await publisher.publish("chat", {"seq": 1})  # Retried on a fresh connection
+        await wait_for(lambda: len(received) == 2)
+
+        await publisher.close()
+        await subscriber.close()
+        return received, publisher.stats["reconnects"]
+
+    received, publisher_reconnects = with_server(scenario)
+    assert received == [{"seq": 0}, {"seq": 1}]
+    assert publisher_reconnects == 2  # Its publisher and (idle) subscriber connections
+
+
+def test_subscriber_retries_until_server_returns():
+    async def scenario(server):
+        subscriber = RedisTransport(port=server.port, reconnect_delay=0.01, max_reconnect_delay=0.05)
+        await subscriber.start()
+
+        async def handler(payload):
+            pass
+
+        await subscriber.subscribe("chat", handler)
+        port = server.port
+        await server.stop()
+        await asyncio.sleep(0.1)  # Reconnect attempts fail meanwhile
+
+        await server.start(port)
+        await wait_for(lambda: bool(server.subscribers.get(b"legion:chat")))
+        await subscriber.close()
+        return subscriber.stats["reconnects"]
+
+    assert with_server(scenario) == 1
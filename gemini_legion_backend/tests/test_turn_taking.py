@@ -0,0 +1,102 @@
+"""Tests for the turn-taking engine's priority queue"""
+
+import asyncio
+
+from gemini_legion_backend.core.infrastructure.messaging.communication_system import TurnTakingEngine
+
+
+def make_engine(**kwargs) -> TurnTakingEngine:
+    engine = TurnTakingEngine(**kwargs)
+    engine.cooldown_seconds = 0.0
+    return engine
+
+
+async def grant_order(engine: TurnTakingEngine, futures: dict) -> list:
+    """Release the turn repeatedly and record who gets it"""
+    order = []
+    speaker = engine.current_speakers["#general"]
+    while len(order) < len(futures):
+        engine.release_turn(speaker, "#general")
+        await asyncio.sleep(0)
+        speaker = engine.current_speakers["#general"]
+        order.append(speaker)
+    return order
+
+
+def test_most_urgent_request_goes_first_then_fifo():
+    async def scenario():
+        engine = make_engine(aging_rate=0.0)
+        assert await engine.request_turn("commander", "#general")
+        futures = {
+            minion_id: engine.request_turn_future(minion_id, "#general", urgency)
+            for minion_id, urgency in [("a", 0.2), ("b", 0.9), ("c", 0.5), ("d", 0.9)]
+        }
+        return await grant_order(engine, futures)
+
+    assert asyncio.run(scenario()) == ["b", "d", "c", "a"]
+
+
+def test_waiting_requests_age_past_newer_urgent_ones():
+    async def scenario():
+        engine = make_engine(aging_rate=100.0)  # Two urgency points per 20ms
+        assert await engine.request_turn("commander", "#general")
+        futures = {"patient": engine.request_turn_future("patient", "#general", 0.1)}
+        await asyncio.sleep(0.02)
+        futures["urgent"] = engine.request_turn_future("urgent", "#general", 1.0)
+        return await grant_order(engine, futures)
+
+    assert asyncio.run(scenario()) == ["patient", "urgent"]
+
+
+def test_withdrawn_and_timed_out_requests_are_skipped():
+    async def scenario():
+        engine = make_engine()
+        assert await engine.request_turn("commander", "#general")
+        withdrawn = engine.request_turn_future("withdrawn", "#general", 1.0)
+        timed_out = await engine.request_turn("impatient", "#general", urgency=1.0, timeout=0.01)
+        waiting = engine.request_turn_future("waiting", "#general", 0.1)
+        withdrawn.cancel()
+
+        engine.release_turn("commander", "#general")
+        await asyncio.sleep(0)
+        return timed_out, waiting.done(), engine.current_speakers["#general"], engine.queue_depth("#general")
+
+    timed_out, granted, speaker, depth = asyncio.run(scenario())
+    assert timed_out is False
+    assert granted
+    assert speaker == "waiting"
+    assert depth == 0
+
+
+def test_request_during_cooldown_is_granted_when_it_ends():
+    async def scenario():
+        engine = TurnTakingEngine()
+        engine.cooldown_seconds = 0.05
+        assert await engine.request_turn("sparky", "#general")
+        engine.release_turn("sparky", "#general")
+
+        assert not await engine.request_turn("sparky", "#general")  # Fails fast while cooling down
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        assert await engine.request_turn("sparky", "#general", timeout=1.0)
+        return loop.time() - started
+
+    waited = asyncio.run(scenario())
+    assert 0.03 <= waited < 0.5
+
+
+def test_speaking_history_is_pruned():
+    engine = TurnTakingEngine()
+    engine.cooldown_seconds = 0.0  # Every entry is past its cooldown once recorded
+    for index in range(200):
+        assert engine._try_grant(f"minion_{index}", f"#channel_{index}")
+    assert len(engine.last_spoke) < 64
+
+    engine.cooldown_seconds = 60.0
+    for minion_id, channel_id in [("a", "#one"), ("b", "#one"), ("a", "#two")]:
+        engine._record_speaker(minion_id, channel_id)
+    engine.forget_channel("#one")
+    assert ("#two", "a") in engine.last_spoke
+    assert not any(channel_id == "#one" for channel_id, _ in engine.last_spoke)
+    engine.forget_minion("a")
+    assert not any(minion_id == "a" for _, minion_id in engine.last_spoke)
@@ -180,11 +180,31 @@ export const useLegionStore = create<LegionState>()(
           toast(`${data.minion_name} has left the Legion`)
         })
         
+        // Keyframe: the full emotional state snapshot
         ws.on('minion_emotional_state_updated', (data: any) => {
-          get().updateMinion(data.minion_id, { 
-            emotional_state: data.emotional_state 
+          get().updateMinion(data.minion_id, {
+            emotional_state: data.emotional_state
           })
         })
+
+        // Delta: [path, value] changes on top of state_version base_version.
+        // A delta that doesn't match is dropped; the next keyframe catches up.
+        ws.on('minion_emotional_state_delta', (data: any) => {
+          const current = get().minions[data.minion_id]?.emotional_state
+          if (!current || current.state_version !== data.base_version) return
+
+          const next = JSON.parse(JSON.stringify(current))
+          for (const [path, value] of data.changes as [string[], any][]) {
+            let target = next
+            for (const key of path.slice(0, -1)) {
+              if (typeof target[key] !== 'object' || target[key] === null) target[key] = {}
+              target = target[key]
+            }
+            target[path[path.length - 1]] = value
+          }
+          next.state_version = data.state_version
+          get().updateMinion(data.minion_id, { emotional_state: next })
+        })
         
         ws.on('minion_status_changed', (data: any) => {
           get().updateMinion(data.minion_id, { 